@@ -8,3 +8,4 @@ Version: 1.0
 
 from apps.account.models.account import Account
 from apps.account.models.user import User
+from apps.account.models.followers import Followers
@@ -14,6 +14,9 @@ from django.db.models import (
     DateTimeField,
     EmailField,
     BooleanField,
+    PositiveIntegerField,
+    Index,
+    Q,
 )
 
 from apps.common.globals.database import DEFAULT_CHAR_LEN, MAX_CHAR_LEN
@@ -102,14 +105,43 @@ class Account(BaseTable):
             "Unselect this instead of deleting accounts."
         ),
     )
+    followers_count = PositiveIntegerField(
+        default=0, editable=False, help_text="Number of accounts following."
+    )
+    following_count = PositiveIntegerField(
+        default=0, editable=False, help_text="Number of accounts followed."
+    )
+    feed_pull = BooleanField(
+        default=False,
+        editable=False,
+        help_text=(
+            "Designates whether posts of this account are merged into follower feeds "
+            "when read, instead of written to every follower timeline."
+        ),
+    )
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        indexes = [
+            Index(fields=["created_date", "id"], name="account_created_id_idx"),
+            Index(
+                fields=["id"],
+                condition=Q(feed_pull=True),
+                name="account_feed_pull_idx",
+            ),
+        ]
 
-    def save(self, *args, **kwargs) -> None:
-        self.clean_fields()
+    def prepare_save(self, update_fields=None, now=None) -> set:
+        derived = super().prepare_save(update_fields=update_fields, now=now)
 
         if not self.bio:
             self.bio = f"Am a blog for {self.account_name}"
+            derived.add("bio")
 
-        super().save(*args, **kwargs)
+        return derived
 
     def __str__(self):
         return f"{self.account_name}"
@@ -1,38 +1,74 @@
 """
-Account database Model.
-This module will contain functions and fields for Account Model.
+Followers database Model.
+This module will contain functions and fields for Followers Model.
 Authors: Kenneth Carmichael (kencar17)
 Date: January 29th 2023
 Version: 1.0
 """
 import uuid
 
-from django.db.models import UUIDField, ForeignKey, PROTECT
+from django.db.models import (
+    UUIDField,
+    DateTimeField,
+    ForeignKey,
+    PROTECT,
+    Index,
+    UniqueConstraint,
+)
 
 from apps.account.models import Account
+from apps.account.models.managers.followers import FollowersManager
 from apps.common.models.base_model import BaseTable
 
 
-# TODO: Account Followers
-# TODO: Account Following
 # TODO: Encrypting and Decrypting database fields
 
 
 class Followers(BaseTable):
     """
-    Account Model
+    Followers Model
     """
 
     id = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_date = DateTimeField(
+        auto_now_add=True, help_text="Date account was followed."
+    )
 
     follower = ForeignKey(
-        Account, on_delete=PROTECT, help_text="The user who is following an account."
+        Account,
+        on_delete=PROTECT,
+        related_name="following",
+        help_text="The user who is following an account.",
     )
     followed = ForeignKey(
         Account,
         on_delete=PROTECT,
+        related_name="followers",
         help_text="The user who is being followed by an account",
     )
 
+    objects = FollowersManager()
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        constraints = [
+            UniqueConstraint(
+                fields=["follower", "followed"], name="followers_unique_follow"
+            ),
+        ]
+        indexes = [
+            Index(
+                fields=["followed", "-created_date", "-id"],
+                name="followers_followed_idx",
+            ),
+            Index(
+                fields=["follower", "-created_date", "-id"],
+                name="followers_follower_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.follower} is following {self.followed}"
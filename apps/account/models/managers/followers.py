@@ -0,0 +1,72 @@
+"""
+Followers Manager.
+This module will contain custom functionality related to followers manager. IE Following
+and unfollowing accounts while keeping their follower and following counts.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, Value, When
+
+from apps.common.pagination.counts import invalidate_counts
+from apps.common.utilities.response_cache import invalidate_detail
+
+
+class FollowersManager(models.Manager):
+    """
+    Custom Followers Manager
+    """
+
+    def update_counts(self, follower, followed, delta: int) -> None:
+        """
+        Move the following count of the follower and the followers count of the
+        followed account, both in one statement. The update skips saves, so the cached
+        responses and counts of accounts are invalidated here.
+        :param follower: Follower account primary key
+        :param followed: Followed account primary key
+        :param delta: 1 for a follow, -1 for an unfollow
+        :return: None
+        """
+        account = self.model._meta.get_field("followed").related_model
+
+        account.objects.filter(pk__in=[follower, followed]).update(
+            followers_count=F("followers_count")
+            + Case(When(pk=followed, then=Value(delta)), default=Value(0)),
+            following_count=F("following_count")
+            + Case(When(pk=follower, then=Value(delta)), default=Value(0)),
+        )
+        invalidate_detail(account, [follower, followed])
+        invalidate_counts(model=account)
+
+    def follow(self, follower, followed) -> bool:
+        """
+        Follow an account. The unique follow index decides between concurrent
+        requests, counts only move for the request whose row was inserted.
+        :param follower: Follower account primary key
+        :param followed: Followed account primary key
+        :return: False if the account was already followed
+        """
+        try:
+            with transaction.atomic():
+                self.update_counts(follower, followed, 1)
+                self.create(follower_id=follower, followed_id=followed)
+        except IntegrityError:
+            return False
+
+        return True
+
+    def unfollow(self, follower, followed) -> bool:
+        """
+        Unfollow an account, counts only move when a row was deleted.
+        :param follower: Follower account primary key
+        :param followed: Followed account primary key
+        :return: False if the account was not followed
+        """
+        with transaction.atomic():
+            deleted, _ = self.filter(follower=follower, followed=followed).delete()
+
+            if deleted:
+                self.update_counts(follower, followed, -1)
+
+        return bool(deleted)
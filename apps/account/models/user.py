@@ -16,6 +16,7 @@ from django.db.models import (
     ForeignKey,
     PROTECT,
     CharField,
+    Index,
 )
 
 from apps.account.models.managers.user import UserManager
@@ -66,5 +67,17 @@ class User(AbstractUser, BaseTable):
 
     objects = UserManager()
 
+    class Meta:
+        """
+        Meta Class
+        """
+
+        indexes = [
+            Index(
+                fields=["-last_login", "first_name", "last_name"],
+                name="user_last_login_name_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
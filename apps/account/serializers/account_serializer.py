@@ -37,6 +37,8 @@ class AccountSerializer(serializers.ModelSerializer):
             "youtube_link",
             "twitch_link",
             "is_active",
+            "followers_count",
+            "following_count",
         ]
 
 
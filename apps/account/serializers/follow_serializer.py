@@ -0,0 +1,45 @@
+"""
+Follow Serializers.
+This module will contain follow serializers to get the followers and followed accounts
+of an account.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from rest_framework import serializers
+
+from apps.account.models import Followers
+
+
+class FollowerSerializer(serializers.ModelSerializer):
+    """
+    Follower Serializer, the account following.
+    """
+
+    account = serializers.UUIDField(source="follower_id", read_only=True)
+    account_name = serializers.CharField(source="follower.account_name", read_only=True)
+
+    class Meta:
+        """
+        Meta for Serializer
+        """
+
+        model = Followers
+        fields = ["account", "account_name", "created_date"]
+
+
+class FollowingSerializer(serializers.ModelSerializer):
+    """
+    Following Serializer, the account followed.
+    """
+
+    account = serializers.UUIDField(source="followed_id", read_only=True)
+    account_name = serializers.CharField(source="followed.account_name", read_only=True)
+
+    class Meta:
+        """
+        Meta for Serializer
+        """
+
+        model = Followers
+        fields = ["account", "account_name", "created_date"]
@@ -11,6 +11,8 @@ from rest_framework import serializers
 from rest_framework.fields import CharField
 
 from apps.account.models import User
+from apps.authentication.revocation import revocation_list
+from apps.common.serializers.projection import ProjectionSerializer
 from apps.common.globals.database import MIN_PASSWORD_LENGTH
 
 
@@ -58,6 +60,14 @@ class UserSerializer(serializers.ModelSerializer):
         return instance
 
 
+class UserProjection(ProjectionSerializer):
+    """
+    User Projection, renders list rows as UserSerializer
+    """
+
+    serializer_class = UserSerializer
+
+
 class CreateUserSerializer(serializers.ModelSerializer):
     """
     Create User Serializer
@@ -80,21 +90,31 @@ class CreateUserSerializer(serializers.ModelSerializer):
             "is_editor",
         ]
 
-    def create(self, validated_data) -> User:
+    def get_instance_data(self, validated_data) -> dict:
         """
-        Create new user
+        Get the fields of a new user, with a random password and the username as email
         :param validated_data: user information
-        :return: user instance
+        :return: user fields
         """
         allowed_chars = (
             "abcdefghijkmnpqrstuvwxyzABCDEFGHIJKLMNPQRSTUVWXYZ0123456789!@#$%^&*;:"
         )
 
-        validated_data["password"] = User.objects.make_random_password(
-            length=MIN_PASSWORD_LENGTH, allowed_chars=allowed_chars
-        )
-        validated_data["email"] = validated_data["username"]
-        user = User.objects.create(**validated_data)
+        return {
+            **validated_data,
+            "password": User.objects.make_random_password(
+                length=MIN_PASSWORD_LENGTH, allowed_chars=allowed_chars
+            ),
+            "email": validated_data["username"],
+        }
+
+    def create(self, validated_data) -> User:
+        """
+        Create new user
+        :param validated_data: user information
+        :return: user instance
+        """
+        user = User.objects.create(**self.get_instance_data(validated_data))
         user.save()
 
         return user
@@ -141,5 +161,6 @@ class UserChangePasswordSerializer(serializers.Serializer):
 
         instance.set_password(raw_password=validated_data["password_one"])
         instance.save()
+        revocation_list.revoke_user(instance)
 
         return instance
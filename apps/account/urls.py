@@ -8,7 +8,7 @@ Version: 1.0
 
 from django.urls import path
 
-from apps.account.views import user_api, account_api
+from apps.account.views import user_api, account_api, follow_api
 
 urlpatterns = [
     # User Endpoints
@@ -26,4 +26,19 @@ urlpatterns = [
         account_api.AccountDetailApi.as_view(),
         name="AccountDetailApiV1",
     ),
+    path(
+        "accounts/<uuid:pk>/follow",
+        follow_api.AccountFollowApi.as_view(),
+        name="AccountFollowApiV1",
+    ),
+    path(
+        "accounts/<uuid:pk>/followers",
+        follow_api.AccountFollowerListApi.as_view(),
+        name="AccountFollowerListApiV1",
+    ),
+    path(
+        "accounts/<uuid:pk>/following",
+        follow_api.AccountFollowingListApi.as_view(),
+        name="AccountFollowingListApiV1",
+    ),
 ]
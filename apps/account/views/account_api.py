@@ -9,13 +9,13 @@ Version: 1.0
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import Http404
 from rest_framework import filters
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.account.models import Account
 from apps.account.serializers.account_serializer import (
     AccountSerializer,
     CreateAccountSerializer,
 )
+from apps.authentication.backends import CachedJWTAuthentication
 from apps.common.mixins.list_create_mixin import BlogListCreateMixin
 from apps.common.mixins.retrieve_update_destroy_mixin import (
     BlogRetrieveUpdateDestroyMixin,
@@ -28,7 +28,7 @@ class AccountListLApi(BlogListCreateMixin):
     Get a List of users bases on query params, or create a new account.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [filters.SearchFilter]
     search_fields = ["account_name", "bio", "contact_email"]
     queryset = Account.objects.all().order_by("-created_date", "account_name")
@@ -42,7 +42,8 @@ class AccountDetailApi(BlogRetrieveUpdateDestroyMixin):
     Get, update, or delete individual account information.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
+    detail_cache = True
     serializer_class = AccountSerializer
 
     def get_object(self):
@@ -50,7 +51,9 @@ class AccountDetailApi(BlogRetrieveUpdateDestroyMixin):
         Returns the object the view is displaying.
         """
         try:
-            account = Account.objects.get(pk=self.kwargs["pk"])
+            account = self.plan_queryset(Account.objects.all()).get(
+                pk=self.kwargs["pk"]
+            )
         except ObjectDoesNotExist as exc:
             raise Http404 from exc
 
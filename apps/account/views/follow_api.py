@@ -0,0 +1,119 @@
+"""
+Module for Follow Api Endpoints.
+This module determines the api endpoints for following accounts, and for the followers
+and followed accounts of an account. Supported methods are Get, Post, and Delete.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404
+from rest_framework.generics import GenericAPIView
+
+from apps.account.models import Account, Followers
+from apps.account.serializers.follow_serializer import (
+    FollowerSerializer,
+    FollowingSerializer,
+)
+from apps.authentication.backends import CachedJWTAuthentication
+from apps.common.mixins.list_create_mixin import BlogListCreateMixin
+from apps.common.utilities.utilities import json_response
+
+
+class AccountFollowApi(GenericAPIView):
+    """
+    Follow or unfollow an account, as the account of the request user.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get_object(self):
+        """
+        Returns the object the view is displaying.
+        """
+        try:
+            account = Account.objects.only("id").get(pk=self.kwargs["pk"])
+        except ObjectDoesNotExist as exc:
+            raise Http404 from exc
+
+        # May raise a permission denied
+        self.check_object_permissions(self.request, account)
+
+        return account
+
+    def post(self, request, *args, **kwargs):
+        """
+        Follow an account.
+        :param request: request
+        :return: Json of the followed account.
+        """
+        account = self.get_object()
+        follower = request.user.account_id
+
+        if account.pk == follower:
+            message = {
+                "message": "Follow Failed",
+                "errors": ["Accounts cannot follow themselves."],
+            }
+            return json_response(message=message, error=True)
+
+        created = Followers.objects.follow(follower=follower, followed=account.pk)
+
+        return json_response(
+            data={"account": account.pk, "following": True, "changed": created}
+        )
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Unfollow an account.
+        :param request: request
+        :return: Json of the unfollowed account.
+        """
+        account = self.get_object()
+
+        deleted = Followers.objects.unfollow(
+            follower=request.user.account_id, followed=account.pk
+        )
+
+        return json_response(
+            data={"account": account.pk, "following": False, "changed": deleted}
+        )
+
+
+class AccountFollowerListApi(BlogListCreateMixin):
+    """
+    Get the accounts following an account, newest follow first. Pages are found by
+    cursor only.
+    """
+
+    http_method_names = ["get", "options"]
+    authentication_classes = [CachedJWTAuthentication]
+    serializer_class = FollowerSerializer
+    cursor_ordering = "-created_date"
+    account_field = "followed"
+
+    def get_queryset(self):
+        """
+        This view should return the follows of the account.
+        """
+        return Followers.objects.filter(**{self.account_field: self.kwargs["pk"]})
+
+    def get(self, request, *args, **kwargs):
+        """
+        Get a page of follows.
+        :param request: request
+        :return: Json list of accounts.
+        """
+        queryset = self.plan_queryset(self.get_queryset())
+
+        return self.get_cursor_page(request=request, queryset=queryset)
+
+
+class AccountFollowingListApi(AccountFollowerListApi):
+    """
+    Get the accounts an account follows, newest follow first. Pages are found by cursor
+    only.
+    """
+
+    serializer_class = FollowingSerializer
+    account_field = "follower"
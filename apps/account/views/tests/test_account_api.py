@@ -7,6 +7,7 @@ Version: 1.0
 """
 import json
 
+from django.core.cache import cache
 from django.test import TestCase
 
 from rest_framework.test import APIClient
@@ -20,6 +21,7 @@ class TestAccountEndpoint(TestCase):
     fixtures = ["tests/account.json", "tests/user.json"]
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = User.objects.first()
         self.account = Account.objects.first()
@@ -35,7 +37,7 @@ class TestAccountEndpoint(TestCase):
         """
 
         response = self.client.get("/api/accounts")
-        expected = b'{"is_error": false, "error": {}, "content": {"count": 1, "pages": 1, "current": 1, "previous": null, "next": null, "results": [{"id": "5b076883-8f47-4372-9089-7f2a9e68f69f", "created_date": "2023-02-04T07:52:25.141000Z", "account_name": "New Star Blog", "bio": "Personal Blog", "contact_email": "kc@kencar.ca", "website_link": "", "facebook_link": "", "instagram_link": "", "twitter_link": "", "tiktok_link": "", "linkedin_link": "", "snapchat_link": "", "youtube_link": "", "twitch_link": "", "is_active": true}]}}'
+        expected = b'{"is_error": false, "error": {}, "content": {"count": 1, "pages": 1, "current": 1, "previous": null, "next": null, "results": [{"id": "5b076883-8f47-4372-9089-7f2a9e68f69f", "created_date": "2023-02-04T07:52:25.141000Z", "account_name": "New Star Blog", "bio": "Personal Blog", "contact_email": "kc@kencar.ca", "website_link": "", "facebook_link": "", "instagram_link": "", "twitter_link": "", "tiktok_link": "", "linkedin_link": "", "snapchat_link": "", "youtube_link": "", "twitch_link": "", "is_active": true, "followers_count": 0, "following_count": 0}]}}'
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, expected)
@@ -70,6 +72,8 @@ class TestAccountEndpoint(TestCase):
                 "youtube_link": None,
                 "twitch_link": None,
                 "is_active": True,
+                "followers_count": 0,
+                "following_count": 0,
             },
         }
 
@@ -130,6 +134,8 @@ class TestAccountEndpoint(TestCase):
                 "youtube_link": "",
                 "twitch_link": "",
                 "is_active": True,
+                "followers_count": 0,
+                "following_count": 0,
             },
         }
 
@@ -187,6 +193,8 @@ class TestAccountEndpoint(TestCase):
                 "youtube_link": "",
                 "twitch_link": "",
                 "is_active": True,
+                "followers_count": 0,
+                "following_count": 0,
             },
         }
 
@@ -0,0 +1,143 @@
+"""
+Module for Follow Endpoints.
+This module will test following accounts, follower counts, and follow lists.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import Account, Followers, User
+
+
+class TestFollowEndpoint(TestCase):
+    fixtures = ["tests/account.json", "tests/user.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.first()
+        self.account = Account.objects.get(pk=self.user.account_id)
+        self.followed = Account.objects.create(
+            account_name="Followed", contact_email="followed@kencar.ca"
+        )
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}"
+        )
+
+    def get_counts(self, account) -> tuple:
+        """
+        Get the follower and following counts of an account.
+        :param account: Account
+        :return: Tuple of followers and following counts
+        """
+        account.refresh_from_db()
+
+        return account.followers_count, account.following_count
+
+    def test_follow_idempotent(self):
+        """
+        Test following twice or unfollowing twice moves counts once.
+        """
+        url = f"/api/accounts/{self.followed.pk}/follow"
+
+        first = json.loads(self.client.post(url).content)["content"]
+        second = json.loads(self.client.post(url).content)["content"]
+
+        self.assertTrue(first["changed"])
+        self.assertFalse(second["changed"])
+        self.assertEqual(Followers.objects.count(), 1)
+        self.assertEqual(self.get_counts(self.followed), (1, 0))
+        self.assertEqual(self.get_counts(self.account), (0, 1))
+
+        first = json.loads(self.client.delete(url).content)["content"]
+        second = json.loads(self.client.delete(url).content)["content"]
+
+        self.assertTrue(first["changed"])
+        self.assertFalse(second["changed"])
+        self.assertFalse(Followers.objects.exists())
+        self.assertEqual(self.get_counts(self.followed), (0, 0))
+        self.assertEqual(self.get_counts(self.account), (0, 0))
+
+    def test_follow_self(self):
+        """
+        Test an account can not follow itself.
+        """
+        response = self.client.post(f"/api/accounts/{self.account.pk}/follow")
+
+        self.assertDictEqual(
+            json.loads(response.content),
+            {
+                "is_error": True,
+                "error": {
+                    "message": "Follow Failed",
+                    "errors": ["Accounts cannot follow themselves."],
+                },
+                "content": {},
+            },
+        )
+        self.assertFalse(Followers.objects.exists())
+
+    def test_follow_conflict_keeps_counts(self):
+        """
+        Test a follow losing to a concurrent one on the unique index moves no counts.
+        """
+        Followers.objects.create(follower=self.account, followed=self.followed)
+
+        self.assertFalse(Followers.objects.follow(self.account.pk, self.followed.pk))
+        self.assertEqual(self.get_counts(self.followed), (0, 0))
+
+    def test_follow_lists(self):
+        """
+        Test the follower and following lists page by cursor, newest follow first.
+        """
+        others = [
+            Account.objects.create(
+                account_name=f"Other {i}", contact_email=f"other{i}@kencar.ca"
+            )
+            for i in range(3)
+        ]
+
+        for other in others:
+            Followers.objects.follow(other.pk, self.followed.pk)
+
+        names = []
+        url = f"/api/accounts/{self.followed.pk}/followers?page_size=2"
+
+        while url:
+            content = json.loads(self.client.get(url).content)["content"]
+            names.extend(result["account_name"] for result in content["results"])
+            url = content["next"]
+
+        self.assertEqual(sorted(names), ["Other 0", "Other 1", "Other 2"])
+
+        response = self.client.get(f"/api/accounts/{others[0].pk}/following")
+        results = json.loads(response.content)["content"]["results"]
+
+        self.assertEqual(
+            [result["account"] for result in results], [str(self.followed.pk)]
+        )
+        self.assertEqual(self.get_counts(self.followed), (3, 0))
+
+    def test_follow_refreshes_cached_detail(self):
+        """
+        Test a follow is shown by account detail responses cached before it.
+        """
+        url = f"/api/accounts/{self.followed.pk}"
+
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertEqual(response["X-Detail-Cache"], "HIT")
+        self.assertEqual(json.loads(response.content)["content"]["followers_count"], 0)
+
+        Followers.objects.follow(self.account.pk, self.followed.pk)
+        response = self.client.get(url)
+
+        self.assertEqual(response["X-Detail-Cache"], "MISS")
+        self.assertEqual(json.loads(response.content)["content"]["followers_count"], 1)
@@ -150,6 +150,55 @@ class TestUserEndpoint(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, expected)
 
+    def test_get_user_list_cursor(self):
+        """
+        Test get user list endpoint with cursor pagination, walking forwards and back.
+        :return:
+        """
+
+        response = self.client.get("/api/users", data={"cursor": "", "page_size": 3})
+        ret = json.loads(response.content)
+        content = ret["content"]
+        first_page = [row["id"] for row in content["results"]]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(ret["is_error"])
+        self.assertIsNone(content["count"])
+        self.assertIsNone(content["previous"])
+        self.assertEqual(first_page[0], "60d83116-78f3-43c0-8a7c-948b9b3dcbdf")
+        self.assertEqual(len(first_page), 3)
+
+        seen = list(first_page)
+        next_link = content["next"]
+
+        while next_link:
+            content = json.loads(self.client.get(next_link).content)["content"]
+            seen.extend(row["id"] for row in content["results"])
+            previous_link = content["previous"]
+            next_link = content["next"]
+
+        self.assertEqual(len(seen), 7)
+        self.assertEqual(len(set(seen)), 7)
+
+        content = json.loads(self.client.get(previous_link).content)["content"]
+        self.assertEqual([row["id"] for row in content["results"]], seen[3:6])
+
+        content = json.loads(self.client.get(content["previous"]).content)["content"]
+        self.assertEqual([row["id"] for row in content["results"]], first_page)
+        self.assertIsNone(content["previous"])
+
+    def test_get_user_list_cursor_invalid(self):
+        """
+        Test get user list endpoint with an invalid cursor.
+        :return:
+        """
+
+        response = self.client.get("/api/users", data={"cursor": "not-a-cursor"})
+        expected = b'{"is_error": true, "error": {"message": "Get Failed", "errors": ["Invalid cursor."]}, "content": {}}'
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, expected)
+
     def test_create_new_user(self):
         """
         Test post user endpoint to create a new user.
@@ -13,14 +13,16 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.generics import (
     UpdateAPIView,
 )
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.account.models import User
 from apps.account.serializers.user_serializer import (
     UserSerializer,
+    UserProjection,
     CreateUserSerializer,
     UserChangePasswordSerializer,
 )
+from apps.authentication.backends import CachedJWTAuthentication
+from apps.authentication.revocation import revocation_list
 from apps.common.mixins.list_create_mixin import BlogListCreateMixin
 from apps.common.mixins.retrieve_update_destroy_mixin import (
     BlogRetrieveUpdateDestroyMixin,
@@ -36,11 +38,12 @@ class UserListLApi(BlogListCreateMixin):
     Get a List of users bases on query params, or create a new user with auto gen password.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [filters.SearchFilter]
     search_fields = ["username", "display_name", "fist_name", "last_name", "bio"]
 
     serializer_class = UserSerializer
+    projection_class = UserProjection
     create_serializer_class = CreateUserSerializer
 
     def get_queryset(self):
@@ -73,13 +76,30 @@ class UserListLApi(BlogListCreateMixin):
 
         return users
 
+    def perform_bulk_delete(self, model, objs: list) -> None:
+        """
+        Deactivate a batch of users, revoking all of their tokens
+        :param model: User model
+        :param objs: Users
+        :return: None
+        """
+        for user in objs:
+            user.is_active = False
+            user.is_staff = False
+            user.is_superuser = False
+
+        User.bulk_update_validated(objs, ["is_active", "is_staff", "is_superuser"])
+
+        for user in objs:
+            revocation_list.revoke_user(user)
+
 
 class UserDetailApi(BlogRetrieveUpdateDestroyMixin):
     """
     Get, update, or delete individual user information.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     serializer_class = UserSerializer
 
     def get_object(self):
@@ -87,7 +107,7 @@ class UserDetailApi(BlogRetrieveUpdateDestroyMixin):
         Returns the object the view is displaying.
         """
         try:
-            user = User.objects.get(pk=self.kwargs["pk"])
+            user = self.plan_queryset(User.objects.all()).get(pk=self.kwargs["pk"])
         except ObjectDoesNotExist as exc:
             raise Http404 from exc
 
@@ -98,7 +118,7 @@ class UserDetailApi(BlogRetrieveUpdateDestroyMixin):
 
     def delete(self, request, *args, **kwargs):
         """
-        Deactivated User
+        Deactivated User, revoking all of its tokens
         :param request: request
         :return: Message indicating Success
         """
@@ -108,6 +128,7 @@ class UserDetailApi(BlogRetrieveUpdateDestroyMixin):
         user.is_staff = False
         user.is_superuser = False
         user.save()
+        revocation_list.revoke_user(user)
 
         return json_response(data={"message": "User has been deactivated."})
 
@@ -117,7 +138,7 @@ class UserPasswordChangeApi(UpdateAPIView):
     Update user password.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
 
     def get_object(self):
         """
@@ -7,6 +7,10 @@ Version: 1.0
 """
 
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+
+from apps.authentication.backends import invalidate_user_auth
 
 
 class AuthenticationConfig(AppConfig):
@@ -16,3 +20,11 @@ class AuthenticationConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.authentication"
+
+    def ready(self):
+        """
+        Invalidate cached authentications when a user is saved or deleted.
+        :return:
+        """
+        post_save.connect(invalidate_user_auth, sender=settings.AUTH_USER_MODEL)
+        post_delete.connect(invalidate_user_auth, sender=settings.AUTH_USER_MODEL)
@@ -0,0 +1,162 @@
+"""
+Module for Authentication Backends.
+This module will contain the JWT authentication used by the api endpoints. Verified tokens
+and their users are kept in a bounded in process LRU keyed by token hash, so repeat
+requests with a token skip signature verification and the user query.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import copy
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.common.utilities.lru import ExpiringLRUCache
+from apps.common.utilities.utilities import is_cache_shared
+
+AUTH_VERSION_KEY = "blog:auth-version:{pk}"
+
+# Columns of the authenticated user read by permission checks, others load on access.
+AUTH_USER_FIELDS = (
+    "id",
+    "account",
+    "username",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "is_contributor",
+    "is_editor",
+    "is_blog_owner",
+)
+
+auth_cache = ExpiringLRUCache(maxsize=getattr(settings, "AUTH_CACHE_SIZE", 10000))
+
+
+def get_auth_version(pk) -> str:
+    """
+    Get the shared auth version of a user, moved whenever the user changes so entries
+    cached by other processes are not used.
+    :param pk: User primary key
+    :return: Version string
+    """
+    key = AUTH_VERSION_KEY.format(pk=pk)
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def invalidate_user_auth(sender, instance, **kwargs) -> None:
+    """
+    Invalidate the cached authentications of a saved or deleted user, ie deactivated or
+    with a changed password.
+    :param sender: User model
+    :param instance: User
+    :param kwargs:
+    :return: None
+    """
+    auth_cache.delete_tag(instance.pk)
+    cache.set(AUTH_VERSION_KEY.format(pk=instance.pk), uuid.uuid4().hex, timeout=None)
+
+
+def is_issued_before(token, revoked_before) -> bool:
+    """
+    Whether a token was issued before a revocation of its user's tokens. Issue times
+    are whole seconds, so tokens issued in the second of the revocation are revoked too.
+    :param token: Validated token
+    :param revoked_before: Revocation date
+    :return: Boolean
+    """
+    return token.get("iat", 0) <= revoked_before.timestamp()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT Authentication, verified tokens are cached until the token expires or the
+    cache TTL passes, whichever is first. Without a shared cache users changed by other
+    processes could not be seen, so every token is verified.
+    """
+
+    def authenticate(self, request):
+        if not is_cache_shared():
+            return super().authenticate(request)
+
+        header = self.get_header(request)
+
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+
+        if raw_token is None:
+            return None
+
+        now = time.time()
+        key = hashlib.sha256(raw_token).hexdigest()
+        entry = auth_cache.get(key, now=now)
+
+        if entry is not None:
+            user, validated_token, version = entry
+
+            if get_auth_version(user.pk) == version:
+                return copy.copy(user), validated_token
+
+            auth_cache.delete(key)
+
+        validated_token = self.get_validated_token(raw_token)
+        version = get_auth_version(validated_token.get(api_settings.USER_ID_CLAIM))
+        user = self.get_user(validated_token)
+        expires = min(
+            validated_token["exp"], now + getattr(settings, "AUTH_CACHE_TTL", 300)
+        )
+        auth_cache.set(key, (user, validated_token, version), expires, tag=user.pk)
+
+        return copy.copy(user), validated_token
+
+    def get_user(self, validated_token):
+        """
+        Find the user of a validated token, loading only the columns permission checks
+        read, with any revocation of the user's tokens in the same query.
+        :param validated_token: Validated token
+        :return: User
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from exc
+
+        users = (
+            self.user_model.objects.select_related(None)
+            .select_related("token_revocation")
+            .only(*AUTH_USER_FIELDS, "token_revocation__revoked_before")
+        )
+
+        try:
+            user = users.get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as exc:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            ) from exc
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        revocation = getattr(user, "token_revocation", None)
+
+        if revocation and is_issued_before(validated_token, revocation.revoked_before):
+            raise AuthenticationFailed(_("Token is revoked"), code="token_revoked")
+
+        return user
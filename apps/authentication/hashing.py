@@ -0,0 +1,125 @@
+"""
+Module for offloaded password hashing.
+This module will run password verification in a bounded thread pool so logins never
+block request workers. Argon2 releases the GIL while hashing, so the pool hashes in
+parallel. Work beyond the pool and its queue is rejected at once instead of waiting.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
+
+
+class HashPoolFull(Exception):
+    """
+    Raised when the hash pool and its queue are full.
+    """
+
+
+def verify_password(password: str, encoded: str) -> tuple:
+    """
+    Verify a password against its stored hash, and whether the hash should be updated
+    as Django's check_password would.
+    :param password: Raw password
+    :param encoded: Stored hash
+    :return: Tuple of valid and must update booleans
+    """
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False, False
+
+    if not hasher.verify(password, encoded):
+        return False, False
+
+    preferred = get_hasher("default")
+    must_update = hasher.algorithm != preferred.algorithm or preferred.must_update(
+        encoded
+    )
+
+    return True, must_update
+
+
+class HashPool:
+    """
+    Bounded Hash Pool, at most workers hashes run and queue more wait at once.
+    """
+
+    def __init__(self, workers: int, queue: int):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="blog-hash"
+        )
+        self.capacity = workers + queue
+        self.pending = 0
+        self.lock = threading.Lock()
+
+    @property
+    def full(self) -> bool:
+        """
+        Whether new work would be rejected, to reject before doing any other work.
+        :return: Boolean
+        """
+        return self.pending >= self.capacity
+
+    def release(self, _=None) -> None:
+        """
+        Release the slot of finished work.
+        :return: None
+        """
+        with self.lock:
+            self.pending -= 1
+
+    async def run(self, func, *args):
+        """
+        Run a hash function in the pool.
+        :param func: Function
+        :param args: Function arguments
+        :return: Function result
+        """
+        with self.lock:
+            if self.pending >= self.capacity:
+                raise HashPoolFull()
+
+            self.pending += 1
+
+        try:
+            future = self.executor.submit(func, *args)
+        except BaseException:
+            self.release()
+            raise
+
+        future.add_done_callback(self.release)
+
+        return await asyncio.wrap_future(future)
+
+    async def verify(self, password: str, encoded: str) -> tuple:
+        """
+        Verify a password in the pool.
+        :param password: Raw password
+        :param encoded: Stored hash, None hashes a dummy to hide unknown users
+        :return: Tuple of valid and must update booleans
+        """
+        if encoded is None:
+            await self.run(make_password, password)
+            return False, False
+
+        return await self.run(verify_password, password, encoded)
+
+    async def make(self, password: str) -> str:
+        """
+        Hash a password in the pool with the preferred hasher.
+        :param password: Raw password
+        :return: Hash
+        """
+        return await self.run(make_password, password)
+
+
+hash_pool = HashPool(
+    workers=getattr(settings, "LOGIN_HASH_WORKERS", 4),
+    queue=getattr(settings, "LOGIN_HASH_QUEUE", 16),
+)
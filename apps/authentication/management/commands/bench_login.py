@@ -0,0 +1,181 @@
+"""
+Module for benchmarking logins.
+This module will be a management command that will measure the latency of regular api
+calls alone and during a storm of concurrent logins, through the ASGI handler, with the
+login throughput and the logins rejected by the hash pool.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import asyncio
+import statistics
+import time
+import uuid
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.management import BaseCommand
+from django.test import AsyncClient
+
+from apps.account.models import Account, User
+from apps.authentication.serializers.token_serializers import get_token_data
+
+
+def get_percentiles(latencies: list) -> tuple:
+    """
+    Get the p50 and p99 of latencies.
+    :param latencies: Latencies in seconds
+    :return: Tuple of p50 and p99 in milliseconds
+    """
+    if len(latencies) < 2:
+        latency = latencies[0] * 1000 if latencies else 0.0
+        return latency, latency
+
+    quantiles = statistics.quantiles(latencies, n=100)
+
+    return quantiles[49] * 1000, quantiles[98] * 1000
+
+
+async def run_requests(client, url: str, token: str, count: int) -> list:
+    """
+    Run regular api calls one after another.
+    :param client: Async client
+    :param url: Api url
+    :param token: Access token
+    :param count: Number of calls
+    :return: Latencies in seconds
+    """
+    latencies = []
+
+    for _ in range(count):
+        start = time.perf_counter()
+
+        # Each request gets its own sync thread, as under the ASGI handler.
+        async with ThreadSensitiveContext():
+            await client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+async def run_logins(client, username: str, password: str, count: int, concurrency):
+    """
+    Run logins, concurrency at a time.
+    :param client: Async client
+    :param username: Username
+    :param password: Password
+    :param count: Number of logins
+    :param concurrency: Concurrent logins
+    :return: Dict of response status code counts
+    """
+    statuses = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login():
+        async with semaphore, ThreadSensitiveContext():
+            response = await client.post(
+                "/api/auth/token",
+                data={"username": username, "password": password},
+                content_type="application/json",
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(login() for _ in range(count)))
+
+    return statuses
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to benchmark logins
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--logins",
+            type=int,
+            default=100,
+            help="Number of logins in the storm.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Number of concurrent logins.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Number of regular api calls per phase.",
+        )
+        parser.add_argument(
+            "--url",
+            default="/api/tags",
+            help="Regular api call.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Benchmark logins, as a temporary user that is deleted afterwards.
+        :param args:
+        :param options:
+        :return:
+        """
+        name = f"bench-{uuid.uuid4().hex}"
+        account = Account.objects.create(
+            account_name=name, contact_email=f"{name}@example.com"
+        )
+        user = User.objects.create_user(
+            account=account, username=f"{name}@example.com", password=name
+        )
+
+        try:
+            asyncio.run(self.run(user, name, options))
+        finally:
+            user.delete()
+            account.delete()
+
+    async def run(self, user: User, password: str, options: dict) -> None:
+        """
+        Run the baseline and storm phases.
+        :param user: Benchmark user
+        :param password: Password of the user
+        :param options: Command options
+        :return: None
+        """
+        client = AsyncClient()
+        token = (await sync_to_async(get_token_data)(user))["access"]
+        url, count = options["url"], options["requests"]
+
+        baseline = await run_requests(client, url, token, count)
+
+        start = time.perf_counter()
+        storm, statuses = await asyncio.gather(
+            run_requests(client, url, token, count),
+            run_logins(
+                client,
+                user.username,
+                password,
+                options["logins"],
+                options["concurrency"],
+            ),
+        )
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(f"{'phase':<9} {'calls':>6} {'p50 ms':>8} {'p99 ms':>8}")
+
+        for phase, latencies in (("baseline", baseline), ("storm", storm)):
+            p50, p99 = get_percentiles(latencies)
+            self.stdout.write(f"{phase:<9} {len(latencies):>6} {p50:>8.2f} {p99:>8.2f}")
+
+        succeeded = statuses.get(200, 0)
+        self.stdout.write(
+            f"logins: {succeeded} ok, {statuses.get(503, 0)} rejected, "
+            f"{succeeded / elapsed:.1f}/s"
+        )
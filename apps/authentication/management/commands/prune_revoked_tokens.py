@@ -0,0 +1,74 @@
+"""
+Module for Prune Revoked Tokens Command.
+This module will be a management command that will delete revoked tokens once they
+expire, and user revocations once every token they revoke has expired. Rows are deleted
+in batches so the tables are never locked for long.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.authentication.models import RevokedToken, UserTokenRevocation
+
+
+def prune(queryset, batch_size: int) -> int:
+    """
+    Delete the rows of a queryset batch by batch.
+    :param queryset: Rows to delete
+    :param batch_size: Rows deleted per batch
+    :return: Number of rows deleted
+    """
+    deleted = 0
+
+    while True:
+        batch = list(queryset.values_list("pk", flat=True)[:batch_size])
+
+        if not batch:
+            return deleted
+
+        count, _ = queryset.model.objects.filter(pk__in=batch).delete()
+        deleted += count
+
+
+class Command(BaseCommand):
+    """
+    Django Management Command
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command.
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "REVOCATION_PRUNE_BATCH_SIZE", 1000),
+            help="Rows deleted per batch (Default: 1000)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Prune expired revocations.
+        :param args:
+        :param options:
+        :return:
+        """
+        now = timezone.now()
+        batch_size = options["batch_size"]
+
+        tokens = prune(RevokedToken.objects.filter(expires__lte=now), batch_size)
+        users = prune(
+            UserTokenRevocation.objects.filter(
+                revoked_before__lte=now - api_settings.REFRESH_TOKEN_LIFETIME
+            ),
+            batch_size,
+        )
+
+        self.stdout.write(f"Pruned {tokens} revoked tokens and {users} revoked users.")
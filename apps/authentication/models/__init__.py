@@ -0,0 +1,9 @@
+"""
+Module for authentication database models
+This module will allow for easier model importing.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from apps.authentication.models.revoked_token import RevokedToken, UserTokenRevocation
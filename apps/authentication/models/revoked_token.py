@@ -0,0 +1,73 @@
+"""
+Revoked Token database Models.
+This module will contain the refresh token revocation store, single revoked token ids
+and revocations of every token of a user issued before a time.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.conf import settings
+from django.db.models import (
+    CharField,
+    CASCADE,
+    DateTimeField,
+    Index,
+    Model,
+    OneToOneField,
+)
+from django.utils import timezone
+
+
+class RevokedToken(Model):
+    """
+    Revoked Token Model, kept only until the token expires. A plain model as it is
+    never served by the api.
+    """
+
+    jti = CharField(primary_key=True, max_length=64, help_text="Revoked token id.")
+    revoked = DateTimeField(default=timezone.now, help_text="Date token was revoked.")
+    expires = DateTimeField(help_text="Date the revoked token expires.")
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        indexes = [
+            Index(fields=["revoked"], name="revoked_token_revoked_idx"),
+            Index(fields=["expires"], name="revoked_token_expires_idx"),
+        ]
+
+    def __str__(self):
+        return self.jti
+
+
+class UserTokenRevocation(Model):
+    """
+    User Token Revocation Model, every token of the user issued before revoked_before is
+    revoked.
+    """
+
+    user = OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        on_delete=CASCADE,
+        related_name="token_revocation",
+        help_text="User whose tokens are revoked.",
+    )
+    revoked_before = DateTimeField(
+        help_text="Tokens issued before this date are revoked."
+    )
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        indexes = [
+            Index(fields=["revoked_before"], name="user_revocation_before_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} before {self.revoked_before}"
@@ -0,0 +1,221 @@
+"""
+Module for token revocation.
+This module will check and record revoked refresh tokens. Revoked token ids, and users
+whose tokens are all revoked, are kept in an in process Bloom filter in front of the
+revocation tables, so most valid tokens are checked without a query. Processes sync new
+revocations into their filter when the shared revocation generation moves, or the sync
+interval passes, since a per process cache never shows another process moving it.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import datetime
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.authentication.backends import invalidate_user_auth, is_issued_before
+from apps.authentication.models import RevokedToken, UserTokenRevocation
+from apps.common.utilities.bloom import BloomFilter
+from apps.common.utilities.utilities import is_cache_shared
+
+REVOCATION_GENERATION_KEY = "blog:revocation-generation"
+
+
+def get_generation() -> str:
+    """
+    Get the shared revocation generation, moved whenever a token is revoked.
+    :return: Generation string
+    """
+    generation = cache.get(REVOCATION_GENERATION_KEY)
+
+    if generation is None:
+        cache.add(REVOCATION_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(REVOCATION_GENERATION_KEY)
+
+    return generation
+
+
+def move_generation() -> None:
+    """
+    Move the shared revocation generation once the revocation commits, so other
+    processes sync it.
+    :return: None
+    """
+    transaction.on_commit(
+        lambda: cache.set(REVOCATION_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+    )
+
+
+def get_user_key(user_id) -> str:
+    """
+    Get the Bloom filter item of a user whose tokens are revoked.
+    :param user_id: User primary key
+    :return: Item
+    """
+    return f"user:{user_id}"
+
+
+class RevocationList:
+    """
+    Revocation List, a Bloom filter of revoked token ids and users synced from the
+    revocation tables.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, skew: int, interval: int):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.skew = datetime.timedelta(seconds=skew)
+        self.interval = datetime.timedelta(seconds=interval)
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.generation = None
+        self.synced = None
+
+    def reset(self) -> None:
+        """
+        Drop the filter, the next check loads it again.
+        :return: None
+        """
+        with self.lock:
+            self.bloom = None
+            self.generation = None
+            self.synced = None
+
+    def sync(self) -> BloomFilter:
+        """
+        Get the filter, loading revocations made since the last sync when the generation
+        moved or the interval passed. Revocations are loaded from skew before the last
+        sync, to include ones committed late.
+        :return: Bloom filter
+        """
+        generation = get_generation()
+        now = timezone.now()
+
+        with self.lock:
+            if (
+                self.bloom is not None
+                and self.generation == generation
+                and now - self.synced < self.interval
+            ):
+                return self.bloom
+
+            if self.bloom is None or self.bloom.full:
+                self.bloom = BloomFilter(self.capacity, self.error_rate)
+                self.synced = None
+
+            tokens = RevokedToken.objects.filter(expires__gt=now)
+            users = UserTokenRevocation.objects.filter(
+                revoked_before__gt=now - api_settings.REFRESH_TOKEN_LIFETIME
+            )
+
+            if self.synced is not None:
+                tokens = tokens.filter(revoked__gte=self.synced - self.skew)
+                users = users.filter(revoked_before__gte=self.synced - self.skew)
+
+            for jti in tokens.values_list("jti", flat=True).iterator():
+                self.bloom.add(jti)
+
+            for user_id in users.values_list("user_id", flat=True).iterator():
+                self.bloom.add(get_user_key(user_id))
+
+            self.generation = generation
+            self.synced = now
+
+            return self.bloom
+
+    def add(self, item: str) -> None:
+        """
+        Add a revocation made by this process to the filter.
+        :param item: Item
+        :return: None
+        """
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(item)
+
+        move_generation()
+
+    def is_revoked(self, token, exact: bool = False) -> bool:
+        """
+        Whether a token is revoked, by its id or by its user. Only tokens the filter
+        may contain are looked up. When exact, ie on refresh where a revoked user's
+        tokens must not rotate, the filter is only trusted when the cache is shared, as
+        every revocation then moves the generation the sync checks. Otherwise it may lag
+        other processes by the sync interval, and the revocation tables are looked up.
+        :param token: Validated token
+        :param exact: Whether revocations by other processes must be found at once
+        :return: Boolean
+        """
+        bloom = None if exact and not is_cache_shared() else self.sync()
+        jti = token.get(api_settings.JTI_CLAIM)
+        user_id = token.get(api_settings.USER_ID_CLAIM)
+
+        if (bloom is None or jti in bloom) and RevokedToken.objects.filter(
+            jti=jti
+        ).exists():
+            return True
+
+        if bloom is not None and get_user_key(user_id) not in bloom:
+            return False
+
+        revoked_before = (
+            UserTokenRevocation.objects.filter(user_id=user_id)
+            .values_list("revoked_before", flat=True)
+            .first()
+        )
+
+        return revoked_before is not None and is_issued_before(token, revoked_before)
+
+    def revoke(self, token) -> bool:
+        """
+        Revoke a token, until it expires.
+        :param token: Validated token
+        :return: False if the token was already revoked
+        """
+        jti = token[api_settings.JTI_CLAIM]
+        expires = datetime.datetime.fromtimestamp(
+            token["exp"], tz=datetime.timezone.utc
+        )
+
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(jti=jti, expires=expires)
+        except IntegrityError:
+            return False
+
+        self.add(jti)
+
+        return True
+
+    def revoke_user(self, user) -> None:
+        """
+        Revoke every token of a user issued until now, in one statement.
+        :param user: User
+        :return: None
+        """
+        # Tokens issue times are whole seconds, so are revocation times.
+        now = timezone.now().replace(microsecond=0)
+
+        UserTokenRevocation.objects.bulk_create(
+            [UserTokenRevocation(user_id=user.pk, revoked_before=now)],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["revoked_before"],
+        )
+
+        self.add(get_user_key(user.pk))
+        invalidate_user_auth(sender=type(user), instance=user)
+
+
+revocation_list = RevocationList(
+    capacity=getattr(settings, "REVOCATION_BLOOM_CAPACITY", 100000),
+    error_rate=getattr(settings, "REVOCATION_BLOOM_ERROR_RATE", 0.001),
+    skew=getattr(settings, "REVOCATION_SYNC_SKEW", 60),
+    interval=getattr(settings, "REVOCATION_SYNC_INTERVAL", 30),
+)
@@ -6,15 +6,35 @@ Date: January 26th 2023
 Version: 1.0
 """
 
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainSerializer
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.authentication.revocation import revocation_list
 
-class BlogTokenObtainPairSerializer(TokenObtainSerializer):
+
+def get_token_data(user) -> dict:
     """
-    Blog Token Obtain Pair Serializer
+    Issue a refresh and access token pair for a user.
+    :param user: Authenticated user
+    :return: Token data
+    """
+    refresh = RefreshToken.for_user(user)
+
+    return {
+        "refresh": str(refresh),
+        "access": str(refresh.access_token),
+        "iat": refresh.payload["iat"],
+        "expiry": refresh.payload["exp"],
+    }
+
+
+class BlogTokenObtainPairSerializer(serializers.Serializer):
+    """
+    Blog Token Obtain Pair Serializer, validates login credentials. Passwords are
+    verified by the token view, off the request worker.
     """
 
     def update(self, instance, validated_data):
@@ -23,29 +43,13 @@ class BlogTokenObtainPairSerializer(TokenObtainSerializer):
     def create(self, validated_data):
         pass
 
-    token_class = RefreshToken
-
-    def validate(self, attrs):
-        """
-        Validate Token Refresh request and refresh the token
-        :param attrs:
-        :return: Token data
-        """
-        data = super().validate(attrs)
-
-        refresh = self.get_token(self.user)
-
-        data["refresh"] = str(refresh)
-        data["access"] = str(refresh.access_token)
-        data["iat"] = refresh.payload["iat"]
-        data["expiry"] = refresh.payload["exp"]
-
-        return data
+    username = serializers.CharField()
+    password = serializers.CharField(trim_whitespace=False)
 
 
 class BlogTokenRefreshSerializer(serializers.Serializer):
     """
-    Blog Token Refresh Serializer
+    Blog Token Refresh Serializer, rejects revoked tokens and revokes rotated ones.
     """
 
     def update(self, instance, validated_data):
@@ -66,18 +70,17 @@ class BlogTokenRefreshSerializer(serializers.Serializer):
         """
         refresh = self.token_class(attrs["refresh"])
 
+        if revocation_list.is_revoked(refresh, exact=True):
+            raise TokenError(_("Token is revoked"))
+
         data = {"access": str(refresh.access_token)}
 
         if api_settings.ROTATE_REFRESH_TOKENS:
-            print(api_settings.ROTATE_REFRESH_TOKENS)
-            if api_settings.BLACKLIST_AFTER_ROTATION:
-                try:
-                    # Attempt to blacklist the given refresh token
-                    refresh.blacklist()
-                except AttributeError:
-                    # If blacklist app not installed, `blacklist` method will
-                    # not be present
-                    pass
+            # Revoking is the check for concurrent refreshes, only one revokes a token.
+            if api_settings.BLACKLIST_AFTER_ROTATION and not revocation_list.revoke(
+                refresh
+            ):
+                raise TokenError(_("Token is revoked"))
 
             refresh.set_jti()
             refresh.set_exp()
@@ -0,0 +1,134 @@
+"""
+Module for Authentication Backend Tests.
+This module will test caching verified tokens and invalidating them when users change.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import User
+from apps.authentication.backends import (
+    AUTH_VERSION_KEY,
+    CachedJWTAuthentication,
+    auth_cache,
+)
+
+
+class TestCachedJWTAuthentication(TestCase):
+    """
+    Test Cached JWT Authentication
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+    ]
+
+    def setUp(self) -> None:
+        auth_cache.clear()
+        self.user = User.objects.first()
+        self.token = RefreshToken.for_user(self.user).access_token
+        self.backend = CachedJWTAuthentication()
+
+    def authenticate(self):
+        """
+        Authenticate a request with the test token.
+        :return: User and token
+        """
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.token}"
+        )
+
+        return self.backend.authenticate(request)
+
+    def test_repeat_token_cached(self):
+        """
+        Test a repeat token skips the user query and gets its own user instance.
+        """
+        with CaptureQueriesContext(connection) as context:
+            first, _ = self.authenticate()
+
+        with self.assertNumQueries(0):
+            second, token = self.authenticate()
+
+        sql = context.captured_queries[0]["sql"]
+
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertNotIn("account_account", sql)
+        self.assertNotIn('"password"', sql)
+        self.assertEqual(second.pk, self.user.pk)
+        self.assertIsNot(second, first)
+        self.assertEqual(token["user_id"], str(self.user.pk))
+
+    def test_expiry_bounded_by_token(self):
+        """
+        Test entries expire with the token when it expires before the TTL.
+        """
+        with self.settings(AUTH_CACHE_TTL=10**9):
+            self.authenticate()
+
+        (_, expires, _) = next(iter(auth_cache.entries.values()))
+
+        self.assertEqual(expires, self.token["exp"])
+
+    def test_deactivated_user(self):
+        """
+        Test saving a user invalidates its cached tokens.
+        """
+        self.authenticate()
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_changed_in_other_process(self):
+        """
+        Test cached tokens are verified again once the shared auth version moves.
+        """
+        self.authenticate()
+        cache.set(AUTH_VERSION_KEY.format(pk=self.user.pk), "moved", timeout=None)
+
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+    def test_password_change(self):
+        """
+        Test changing a password through the api invalidates cached tokens.
+        """
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        self.authenticate()
+
+        response = client.put(
+            f"/api/users/{self.user.pk}/change_password",
+            data={
+                "password_one": "K3nC@rIs!@wesom3!Too",
+                "password_two": "K3nC@rIs!@wesom3!Too",
+            },
+        )
+
+        self.assertFalse(response.json()["is_error"])
+        self.assertEqual(len(auth_cache), 0)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_local_cache_not_cached(self):
+        """
+        Test tokens are verified on every request when the cache is per process.
+        """
+        self.authenticate()
+
+        self.assertEqual(len(auth_cache), 0)
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
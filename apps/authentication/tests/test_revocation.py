@@ -0,0 +1,230 @@
+"""
+Module for Token Revocation Tests.
+This module will test revoking refresh tokens on rotation and all tokens of a user, and
+pruning expired revocations.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import datetime
+import json
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import User
+from apps.authentication.backends import CachedJWTAuthentication, auth_cache
+from apps.authentication.models import RevokedToken, UserTokenRevocation
+from apps.authentication.revocation import REVOCATION_GENERATION_KEY, revocation_list
+
+
+class TestTokenRevocation(TestCase):
+    """
+    Test Token Revocation
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+    ]
+
+    def setUp(self) -> None:
+        auth_cache.clear()
+        revocation_list.reset()
+        self.client = APIClient()
+        self.user = User.objects.first()
+
+    def get_old_token(self) -> RefreshToken:
+        """
+        Get a refresh token issued a minute ago.
+        :return: Refresh token
+        """
+        token = RefreshToken.for_user(self.user)
+        token.set_iat(at_time=timezone.now() - datetime.timedelta(minutes=1))
+
+        return token
+
+    def refresh(self, token) -> dict:
+        """
+        Refresh a token.
+        :param token: Refresh token
+        :return: Response content
+        """
+        response = self.client.post(
+            "/api/auth/token/refresh", data={"refresh": str(token)}, format="json"
+        )
+
+        return json.loads(response.content)
+
+    def test_rotated_token_revoked(self):
+        """
+        Test a rotated refresh token can not be used again, the new one can.
+        """
+        token = RefreshToken.for_user(self.user)
+        content = self.refresh(token)
+
+        self.assertIn("refresh", content["content"])
+        self.assertTrue(RevokedToken.objects.filter(jti=token["jti"]).exists())
+        self.assertTrue(self.refresh(token)["is_error"])
+        self.assertFalse(self.refresh(content["content"]["refresh"])["is_error"])
+
+    def test_valid_token_skips_query(self):
+        """
+        Test checking a token never revoked needs no query once the filter is loaded.
+        """
+        revocation_list.revoke(RefreshToken.for_user(self.user))
+        revocation_list.sync()
+        token = RefreshToken.for_user(self.user)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_list.is_revoked(token))
+
+    def test_sync_other_process(self):
+        """
+        Test revocations by other processes are found once the generation moves.
+        """
+        token = RefreshToken.for_user(self.user)
+        revocation_list.sync()
+
+        RevokedToken.objects.create(
+            jti=token["jti"], expires=timezone.now() + datetime.timedelta(days=1)
+        )
+        cache.delete(REVOCATION_GENERATION_KEY)
+
+        self.assertTrue(revocation_list.is_revoked(token))
+
+    def test_revoke_user(self):
+        """
+        Test revoking a user revokes tokens issued before, in one statement.
+        """
+        old = self.get_old_token()
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {old.access_token}"
+        )
+        CachedJWTAuthentication().authenticate(request)
+
+        with self.assertNumQueries(1):
+            revocation_list.revoke_user(self.user)
+
+        new = RefreshToken.for_user(self.user)
+        new.set_iat(at_time=timezone.now() + datetime.timedelta(seconds=1))
+
+        self.assertTrue(revocation_list.is_revoked(old))
+        self.assertFalse(revocation_list.is_revoked(new))
+
+        with self.assertRaises(AuthenticationFailed):
+            CachedJWTAuthentication().authenticate(request)
+
+    def test_revoke_user_same_second(self):
+        """
+        Test revoking a user revokes tokens issued in the same second.
+        """
+        token = RefreshToken.for_user(self.user)
+        revocation_list.revoke_user(self.user)
+
+        self.assertTrue(revocation_list.is_revoked(token))
+
+    def test_refresh_valid_token_skips_query(self):
+        """
+        Test a refresh check of a token never revoked needs no query once the filter is
+        loaded, when the cache is shared.
+        """
+        revocation_list.sync()
+        token = RefreshToken.for_user(self.user)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_list.is_revoked(token, exact=True))
+
+    def test_refresh_revoked_user_other_process(self):
+        """
+        Test a refresh finds user revocations by other processes once the generation
+        moves.
+        """
+        old = self.get_old_token()
+        revocation_list.sync()
+        UserTokenRevocation.objects.create(
+            user=self.user, revoked_before=timezone.now()
+        )
+        cache.delete(REVOCATION_GENERATION_KEY)
+
+        self.assertTrue(self.refresh(old)["is_error"])
+
+    @override_settings(CACHE_SHARED=False)
+    def test_refresh_revoked_user_local_cache(self):
+        """
+        Test a refresh checks user revocations a filter not yet synced misses, when the
+        generation is per process.
+        """
+        old = self.get_old_token()
+        revocation_list.sync()
+        UserTokenRevocation.objects.create(
+            user=self.user, revoked_before=timezone.now()
+        )
+
+        self.assertFalse(revocation_list.is_revoked(old))
+        self.assertTrue(self.refresh(old)["is_error"])
+
+    def test_sync_interval(self):
+        """
+        Test revocations by other processes are found once the interval passes, when
+        the generation never moves.
+        """
+        token = RefreshToken.for_user(self.user)
+        revocation_list.sync()
+
+        RevokedToken.objects.create(
+            jti=token["jti"], expires=timezone.now() + datetime.timedelta(days=1)
+        )
+
+        self.assertFalse(revocation_list.is_revoked(token))
+
+        revocation_list.synced -= revocation_list.interval
+
+        self.assertTrue(revocation_list.is_revoked(token))
+
+    def test_delete_user_revokes(self):
+        """
+        Test deactivating a user revokes its tokens.
+        """
+        old = self.get_old_token()
+        user = User.objects.last()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}"
+        )
+        self.client.delete(f"/api/users/{user.pk}")
+        self.client.put(
+            f"/api/users/{self.user.pk}/change_password",
+            data={
+                "password_one": "K3nC@rIs!@wesom3!Too",
+                "password_two": "K3nC@rIs!@wesom3!Too",
+            },
+        )
+
+        self.assertTrue(UserTokenRevocation.objects.filter(user=user).exists())
+        self.assertTrue(revocation_list.is_revoked(old))
+
+    def test_prune(self):
+        """
+        Test only expired revocations are pruned.
+        """
+        now = timezone.now()
+        RevokedToken.objects.create(jti="a", expires=now - datetime.timedelta(hours=1))
+        RevokedToken.objects.create(jti="b", expires=now + datetime.timedelta(hours=1))
+        UserTokenRevocation.objects.create(
+            user=self.user, revoked_before=now - datetime.timedelta(days=2)
+        )
+        out = StringIO()
+
+        call_command("prune_revoked_tokens", batch_size=1, stdout=out)
+
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["b"]
+        )
+        self.assertFalse(UserTokenRevocation.objects.exists())
+        self.assertIn("Pruned 1 revoked tokens and 1 revoked users.", out.getvalue())
@@ -0,0 +1,139 @@
+"""
+Module for Token Endpoints.
+This module will test obtaining tokens with passwords verified in the hash pool.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.account.models import User
+from apps.authentication.hashing import HashPool, verify_password
+
+PASSWORD = "K3nC@rIs!@wesom3!Too"
+
+
+class TestTokenEndpoint(TestCase):
+    """
+    Test Token Endpoint
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+    ]
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.first()
+        self.user.set_password(PASSWORD)
+        self.user.save()
+
+    def login(self, password: str = PASSWORD):
+        """
+        Request a token pair.
+        :param password: Password
+        :return: Response
+        """
+        return self.client.post(
+            "/api/auth/token",
+            data={"username": self.user.username, "password": password},
+            format="json",
+        )
+
+    def test_obtain_token(self):
+        """
+        Test obtaining a token pair.
+        """
+        response = self.login()
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(content), ["refresh", "access", "iat", "expiry"])
+        self.assertEqual(AccessToken(content["access"])["user_id"], str(self.user.pk))
+
+    def test_obtain_token_fail(self):
+        """
+        Test wrong passwords, unknown and inactive users get the same error.
+        """
+        expected = {
+            "is_error": True,
+            "error": {
+                "message": "No active account found with the given credentials",
+                "errors": [],
+            },
+            "content": {},
+        }
+
+        self.assertEqual(json.loads(self.login("wrong").content), expected)
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.assertEqual(json.loads(self.login().content), expected)
+
+        response = self.client.post(
+            "/api/auth/token",
+            data={"username": "nobody@kencar.com", "password": PASSWORD},
+            format="json",
+        )
+
+        self.assertEqual(json.loads(response.content), expected)
+
+    def test_obtain_token_invalid(self):
+        """
+        Test missing credentials are rejected.
+        """
+        response = self.client.post("/api/auth/token", data={}, format="json")
+        content = json.loads(response.content)
+
+        self.assertTrue(content["is_error"])
+        self.assertEqual(set(content["error"]), {"username", "password"})
+
+    def test_rehash(self):
+        """
+        Test a password hashed with an old hasher is rehashed on login.
+        """
+        User.objects.filter(pk=self.user.pk).update(
+            password=make_password(PASSWORD, hasher="pbkdf2_sha256")
+        )
+
+        self.assertFalse(json.loads(self.login().content)["is_error"])
+
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.password.startswith("argon2"))
+        self.assertTrue(self.user.check_password(PASSWORD))
+
+    def test_pool_full(self):
+        """
+        Test logins are rejected at once when the hash pool is full.
+        """
+        pool = HashPool(workers=1, queue=0)
+        pool.pending = pool.capacity
+
+        with mock.patch("apps.authentication.views.token_view.hash_pool", pool):
+            with self.assertNumQueries(0):
+                response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertTrue(json.loads(response.content)["is_error"])
+
+    def test_verify_password(self):
+        """
+        Test verifying reports whether the hash needs an update.
+        """
+        self.assertEqual(verify_password(PASSWORD, self.user.password), (True, False))
+        self.assertEqual(
+            verify_password(PASSWORD, make_password(PASSWORD, hasher="pbkdf2_sha256")),
+            (True, True),
+        )
+        self.assertEqual(verify_password("wrong", self.user.password), (False, False))
+        self.assertEqual(verify_password(PASSWORD, "!unusable"), (False, False))
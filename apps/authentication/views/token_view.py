@@ -5,24 +5,61 @@ Authors: Kenneth Carmichael (kencar17)
 Date: January 26th 2023
 Version: 1.0
 """
+import json
+
+from django.conf import settings
+from django.views import View
+from rest_framework import status
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
 
+from apps.account.models import User
+from apps.authentication.hashing import HashPoolFull, hash_pool
 from apps.authentication.serializers.token_serializers import (
     BlogTokenObtainPairSerializer,
     BlogTokenRefreshSerializer,
+    get_token_data,
 )
 from apps.common.utilities.utilities import json_response
 
 
-class BlogTokenObtainPairView(TokenObtainPairView):
+class BlogTokenObtainPairView(View):
     """
-    Get Blog Token Obtain Pair View
+    Get Blog Token Obtain Pair View, an async view verifying passwords in the hash pool
+    so a burst of logins never blocks request workers.
     """
 
-    serializer_class = BlogTokenObtainPairSerializer
+    http_method_names = ["post", "options"]
 
-    def post(self, request, *args, **kwargs):
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Token requests carry no session, exempt the view from CSRF checks as api
+        views are.
+        :param initkwargs:
+        :return: View function
+        """
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+
+        return view
+
+    @staticmethod
+    def get_data(request) -> dict:
+        """
+        Parse the request body, json or form encoded.
+        :param request: Request
+        :return: Request data
+        """
+        if request.content_type == "application/json":
+            try:
+                return json.loads(request.body or b"{}")
+            except ValueError:
+                return {}
+
+        return request.POST
+
+    async def post(self, request, *args, **kwargs):
         """
         Authenticate user and get access token and refresh token
         :param request: Request
@@ -30,14 +67,70 @@ class BlogTokenObtainPairView(TokenObtainPairView):
         :param kwargs:
         :return: Json Response of Token info
         """
-        serializer = self.get_serializer(data=request.data)
+        serializer = BlogTokenObtainPairSerializer(data=self.get_data(request))
+
+        if not serializer.is_valid():
+            return json_response(message=serializer.errors, error=True)
+
+        if hash_pool.full:
+            return self.get_busy_response()
+
+        password = serializer.validated_data["password"]
+        user = (
+            await User.objects.select_related(None)
+            .only("id", "password", "is_active")
+            .filter(username=serializer.validated_data["username"])
+            .afirst()
+        )
 
         try:
-            serializer.is_valid(raise_exception=True)
-        except TokenError as exe:
-            raise InvalidToken(exe.args[0]) from exe
+            valid, must_update = await hash_pool.verify(
+                password, user.password if user else None
+            )
+        except HashPoolFull:
+            return self.get_busy_response()
 
-        return json_response(data=serializer.validated_data)
+        if not valid or not user.is_active:
+            message = "No active account found with the given credentials"
+            return json_response(message={"message": message, "errors": []}, error=True)
+
+        if must_update:
+            await self.rehash(user, password)
+
+        return json_response(data=get_token_data(user))
+
+    @staticmethod
+    def get_busy_response():
+        """
+        Reject a login while the hash pool is full.
+        :return: Json Response with a Retry-After header
+        """
+        response = json_response(
+            message={"message": "Too many logins, try again shortly.", "errors": []},
+            error=True,
+            http_status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        response["Retry-After"] = getattr(settings, "LOGIN_RETRY_AFTER", 1)
+
+        return response
+
+    @staticmethod
+    async def rehash(user: User, password: str) -> None:
+        """
+        Store the password hashed with the preferred hasher and parameters, unless it
+        changed meanwhile. A full pool leaves it for the next login.
+        :param user: Authenticated user
+        :param password: Raw password
+        :return: None
+        """
+        try:
+            encoded = await hash_pool.make(password)
+        except HashPoolFull:
+            return
+
+        await User.objects.filter(pk=user.pk, password=user.password).aupdate(
+            password=encoded
+        )
 
 
 class BlogTokenRefreshView(TokenRefreshView):
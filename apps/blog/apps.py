@@ -7,6 +7,17 @@ Version: 1.0
 """
 
 from django.apps import AppConfig
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
+
+from apps.blog.post_counts import remove_deleted_post, update_post_counts
+from apps.blog.search.handlers import install_search_index
+from apps.blog.signals import posts_published, posts_unpublished
 
 
 class BlogConfig(AppConfig):
@@ -16,3 +27,27 @@ class BlogConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.blog"
+
+    def ready(self):
+        """
+        Install the search index whenever the blog app is migrated, count posts of
+        tags and categories as posts are tagged, and keep home feeds as posts are
+        published and accounts are followed.
+        :return:
+        """
+        # The feed reads models, so it is imported once they are loaded.
+        from apps.blog import feed  # pylint: disable=import-outside-toplevel
+
+        post_migrate.connect(install_search_index, sender=self)
+
+        blog_post = self.get_model("BlogPost")
+
+        for field in blog_post._meta.many_to_many:
+            m2m_changed.connect(update_post_counts, sender=field.remote_field.through)
+
+        pre_delete.connect(remove_deleted_post, sender=blog_post)
+
+        posts_published.connect(feed.fan_out, sender=blog_post)
+        posts_unpublished.connect(feed.retract, sender=blog_post)
+        post_save.connect(feed.follow_created, sender="account.Followers")
+        post_delete.connect(feed.follow_deleted, sender="account.Followers")
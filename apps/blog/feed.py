@@ -0,0 +1,253 @@
+"""
+Module for the home feed.
+This module will keep the home feed of every account. Published blog posts are written
+to the timeline of each follower of their account with one INSERT ... SELECT, fan out on
+write. Accounts with more followers than the fan out limit are pulled instead, their
+posts are merged into follower feeds when read. A feed page is one range scan of the
+timeline index, plus one of the post index when pulled accounts are followed.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from apps.account.models import Account, Followers
+from apps.blog.models import BlogPost, TimelineEntry
+from apps.blog.post_counts import PUBLISHED
+from apps.common.pagination.counts import invalidate_counts
+from apps.common.pagination.paginations import ApiKeysetPagination
+
+PULL_ACCOUNTS_KEY = "blog:feed-pull-accounts"
+
+
+def get_pull_accounts() -> frozenset:
+    """
+    Get the accounts whose posts are merged into feeds when read.
+    :return: Set of account primary keys
+    """
+    accounts = cache.get(PULL_ACCOUNTS_KEY)
+
+    if accounts is None:
+        accounts = frozenset(
+            Account.objects.filter(feed_pull=True).values_list("pk", flat=True)
+        )
+        cache.set(
+            PULL_ACCOUNTS_KEY,
+            accounts,
+            timeout=getattr(settings, "FEED_PULL_CACHE_TIMEOUT", 60),
+        )
+
+    return accounts
+
+
+def get_columns(connection, model, *names) -> list:
+    """
+    Get the quoted column names of model fields.
+    :param connection: Database connection
+    :param model: Model
+    :param names: Field names
+    :return: List of quoted column names
+    """
+    quote = connection.ops.quote_name
+
+    return [quote(model._meta.get_field(name).column) for name in names]
+
+
+def fan_out(sender, posts: list, **kwargs) -> None:
+    """
+    Write published blog posts to the timelines of the followers of their accounts,
+    one statement per 500 posts. Posts of pulled accounts are skipped.
+    :param sender: Blog post model
+    :param posts: Published blog posts
+    :param kwargs:
+    :return: None
+    """
+    pull = get_pull_accounts()
+    pks = [post.pk for post in posts if post.account_id not in pull]
+
+    if not pks:
+        return
+
+    connection = connections[TimelineEntry.objects.db]
+    quote = connection.ops.quote_name
+    entry = get_columns(
+        connection, TimelineEntry, "account", "post", "author", "published_date"
+    )
+    post_id, account, status, published = get_columns(
+        connection, BlogPost, "id", "account", "status", "published_date"
+    )
+    follower, followed = get_columns(connection, Followers, "follower", "followed")
+    prep = BlogPost._meta.pk.get_db_prep_value
+
+    with connection.cursor() as cursor:
+        # Chunked under SQLite's limit of query parameters.
+        for start in range(0, len(pks), 500):
+            chunk = pks[start : start + 500]
+            cursor.execute(
+                f"INSERT INTO {quote(TimelineEntry._meta.db_table)} "
+                f"({', '.join(entry)}) "
+                f"SELECT f.{follower}, p.{post_id}, p.{account}, p.{published} "
+                f"FROM {quote(BlogPost._meta.db_table)} p "
+                f"INNER JOIN {quote(Followers._meta.db_table)} f "
+                f"ON f.{followed} = p.{account} "
+                f"WHERE p.{post_id} IN ({', '.join(['%s'] * len(chunk))}) "
+                f"AND p.{status} = %s AND p.{published} IS NOT NULL "
+                f"ON CONFLICT DO NOTHING",
+                [prep(pk, connection) for pk in chunk] + [PUBLISHED],
+            )
+
+
+def retract(sender, posts: list, **kwargs) -> None:
+    """
+    Remove blog posts that are no longer published from every timeline.
+    :param sender: Blog post model
+    :param posts: Blog posts
+    :param kwargs:
+    :return: None
+    """
+    TimelineEntry.objects.filter(post__in=[post.pk for post in posts]).delete()
+
+
+def backfill(follower, followed) -> None:
+    """
+    Write the latest published blog posts of a newly followed account to the
+    timeline of its follower.
+    :param follower: Following account primary key
+    :param followed: Followed account primary key
+    :return: None
+    """
+    connection = connections[TimelineEntry.objects.db]
+    quote = connection.ops.quote_name
+    entry = get_columns(
+        connection, TimelineEntry, "account", "post", "author", "published_date"
+    )
+    post_id, account, status, published = get_columns(
+        connection, BlogPost, "id", "account", "status", "published_date"
+    )
+    prep = Account._meta.pk.get_db_prep_value
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(TimelineEntry._meta.db_table)} ({', '.join(entry)}) "
+            f"SELECT %s, p.{post_id}, p.{account}, p.{published} "
+            f"FROM {quote(BlogPost._meta.db_table)} p "
+            f"WHERE p.{account} = %s AND p.{status} = %s "
+            f"AND p.{published} IS NOT NULL "
+            f"ORDER BY p.{published} DESC LIMIT %s "
+            f"ON CONFLICT DO NOTHING",
+            [
+                prep(follower, connection),
+                prep(followed, connection),
+                PUBLISHED,
+                getattr(settings, "FEED_BACKFILL_SIZE", 50),
+            ],
+        )
+
+
+def follow_created(sender, instance, created: bool, **kwargs) -> None:
+    """
+    Fill the timeline of a new follower. Once an account reaches the fan out limit of
+    followers it is pulled instead.
+    :param sender: Followers model
+    :param instance: Follow
+    :param created: Whether the follow was created
+    :param kwargs:
+    :return: None
+    """
+    if not created or instance.followed_id in get_pull_accounts():
+        return
+
+    # Follower counts move in the same transaction, before the follow is inserted.
+    limit = getattr(settings, "FEED_FANOUT_LIMIT", 10000)
+    pulled = Account.objects.filter(
+        pk=instance.followed_id, followers_count__gte=limit
+    ).update(feed_pull=True)
+
+    if pulled:
+        cache.delete(PULL_ACCOUNTS_KEY)
+        invalidate_counts(model=Account)
+        return
+
+    backfill(instance.follower_id, instance.followed_id)
+
+
+def follow_deleted(sender, instance, **kwargs) -> None:
+    """
+    Remove the blog posts of an unfollowed account from the timeline of its follower.
+    :param sender: Followers model
+    :param instance: Follow
+    :param kwargs:
+    :return: None
+    """
+    TimelineEntry.objects.filter(
+        account=instance.follower_id, author=instance.followed_id
+    ).delete()
+
+
+class FeedPagination(ApiKeysetPagination):
+    """
+    Keyset pagination of a home feed. Timeline entries and posts of followed pulled
+    accounts are each sought from the cursor by (published date, post id), and merged.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.field = BlogPost._meta.get_field("published_date")
+
+    def paginate_feed(self, queryset, request, account) -> list:
+        """
+        Paginate the home feed of an account by seeking from the request cursor.
+        :param queryset: Blog post queryset the page is loaded from
+        :param request: request
+        :param account: Account primary key
+        :return: List of blog posts for the page
+        """
+        self.request = request
+        self.cursor = request.query_params.get(self.cursor_query_param, "")
+        page_size = self.get_page_size(request)
+        forward = True
+        entries = TimelineEntry.objects.filter(account=account)
+        pulled = get_pull_accounts()
+        posts = None
+
+        if pulled:
+            pulled = Followers.objects.filter(
+                follower=account, followed__in=pulled
+            ).values_list("followed", flat=True)
+            posts = BlogPost.objects.filter(status=PUBLISHED, account__in=pulled)
+
+        if self.cursor:
+            value, key, reverse = self.decode_cursor(BlogPost, self.cursor)
+            forward = not reverse
+            entries = entries.filter(self.seek(value, key, forward, key_name="post"))
+
+            if posts is not None:
+                posts = posts.filter(self.seek(value, key, forward))
+
+        entries = self.order(entries, forward, key_name="post")
+        keys = list(entries.values_list("published_date", "post")[: page_size + 1])
+
+        if posts is not None:
+            posts = self.order(posts, forward).values_list("published_date", "pk")
+            keys += list(posts[: page_size + 1])
+
+        # Pulled accounts may also have posts fanned out before they were pulled.
+        keys = sorted(set(keys), reverse=forward == self.descending)
+        has_more = len(keys) > page_size
+        keys = keys[:page_size]
+        rows = queryset.filter(status=PUBLISHED).in_bulk([pk for _, pk in keys])
+        rows = [rows[pk] for _, pk in keys if pk in rows]
+
+        if forward:
+            self.has_next = has_more
+            self.has_previous = bool(self.cursor)
+        else:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+
+        self.page = rows
+
+        return rows
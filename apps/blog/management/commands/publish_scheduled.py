@@ -0,0 +1,148 @@
+"""
+Module for publishing scheduled blog posts.
+This module will be a management command that will publish scheduled blog posts once
+their published date is due, once or as a daemon. Due posts are claimed in batches with
+SELECT ... FOR UPDATE SKIP LOCKED, so several nodes can run it at the same time without
+waiting on or publishing the same rows, flipped with one UPDATE, and the post publish
+hooks run once per batch.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+
+from apps.blog.models import BlogPost
+from apps.blog.models.blog import SCHEDULED
+from apps.blog.post_counts import PUBLISHED
+from apps.common.pagination.counts import invalidate_counts
+from apps.common.utilities.response_cache import invalidate_detail
+
+# Columns the post publish hooks read.
+CLAIM_FIELDS = ("id", "account", "author", "status", "published_date")
+
+
+def claim(batch_size: int, now, flipped) -> list:
+    """
+    Claim due scheduled blog posts and flip them to published, in the current
+    transaction. Backends without SKIP LOCKED, ie SQLite, only flip posts still
+    scheduled and find the ones flipped by the update time.
+    :param batch_size: Blog posts claimed per batch
+    :param now: Time posts are due at
+    :param flipped: Update time of the flipped posts
+    :return: Blog posts published
+    """
+    due = (
+        BlogPost.objects.filter(status=SCHEDULED, published_date__lte=now)
+        .order_by("published_date", "pk")
+        .only(*CLAIM_FIELDS)
+    )
+    connection = connections[due.db]
+
+    if connection.features.has_select_for_update_skip_locked:
+        posts = list(due.select_for_update(skip_locked=True)[:batch_size])
+        BlogPost.objects.filter(pk__in=[post.pk for post in posts]).update(
+            status=PUBLISHED, updated_date=flipped
+        )
+    else:
+        pks = list(due.values_list("pk", flat=True)[:batch_size])
+        BlogPost.objects.filter(pk__in=pks, status=SCHEDULED).update(
+            status=PUBLISHED, updated_date=flipped
+        )
+        posts = list(
+            BlogPost.objects.filter(
+                pk__in=pks, status=PUBLISHED, updated_date=flipped
+            ).only(*CLAIM_FIELDS)
+        )
+
+    for post in posts:
+        post.status = PUBLISHED
+        post.updated_date = flipped
+        post.snapshot()
+
+    return posts
+
+
+def publish_scheduled(batch_size: int, now=None) -> int:
+    """
+    Publish every due scheduled blog post, batch by batch, each batch in its own
+    transaction.
+    :param batch_size: Blog posts published per batch
+    :param now: Time posts are due at, defaults to now
+    :return: Number of blog posts published
+    """
+    now = now or timezone.now()
+    published = 0
+
+    while True:
+        with transaction.atomic():
+            posts = claim(batch_size, now, timezone.now())
+            BlogPost.after_publish(posts, True)
+
+        if posts:
+            invalidate_counts(model=BlogPost)
+            invalidate_detail(BlogPost, [post.pk for post in posts])
+
+        published += len(posts)
+
+        # Rows locked by other nodes are skipped, so short batches end the run too.
+        if len(posts) < batch_size:
+            return published
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to publish scheduled blog posts
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "PUBLISH_BATCH_SIZE", 100),
+            help="Blog posts published per batch (Default: 100)",
+        )
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Keep publishing due blog posts every interval",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=getattr(settings, "PUBLISH_INTERVAL", 30),
+            help="Seconds between runs as a daemon (Default: 30)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Publish scheduled blog posts
+        :param args:
+        :param options:
+        :return:
+        """
+        while True:
+            published = publish_scheduled(options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Published {published} scheduled blog posts.")
+            )
+
+            if not options["daemon"]:
+                return
+
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                return
+
+            # Daemons outlive connections, drop ones that errored or expired.
+            close_old_connections()
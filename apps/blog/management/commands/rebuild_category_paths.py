@@ -0,0 +1,96 @@
+"""
+Module for rebuilding the category paths.
+This module will be a management command that will compute the path and depth of every
+category from its parent, ie for existing categories or after imports that skip
+Category.save.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from apps.blog.models import Category
+from apps.blog.models.managers.category import invalidate_tree
+
+
+def get_paths(parents: dict) -> dict:
+    """
+    Compute the path of every category from its parent, in memory.
+    :param parents: Dictionary of category primary key to parent primary key
+    :return: Dictionary of category primary key to path
+    """
+    paths = {}
+
+    for pk in parents:
+        chain = []
+        node = pk
+
+        while node is not None and node not in paths:
+            if node in chain:
+                raise ValueError(f"Category {node} is nested below itself.")
+
+            chain.append(node)
+            node = parents.get(node)
+
+        prefix = paths.get(node, "")
+
+        for node in reversed(chain):
+            prefix = paths[node] = f"{prefix}{node.hex}/"
+
+    return paths
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to rebuild the category paths
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--database",
+            type=str,
+            default="default",
+            help="Database alias to rebuild the category paths of.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows updated per statement (Default: 1000)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Rebuild the category paths
+        :param args:
+        :param options:
+        :return:
+        """
+        categories = Category.objects.using(options["database"])
+
+        with transaction.atomic(using=options["database"]):
+            rows = list(categories.select_for_update().only("id", "parent", "path"))
+            paths = get_paths({row.pk: row.parent_id for row in rows})
+            changed = []
+
+            for row in rows:
+                if row.path != paths[row.pk]:
+                    row.path = paths[row.pk]
+                    row.depth = row.path.count("/") - 1
+                    changed.append(row)
+
+            categories.bulk_update(
+                changed, ["path", "depth"], batch_size=options["batch_size"]
+            )
+            invalidate_tree()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt the paths of {len(changed)} categories.")
+        )
@@ -0,0 +1,47 @@
+"""
+Module for rebuilding the blog post search index.
+This module will be a management command that will index every blog post, ie after bulk
+imports that skip BlogPost.save.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.core.management import BaseCommand
+
+from apps.blog.models import BlogPost
+from apps.blog.search.backends import get_search_backend
+from apps.common.pagination.counts import invalidate_counts
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to rebuild the blog post search index
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--database",
+            type=str,
+            default="default",
+            help="Database alias to rebuild the search index of.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Rebuild the search index
+        :param args:
+        :param options:
+        :return:
+        """
+        backend = get_search_backend(options["database"])
+        backend.install()
+        total = backend.rebuild(BlogPost.objects.using(options["database"]))
+        invalidate_counts(model=BlogPost)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} blog posts."))
@@ -0,0 +1,93 @@
+"""
+Module for repairing the post counts of tags and categories.
+This module will be a management command that will recompute the post counts of every
+tag and category from the blog post many to many rows, ie after imports or deletes that
+skip the blog post hooks. Rows are recomputed in chunks so no table is locked for long.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from apps.blog.models import BlogPost
+from apps.blog.post_counts import count_rows
+
+
+def repair(field, batch_size: int) -> int:
+    """
+    Recompute the post counts of the rows related through a blog post field, chunk by
+    chunk in primary key order.
+    :param field: Many to many field of blog posts
+    :param batch_size: Rows recomputed per chunk
+    :return: Number of rows whose counts were wrong
+    """
+    model = field.related_model
+    target = field.m2m_reverse_field_name()
+    repaired = 0
+    last = None
+
+    while True:
+        rows = model.objects.order_by("pk").only(
+            "pk", "post_count", "published_post_count"
+        )
+
+        if last is not None:
+            rows = rows.filter(pk__gt=last)
+
+        with transaction.atomic():
+            rows = list(rows.select_for_update()[:batch_size])
+
+            if not rows:
+                return repaired
+
+            counts = count_rows(field, **{f"{target}__in": [row.pk for row in rows]})
+            changed = []
+
+            for row in rows:
+                total, published = counts.get(row.pk, (0, 0))
+
+                if (row.post_count, row.published_post_count) != (total, published):
+                    row.post_count = total
+                    row.published_post_count = published
+                    changed.append(row)
+
+            model.objects.bulk_update(changed, ["post_count", "published_post_count"])
+
+        repaired += len(changed)
+        last = rows[-1].pk
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to repair the post counts of tags and categories
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows recomputed per chunk (Default: 1000)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Repair the post counts
+        :param args:
+        :param options:
+        :return:
+        """
+        for field in BlogPost._meta.many_to_many:
+            repaired = repair(field, options["batch_size"])
+            name = field.related_model._meta.verbose_name_plural
+
+            self.stdout.write(
+                self.style.SUCCESS(f"Repaired the post counts of {repaired} {name}.")
+            )
@@ -10,3 +10,4 @@ from apps.blog.models.category import Category
 from apps.blog.models.tag import Tag
 
 from apps.blog.models.blog import BlogPost
+from apps.blog.models.timeline import TimelineEntry
@@ -7,6 +7,10 @@ Version: 1.0
 """
 import uuid
 
+from django.contrib.postgres.search import SearchVectorField
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.template.defaultfilters import slugify
 from django.db.models import (
     UUIDField,
     CharField,
@@ -18,32 +22,67 @@ from django.db.models import (
     ForeignKey,
     ManyToManyField,
     PROTECT,
+    Index,
+    Q,
+    UniqueConstraint,
 )
-from django.template.defaultfilters import slugify
 from django.utils import timezone
 
 from apps.account.models import Account, User
 from apps.blog.models import Tag, Category
+from apps.blog.post_counts import (
+    PUBLISHED,
+    add_post_rows,
+    move_published,
+    remove_post_rows,
+    removing_posts,
+)
+from apps.blog.search.backends import get_search_backend
+from apps.blog.signals import posts_published, posts_unpublished
+from apps.blog.slugs import invalidate_slugs, suffix_slugs
 from apps.common.globals.database import MIN_CHAR_LEN, MAX_CHAR_LEN, MAX_TEXT_LEN
 from apps.common.models.base_model import BaseTable
+from apps.common.utilities.counters import WriteBehindCounter
 
 
 # TODO: Add Image/Thumbnail
 
+# Fields indexed for full text search.
+SEARCH_FIELDS = {"title", "excerpt", "content"}
+# Status of blog posts published once their published date is due.
+SCHEDULED = "SCHEDULED"
+
 
 class BlogPost(BaseTable):
     """
     Blog Post Model
     """
 
-    choices = (("DRAFT", "Draft"), ("PUBLISHED", "Published"), ("ARCHIVED", "Archived"))
+    choices = (
+        ("DRAFT", "Draft"),
+        ("SCHEDULED", "Scheduled"),
+        ("PUBLISHED", "Published"),
+        ("ARCHIVED", "Archived"),
+    )
+
+    timestamp_field = "updated_date"
+    slug_source_field = "title"
 
     id = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
+    # Covered by the account and author composite indexes in Meta.
     account = ForeignKey(
-        Account, on_delete=PROTECT, help_text="Account blog post belongs too."
+        Account,
+        on_delete=PROTECT,
+        db_index=False,
+        help_text="Account blog post belongs too.",
+    )
+    author = ForeignKey(
+        User,
+        on_delete=PROTECT,
+        db_index=False,
+        help_text="Author of the blog post.",
     )
-    author = ForeignKey(User, on_delete=PROTECT, help_text="Author of the blog post.")
 
     created_date = DateTimeField(auto_now=True, help_text="Date blog post was created.")
     updated_date = DateTimeField(
@@ -86,12 +125,203 @@ class BlogPost(BaseTable):
         default=False, help_text="Is the blog post a featured post."
     )
 
+    search_vector = SearchVectorField(
+        null=True, editable=False, help_text="Full text search vector, Postgres only."
+    )
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        constraints = [
+            UniqueConstraint(
+                fields=["account", "slug"], name="blog_account_slug_unique"
+            ),
+        ]
+        indexes = [
+            Index(fields=["created_date", "id"], name="blog_created_id_idx"),
+            Index(fields=["status", "-created_date"], name="blog_status_created_idx"),
+            Index(
+                fields=["status", "published_date"], name="blog_status_published_idx"
+            ),
+            Index(fields=["account", "-created_date"], name="blog_account_created_idx"),
+            Index(fields=["author", "-created_date"], name="blog_author_created_idx"),
+            Index(
+                fields=["-created_date"],
+                condition=Q(status="PUBLISHED"),
+                name="blog_published_created_idx",
+            ),
+            Index(
+                fields=["-created_date"],
+                condition=Q(is_featured=True),
+                name="blog_featured_created_idx",
+            ),
+        ]
+
+    def is_published(self) -> bool:
+        """
+        Whether the stored status of the blog post is published.
+        :return: Boolean
+        """
+        return self.__dict__.get("_stored_values", {}).get("status") == PUBLISHED
+
+    def get_stored_slug(self) -> tuple:
+        """
+        Get the stored account and slug the blog post is routed by.
+        :return: Tuple of account primary key and slug
+        """
+        stored = self.__dict__.get("_stored_values", {})
+
+        return stored.get("account_id"), stored.get("slug")
+
     def save(self, *args, **kwargs) -> None:
-        self.clean_fields()
-        self.updated_date = timezone.now()
-        self.slug = slugify(self.title)
+        adding = self._state.adding
+        published = self.is_published()
+        slug = self.get_stored_slug()
+
+        with transaction.atomic(using=kwargs.get("using") or self._state.db):
+            super().save(*args, **kwargs)
+
+            if self.is_published() != published:
+                type(self).after_publish([self], not published, created=adding)
+
+            if not adding and self.get_stored_slug() != slug:
+                invalidate_slugs()
+
+    @classmethod
+    def bulk_update_validated(
+        cls, objs, fields, batch_size: int = 1000, errors: dict = None
+    ) -> int:
+        objs = list(objs)
+        published = {obj.pk: obj.is_published() for obj in objs}
+        slugs = {obj.pk: obj.get_stored_slug() for obj in objs}
+        updated = super().bulk_update_validated(
+            objs, fields, batch_size=batch_size, errors=errors
+        )
+
+        if any(obj.get_stored_slug() != slugs[obj.pk] for obj in objs):
+            invalidate_slugs()
+
+        moved = [obj for obj in objs if obj.is_published() != published[obj.pk]]
+        cls.after_publish([obj for obj in moved if obj.is_published()], True)
+        cls.after_publish([obj for obj in moved if not obj.is_published()], False)
+
+        return updated
+
+    @classmethod
+    def after_publish(cls, objs: list, published: bool, created: bool = False) -> None:
+        """
+        Hook run after a batch of blog posts is published or unpublished.
+        :param objs: blog posts whose status changed
+        :param published: whether the posts were published or unpublished
+        :param created: whether the posts were just created, without relations yet
+        :return: None
+        """
+        if not objs:
+            return
 
-        super().save(*args, **kwargs)
+        if not created:
+            move_published(cls, [obj.pk for obj in objs], 1 if published else -1)
+
+        signal = posts_published if published else posts_unpublished
+        signal.send(sender=cls, posts=objs)
+
+    def prepare_save(self, update_fields=None, now=None) -> set:
+        derived = super().prepare_save(update_fields, now=now)
+
+        if (
+            self.status == PUBLISHED
+            and self.published_date is None
+            and (update_fields is None or "status" in update_fields)
+        ):
+            self.published_date = now or timezone.now()
+            derived.add("published_date")
+
+        # Slugs are unique per account, so moving accounts computes the slug again.
+        if update_fields is not None and not {"account", "account_id"}.isdisjoint(
+            update_fields
+        ):
+            self.slug = slugify(self.title)
+            derived.add("slug")
+
+        return derived
+
+    def clean_save_fields(self, update_fields=None, exclude=()) -> None:
+        super().clean_save_fields(update_fields=update_fields, exclude=exclude)
+
+        if (
+            self.status == SCHEDULED
+            and self.published_date is None
+            and (
+                update_fields is None
+                or not {"status", "published_date"}.isdisjoint(update_fields)
+            )
+        ):
+            raise ValidationError(
+                {"published_date": ["Scheduled blog posts need a published date."]}
+            )
+
+    @classmethod
+    def prepare_batch(cls, objs: list, derived: set) -> None:
+        if "slug" in derived:
+            suffix_slugs(cls, objs)
+
+    def after_save(self, update_fields=None) -> None:
+        if update_fields is None or not update_fields.isdisjoint(SEARCH_FIELDS):
+            get_search_backend(self._state.db).index(self)
+
+    @classmethod
+    def after_bulk_save(cls, objs: list, update_fields=None) -> None:
+        if update_fields is None or not update_fields.isdisjoint(SEARCH_FIELDS):
+            get_search_backend(cls.objects.db).index_many(objs)
+
+        # Batches are only written without update fields when created.
+        if update_fields is None:
+            cls.after_publish(
+                [obj for obj in objs if obj.is_published()], True, created=True
+            )
+
+    @classmethod
+    def before_bulk_m2m(cls, field, objs: list) -> None:
+        remove_post_rows(field, [obj.pk for obj in objs])
+
+    @classmethod
+    def after_bulk_m2m(cls, field, values: list) -> None:
+        add_post_rows(field, values)
+
+    @classmethod
+    def before_bulk_delete(cls, objs: list) -> None:
+        get_search_backend(cls.objects.db).remove_many(objs)
+        invalidate_slugs()
+
+    @classmethod
+    def bulk_delete(cls, objs) -> int:
+        objs = list(objs)
+
+        with removing_posts(cls, [obj.pk for obj in objs]):
+            return super().bulk_delete(objs)
+
+    def delete(self, *args, **kwargs) -> tuple:
+        backend = get_search_backend(kwargs.get("using") or self._state.db)
+
+        with transaction.atomic(using=backend.using):
+            backend.remove(self)
+            invalidate_slugs()
+            return super().delete(*args, **kwargs)
+
+    def increment(self, field: str, amount: int = 1) -> int:
+        """
+        Buffer an increment of the views, likes, or dislikes counter, written by the
+        next flush without saving the post.
+        :param field: Counter field
+        :param amount: Amount to add
+        :return: Pending delta of the counter
+        """
+        return blog_counters.increment(self.pk, field, amount)
 
     def __str__(self):
         return f"{self.account} - {self.author}: {self.title}"
+
+
+blog_counters = WriteBehindCounter(BlogPost, fields=("views", "likes", "dislikes"))
@@ -7,6 +7,7 @@ Version: 1.0
 """
 import uuid
 
+from django.core.exceptions import ValidationError
 from django.db.models import (
     UUIDField,
     CharField,
@@ -14,19 +15,30 @@ from django.db.models import (
     SlugField,
     ForeignKey,
     PROTECT,
+    Index,
+    PositiveIntegerField,
+    Value,
+    F,
+    Max,
 )
-from django.template.defaultfilters import slugify
-from django.utils import timezone
+from django.db.models.functions import Concat, Length, Substr
 
-from apps.common.globals.database import DEFAULT_CHAR_LEN, MIN_CHAR_LEN
+from apps.blog.models.managers.category import CategoryManager, invalidate_tree
+from apps.common.globals.database import DEFAULT_CHAR_LEN, MAX_CHAR_LEN, MIN_CHAR_LEN
 from apps.common.models.base_model import BaseTable
 
+# Each path segment is a category id in hex followed by "/".
+PATH_SEGMENT_LEN = 33
+
 
 class Category(BaseTable):
     """
     Category Model
     """
 
+    timestamp_field = "updated_date"
+    slug_source_field = "name"
+
     id = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     created_date = DateTimeField(auto_now=True, help_text="Date category was created.")
     updated_date = DateTimeField(
@@ -56,13 +68,182 @@ class Category(BaseTable):
         null=True,
         blank=True,
     )
+    path = CharField(
+        max_length=MAX_CHAR_LEN,
+        db_index=True,
+        default="",
+        blank=True,
+        editable=False,
+        help_text="Ids of the category ancestors and itself, from the root down.",
+    )
+    depth = PositiveIntegerField(
+        default=0, editable=False, help_text="Number of ancestors of the category."
+    )
+    post_count = PositiveIntegerField(
+        default=0, editable=False, help_text="Number of blog posts with the category."
+    )
+    published_post_count = PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of published blog posts with the category.",
+    )
 
-    def save(self, *args, **kwargs) -> None:
-        self.clean_fields()
-        self.updated_date = timezone.now()
-        self.slug = slugify(self.name)
+    objects = CategoryManager()
 
-        super().save(*args, **kwargs)
+    class Meta:
+        """
+        Meta Class
+        """
+
+        indexes = [
+            Index(fields=["created_date", "id"], name="category_created_id_idx"),
+            Index(
+                fields=["-published_post_count", "name"],
+                name="category_published_count_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name}"
+
+    def get_path(self) -> str:
+        """
+        Get the path of the category from its parent path.
+        :return: Path
+        """
+        parent_path = self.parent.path if self.parent_id else ""
+
+        return f"{parent_path}{self.pk.hex}/"
+
+    # Override
+    def prepare_save(self, update_fields=None, now=None) -> set:
+        """
+        Compute derived fields before a save, the path and depth follow the parent.
+        :param update_fields: field names being written, None for all fields
+        :param now: save time, shared across a batch
+        :return: Set of derived field names that were set
+        """
+        derived = super().prepare_save(update_fields, now=now)
+
+        if not (
+            update_fields is None
+            or {"parent", "parent_id"} & set(update_fields)
+            or not self.path
+        ):
+            return derived
+
+        stored = self.__dict__.get("_stored_values", {}).get("path")
+        self.path = self.get_path()
+        self.depth = self.path.count("/") - 1
+        # Subtrees of moved categories are rewritten once the category is saved.
+        self._moved_from = stored if stored and stored != self.path else None
+
+        return derived | {"path", "depth"}
+
+    # Override
+    def clean_save_fields(self, update_fields=None, exclude=()) -> None:
+        """
+        Validate the fields being written, a category cannot be nested below itself or
+        deeper than the path allows.
+        :param update_fields: field names being written, None for all fields
+        :param exclude: field names validated elsewhere
+        :return: None
+        """
+        if update_fields is None or "path" in update_fields:
+            self.clean_path()
+
+        super().clean_save_fields(update_fields=update_fields, exclude=exclude)
+
+    def clean_path(self) -> None:
+        """
+        Validate a new path, a category cannot be nested below itself, or deeper than
+        the path allows once its subtree moves with it.
+        :return: None
+        """
+        moved_from = getattr(self, "_moved_from", None)
+        deepest = len(self.path)
+
+        if self.parent_id and self.pk.hex in self.parent.path.split("/"):
+            raise ValidationError(
+                {"parent": ["A category cannot be nested below itself."]}
+            )
+
+        if moved_from:
+            longest = Category.objects.filter(path__startswith=moved_from).aggregate(
+                longest=Max(Length("path"))
+            )["longest"]
+            deepest += (longest or len(moved_from)) - len(moved_from)
+
+        if deepest > MAX_CHAR_LEN:
+            levels = MAX_CHAR_LEN // PATH_SEGMENT_LEN
+            raise ValidationError(
+                {"parent": [f"Categories can be nested at most {levels} levels deep."]}
+            )
+
+    def move_subtree(self) -> None:
+        """
+        Rewrite the paths of the categories below a moved category, in one statement.
+        :return: None
+        """
+        moved_from = getattr(self, "_moved_from", None)
+
+        if not moved_from:
+            return
+
+        Category.objects.filter(path__startswith=moved_from).exclude(pk=self.pk).update(
+            path=Concat(
+                Value(self.path),
+                Substr("path", len(moved_from) + 1),
+                output_field=CharField(),
+            ),
+            depth=F("depth") + self.depth - (moved_from.count("/") - 1),
+        )
+        self._moved_from = None
+
+    # Override
+    def after_save(self, update_fields=None) -> None:
+        """
+        Hook run after the row is written.
+        :param update_fields: field names written, None for all fields
+        :return: None
+        """
+        self.move_subtree()
+        invalidate_tree()
+
+    # Override
+    @classmethod
+    def after_bulk_save(cls, objs: list, update_fields=None) -> None:
+        """
+        Hook run after a batch of rows is written, deeper subtrees are moved first so
+        moving their ancestors rewrites them again.
+        :param objs: instances written
+        :param update_fields: field names written, None for all fields
+        :return: None
+        """
+        for obj in sorted(objs, key=lambda obj: obj.depth, reverse=True):
+            obj.move_subtree()
+
+        invalidate_tree()
+
+    # Override
+    @classmethod
+    def before_bulk_delete(cls, objs: list) -> None:
+        """
+        Hook run before a batch of rows is deleted.
+        :param objs: instances to be deleted
+        :return: None
+        """
+        invalidate_tree()
+
+    # Override
+    def delete(self, *args, **kwargs) -> tuple:
+        """
+        Delete
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        deleted = super().delete(*args, **kwargs)
+        invalidate_tree()
+
+        return deleted
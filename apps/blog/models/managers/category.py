@@ -0,0 +1,113 @@
+"""
+Category Manager.
+This module will contain custom functionality related to category manager. IE Subtrees,
+breadcrumbs, and the cached category tree.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+
+from apps.blog.models.queryset.category_queryset import CategoryQuerySet
+from apps.common.utilities.utilities import is_cache_shared
+
+CATEGORY_TREE_VERSION_KEY = "blog:category-tree-version"
+CATEGORY_TREE_KEY = "blog:category-tree:{version}"
+
+
+def get_tree_version() -> str:
+    """
+    Get the current category tree cache version.
+    :return: Version string
+    """
+    version = cache.get(CATEGORY_TREE_VERSION_KEY)
+
+    if version is None:
+        cache.add(CATEGORY_TREE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(CATEGORY_TREE_VERSION_KEY)
+
+    return version
+
+
+def invalidate_tree() -> None:
+    """
+    Invalidate the cached category tree by moving it to a new version, again once the
+    transaction commits so a read racing the write cannot cache the old tree.
+    :return: None
+    """
+
+    def move() -> None:
+        cache.set(CATEGORY_TREE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+    move()
+    transaction.on_commit(move)
+
+
+class CategoryManager(models.Manager):
+    """
+    Custom Category Manager
+    """
+
+    def get_queryset(self):
+        """
+        Get Category Queryset
+        :return:
+        """
+        return CategoryQuerySet(self.model, using=self._db)
+
+    def subtree(self, category):
+        """
+        Get a category and every category below it.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return self.get_queryset().subtree(category=category)
+
+    def descendants(self, category):
+        """
+        Get every category below a category.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return self.get_queryset().descendants(category=category)
+
+    def ancestors(self, category):
+        """
+        Get the ancestors of a category from the root down.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return self.get_queryset().ancestors(category=category)
+
+    def breadcrumbs(self, category):
+        """
+        Get a category and its ancestors from the root down.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return self.get_queryset().breadcrumbs(category=category)
+
+    def tree(self) -> list:
+        """
+        Get every category nested below its parent, cached until a category changes.
+        A per process cache is never used, since invalidations would not reach other
+        processes.
+        :return: List of root category nodes
+        """
+        if not is_cache_shared():
+            return self.get_queryset().tree()
+
+        key = CATEGORY_TREE_KEY.format(version=get_tree_version())
+        tree = cache.get(key)
+
+        if tree is None:
+            tree = self.get_queryset().tree()
+            cache.set(
+                key, tree, timeout=getattr(settings, "CATEGORY_TREE_TIMEOUT", 86400)
+            )
+
+        return tree
@@ -0,0 +1,104 @@
+"""
+Category QuerySet.
+This module will contain custom functionality related to category querysets. IE Loading
+subtrees, ancestors, and breadcrumbs from the materialized category path.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.db import models
+from django.db.models import F, Subquery, Value
+
+
+class CategoryQuerySet(models.QuerySet):
+    """
+    Custom Category QuerySet Class
+    """
+
+    def get_path(self, category):
+        """
+        Get the path of a category as an expression, a subquery when only the primary
+        key is known so lookups stay a single query.
+        :param category: Category instance or primary key
+        :return: Path expression
+        """
+        if isinstance(category, self.model):
+            return Value(category.path)
+
+        return Subquery(
+            self.model.objects.filter(pk=category).values("path")[:1],
+            output_field=models.CharField(),
+        )
+
+    def subtree(self, category):
+        """
+        Get a category and every category below it, with a prefix match on the path.
+        The path of a primary key is looked up first, so the prefix is a literal the
+        path index can serve.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        if isinstance(category, self.model):
+            path = category.path
+        else:
+            path = (
+                self.model.objects.filter(pk=category)
+                .values_list("path", flat=True)
+                .first()
+            )
+
+        if not path:
+            return self.none()
+
+        return self.filter(path__startswith=path)
+
+    def descendants(self, category):
+        """
+        Get every category below a category.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return self.subtree(category).exclude(pk=getattr(category, "pk", category))
+
+    def breadcrumbs(self, category):
+        """
+        Get a category and its ancestors from the root down, every category whose path
+        is a prefix of its path.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return (
+            self.alias(target=self.get_path(category))
+            .filter(target__startswith=F("path"))
+            .order_by("depth")
+        )
+
+    def ancestors(self, category):
+        """
+        Get the ancestors of a category from the root down.
+        :param category: Category instance or primary key
+        :return: Queryset
+        """
+        return self.breadcrumbs(category).exclude(pk=getattr(category, "pk", category))
+
+    def tree(self) -> list:
+        """
+        Load every category with one query and nest them below their parents.
+        :return: List of root category nodes, each with its "children"
+        """
+        nodes = {}
+        roots = []
+        rows = self.order_by("depth", "name").values(
+            "id", "name", "slug", "description", "depth", "parent_id"
+        )
+
+        for row in rows:
+            parent = row.pop("parent_id")
+            node = nodes[row["id"]] = {**row, "children": []}
+
+            if parent in nodes:
+                nodes[parent]["children"].append(node)
+            else:
+                roots.append(node)
+
+        return roots
@@ -12,9 +12,9 @@ from django.db.models import (
     CharField,
     DateTimeField,
     SlugField,
+    Index,
+    PositiveIntegerField,
 )
-from django.template.defaultfilters import slugify
-from django.utils import timezone
 
 from apps.common.globals.database import DEFAULT_CHAR_LEN, MIN_CHAR_LEN
 from apps.common.models.base_model import BaseTable
@@ -25,6 +25,9 @@ class Tag(BaseTable):
     Tag Model
     """
 
+    timestamp_field = "updated_date"
+    slug_source_field = "name"
+
     id = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     created_date = DateTimeField(auto_now=True, help_text="Date tag was created.")
     updated_date = DateTimeField(
@@ -45,13 +48,27 @@ class Tag(BaseTable):
         help_text="Description or summary of the tag.",
         blank=True,
     )
+    post_count = PositiveIntegerField(
+        default=0, editable=False, help_text="Number of blog posts with the tag."
+    )
+    published_post_count = PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of published blog posts with the tag.",
+    )
 
-    def save(self, *args, **kwargs) -> None:
-        self.clean_fields()
-        self.updated_date = timezone.now()
-        self.slug = slugify(self.name)
+    class Meta:
+        """
+        Meta Class
+        """
 
-        super().save(*args, **kwargs)
+        indexes = [
+            Index(fields=["created_date", "id"], name="tag_created_id_idx"),
+            Index(
+                fields=["-published_post_count", "name"],
+                name="tag_published_count_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name}"
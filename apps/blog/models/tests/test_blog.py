@@ -128,3 +128,24 @@ class TesBlogPostModel(TestCase):
             str(record),
             "New Star Blog - Kenh Carml: Exploring the Rich Culture of the Inuvialuit People",
         )
+
+    def test_blog_slug_suffixed(self):
+        """
+        Test colliding slugs within an account are suffixed, in saves and batches.
+        """
+
+        first = BlogPost.objects.create(**self._blog_json)
+        second = BlogPost.objects.create(**self._blog_json)
+        batch = BlogPost.bulk_create_validated(
+            [BlogPost(**self._blog_json), BlogPost(**self._blog_json)]
+        )
+        slug = "exploring-the-rich-culture-of-the-inuvialuit-people"
+
+        self.assertEqual(first.slug, slug)
+        self.assertEqual(second.slug, f"{slug}-2")
+        self.assertEqual([blog.slug for blog in batch], [f"{slug}-3", f"{slug}-4"])
+
+        second.excerpt = "Changed."
+        second.save()
+
+        self.assertEqual(second.slug, f"{slug}-2")
@@ -6,6 +6,10 @@ Date: March 3rd 2023
 Version: 1.0
 """
 
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
@@ -71,3 +75,90 @@ class TesCategoryModel(TestCase):
 
         record = Category.objects.create(**self._category_json)
         self.assertEqual(str(record), "Django")
+
+    def test_category_path(self):
+        """
+        Test Category paths follow their parents.
+        """
+
+        root = Category.objects.create(name="Python", description="Python")
+        child = Category.objects.create(name="Django", description="D", parent=root)
+
+        self.assertEqual(root.path, f"{root.pk.hex}/")
+        self.assertEqual(child.path, f"{root.pk.hex}/{child.pk.hex}/")
+        self.assertEqual(child.depth, 1)
+
+    def test_category_move_subtree(self):
+        """
+        Test moving a Category rewrites the paths of its subtree.
+        """
+
+        root = Category.objects.create(name="Python", description="Python")
+        other = Category.objects.create(name="Web", description="Web")
+        child = Category.objects.create(name="Django", description="D", parent=root)
+        leaf = Category.objects.create(name="Forms", description="F", parent=child)
+
+        child.parent = other
+        child.save()
+        leaf.refresh_from_db()
+
+        self.assertEqual(leaf.path, f"{other.pk.hex}/{child.pk.hex}/{leaf.pk.hex}/")
+        self.assertEqual(leaf.depth, 2)
+        self.assertFalse(Category.objects.descendants(root).exists())
+
+        child.parent = child
+
+        with self.assertRaises(ValidationError):
+            child.save()
+
+        other.parent = leaf
+
+        with self.assertRaises(ValidationError):
+            other.save()
+
+    def test_category_hierarchy_lookups(self):
+        """
+        Test Category ancestor and breadcrumb lookups are one query, subtree lookups by
+        primary key look up the path first and match it as a literal prefix.
+        """
+
+        root = Category.objects.create(name="Python", description="Python")
+        child = Category.objects.create(name="Django", description="D", parent=root)
+        leaf = Category.objects.create(name="Forms", description="F", parent=child)
+        Category.objects.create(name="Web", description="Web")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Category.objects.ancestors(leaf.pk)), [root, child])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(Category.objects.breadcrumbs(leaf)), [root, child, leaf]
+            )
+
+        with self.assertNumQueries(2):
+            self.assertEqual(set(Category.objects.descendants(root.pk)), {child, leaf})
+
+        with self.assertNumQueries(1):
+            self.assertEqual(set(Category.objects.subtree(child)), {child, leaf})
+
+        self.assertIn(root.path, str(Category.objects.subtree(root.pk).query))
+
+        tree = Category.objects.tree()
+
+        self.assertEqual([node["name"] for node in tree], ["Python", "Web"])
+        self.assertEqual(tree[0]["children"][0]["children"][0]["name"], "Forms")
+
+    def test_category_rebuild_paths(self):
+        """
+        Test rebuilding Category paths from their parents.
+        """
+
+        root = Category.objects.create(name="Python", description="Python")
+        child = Category.objects.create(name="Django", description="D", parent=root)
+        Category.objects.update(path="", depth=0)
+
+        call_command("rebuild_category_paths", stdout=StringIO())
+        child.refresh_from_db()
+
+        self.assertEqual(child.path, f"{root.pk.hex}/{child.pk.hex}/")
+        self.assertEqual(child.depth, 1)
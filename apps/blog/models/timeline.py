@@ -0,0 +1,75 @@
+"""
+Timeline Entry database Model.
+This module will contain functions and fields for Timeline Entry Model. A timeline entry
+is a published blog post written to the home feed of an account following its author.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.db.models import (
+    CASCADE,
+    BigAutoField,
+    DateTimeField,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
+
+from apps.account.models import Account
+from apps.blog.models.blog import BlogPost
+from apps.common.models.base_model import BaseTable
+
+
+class TimelineEntry(BaseTable):
+    """
+    Timeline Entry Model
+    """
+
+    # Entries are inserted set based from the followers table, so the key is generated
+    # by the database.
+    id = BigAutoField(primary_key=True)
+
+    # Covered by the feed and author composite indexes in Meta.
+    account = ForeignKey(
+        Account,
+        on_delete=CASCADE,
+        db_index=False,
+        related_name="timeline",
+        help_text="Account whose home feed the entry is in.",
+    )
+    post = ForeignKey(
+        BlogPost,
+        on_delete=CASCADE,
+        related_name="timeline_entries",
+        help_text="Published blog post.",
+    )
+    author = ForeignKey(
+        Account,
+        on_delete=CASCADE,
+        db_index=False,
+        related_name="+",
+        help_text="Account the blog post belongs to, the followed account.",
+    )
+    published_date = DateTimeField(help_text="Date the blog post was published.")
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        constraints = [
+            UniqueConstraint(
+                fields=["account", "post"], name="timeline_account_post_unique"
+            ),
+        ]
+        indexes = [
+            Index(
+                fields=["account", "-published_date", "-post"],
+                name="timeline_account_feed_idx",
+            ),
+            Index(fields=["account", "author"], name="timeline_account_author_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.account}: {self.post_id}"
@@ -0,0 +1,210 @@
+"""
+Module for post counts of tags and categories.
+This module will keep the post_count and published_post_count columns of tags and
+categories up to date as blog posts are tagged, published, and deleted. Changes are
+counted from the many to many rows with one aggregate query, and applied with one
+UPDATE per distinct delta, so a batch of posts costs the same as one. Deleted posts are
+counted from pre_delete, which Django sends for every deleted row, ie cascades and
+queryset deletes, unless the batch deleting them counted them already.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models import Count, F, Q
+
+from apps.common.pagination.counts import invalidate_counts
+
+PUBLISHED = "PUBLISHED"
+
+# Many to many actions and the sign of their change, removals are counted before the
+# rows are gone.
+ACTION_SIGNS = {"post_add": 1, "pre_remove": -1, "pre_clear": -1}
+
+# Blog posts whose counts a batch delete removed, skipped by their pre_delete.
+removed_posts = ContextVar("removed_posts", default=frozenset())
+
+
+def apply_post_counts(model, deltas: dict) -> None:
+    """
+    Add post count deltas to related rows, rows with the same delta in one UPDATE, and
+    invalidate the cached counts of the model the UPDATE skips.
+    :param model: Tag or Category
+    :param deltas: Dictionary of primary key to total and published delta tuple
+    :return: None
+    """
+    groups = defaultdict(list)
+
+    for pk, delta in deltas.items():
+        if any(delta):
+            groups[tuple(delta)].append(pk)
+
+    for (total, published), pks in groups.items():
+        model.objects.filter(pk__in=pks).update(
+            post_count=F("post_count") + total,
+            published_post_count=F("published_post_count") + published,
+        )
+
+    if groups:
+        invalidate_counts(model=model)
+
+
+def count_rows(field, **filters) -> dict:
+    """
+    Count the many to many rows of blog posts per related row, with one query.
+    :param field: Many to many field of blog posts
+    :param filters: Filters of the many to many rows
+    :return: Dictionary of related primary key to total and published count tuple
+    """
+    source = field.m2m_field_name()
+    target = f"{field.m2m_reverse_field_name()}_id"
+    rows = (
+        field.remote_field.through.objects.filter(**filters)
+        .values(target)
+        .annotate(
+            total=Count("pk"),
+            published=Count("pk", filter=Q(**{f"{source}__status": PUBLISHED})),
+        )
+        .order_by()
+    )
+
+    return {row[target]: (row["total"], row["published"]) for row in rows}
+
+
+def add_post_rows(field, values: list) -> None:
+    """
+    Count many to many rows inserted for blog posts in memory, ie by bulk writes.
+    :param field: Many to many field of blog posts
+    :param values: List of blog post and related primary keys tuples
+    :return: None
+    """
+    deltas = defaultdict(lambda: [0, 0])
+
+    for post, pks in values:
+        for pk in pks:
+            deltas[pk][0] += 1
+            deltas[pk][1] += 1 if post.status == PUBLISHED else 0
+
+    apply_post_counts(field.related_model, deltas)
+
+
+def remove_post_rows(field, pks: list) -> None:
+    """
+    Remove the counts of the many to many rows of blog posts about to be deleted.
+    :param field: Many to many field of blog posts
+    :param pks: Blog post primary keys
+    :return: None
+    """
+    counts = count_rows(field, **{f"{field.m2m_field_name()}__in": pks})
+    apply_post_counts(
+        field.related_model,
+        {pk: (-total, -published) for pk, (total, published) in counts.items()},
+    )
+
+
+def remove_posts(post_model, pks: list) -> None:
+    """
+    Remove the counts of blog posts about to be deleted.
+    :param post_model: Blog post model
+    :param pks: Blog post primary keys
+    :return: None
+    """
+    for field in post_model._meta.many_to_many:
+        remove_post_rows(field, pks)
+
+
+@contextmanager
+def removing_posts(post_model, pks: list):
+    """
+    Remove the counts of a batch of blog posts at once, for the deletes in the block.
+    :param post_model: Blog post model
+    :param pks: Blog post primary keys
+    :return: Context manager
+    """
+    remove_posts(post_model, pks)
+    token = removed_posts.set(removed_posts.get() | frozenset(pks))
+
+    try:
+        yield
+    finally:
+        removed_posts.reset(token)
+
+
+def remove_deleted_post(sender, instance, **kwargs) -> None:
+    """
+    Remove the counts of a blog post about to be deleted, unless its batch did.
+    :param sender: Blog post model
+    :param instance: Blog post
+    :param kwargs:
+    :return: None
+    """
+    if instance.pk not in removed_posts.get():
+        remove_posts(sender, [instance.pk])
+
+
+def move_published(post_model, pks: list, sign: int) -> None:
+    """
+    Move the published counts of blog posts that were published or unpublished.
+    :param post_model: Blog post model
+    :param pks: Blog post primary keys
+    :param sign: 1 when published, -1 when unpublished
+    :return: None
+    """
+    if not pks:
+        return
+
+    for field in post_model._meta.many_to_many:
+        counts = count_rows(field, **{f"{field.m2m_field_name()}__in": pks})
+        apply_post_counts(
+            field.related_model,
+            {pk: (0, sign * total) for pk, (total, _) in counts.items()},
+        )
+
+
+def update_post_counts(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+) -> None:
+    """
+    Count blog post many to many rows added or removed from either side.
+    :param sender: Many to many through model
+    :param instance: Instance whose relation changed
+    :param action: m2m_changed action
+    :param reverse: Whether the instance is the related side, ie a tag
+    :param model: Model of the primary keys in pk_set
+    :param pk_set: Primary keys added or removed, None when cleared
+    :param kwargs:
+    :return: None
+    """
+    sign = ACTION_SIGNS.get(action)
+
+    if sign is None or pk_set is not None and not pk_set:
+        return
+
+    post_model = model if reverse else type(instance)
+    field = next(
+        field
+        for field in post_model._meta.many_to_many
+        if field.remote_field.through is sender
+    )
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+
+    if reverse:
+        source, target = target, source
+
+    filters = {source: instance.pk}
+
+    if pk_set is not None:
+        filters[f"{target}__in"] = pk_set
+
+    counts = count_rows(field, **filters)
+    apply_post_counts(
+        field.related_model,
+        {
+            pk: (sign * total, sign * published)
+            for pk, (total, published) in counts.items()
+        },
+    )
@@ -0,0 +1,351 @@
+"""
+Module for Blog Post search backends.
+This module maintains the full text index of blog posts and searches it with relevance
+ranking and highlighted snippets. Postgres uses a tsvector column with a GIN index, SQLite
+uses an FTS5 shadow table.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import F, FloatField, Q, Value
+
+SNIPPET_START = "<b>"
+SNIPPET_STOP = "</b>"
+SNIPPET_WORDS = 24
+
+
+class BaseSearchBackend:
+    """
+    Base Search Backend, every backend indexes title, excerpt and content of a post.
+    Databases without full text support fall back to unranked substring matching.
+    """
+
+    def __init__(self, using: str):
+        self.using = using
+
+    @property
+    def connection(self):
+        """
+        Database connection of the backend.
+        :return: Connection
+        """
+        return connections[self.using]
+
+    def install(self) -> None:
+        """
+        Create database objects backing the search index.
+        :return: None
+        """
+
+    def index(self, post) -> None:
+        """
+        Add or replace a blog post in the search index.
+        :param post: BlogPost
+        :return: None
+        """
+
+    def remove(self, post) -> None:
+        """
+        Remove a blog post from the search index.
+        :param post: BlogPost
+        :return: None
+        """
+
+    def index_many(self, posts: list) -> None:
+        """
+        Add or replace a batch of blog posts in the search index.
+        :param posts: List of BlogPost
+        :return: None
+        """
+        for post in posts:
+            self.index(post)
+
+    def remove_many(self, posts: list) -> None:
+        """
+        Remove a batch of blog posts from the search index.
+        :param posts: List of BlogPost
+        :return: None
+        """
+        for post in posts:
+            self.remove(post)
+
+    def rebuild(self, queryset) -> int:
+        """
+        Index every blog post of a queryset.
+        :param queryset: BlogPost QuerySet
+        :return: Number of indexed posts
+        """
+        total = 0
+
+        for post in queryset.only("id", "title", "excerpt", "content").iterator():
+            self.index(post)
+            total += 1
+
+        return total
+
+    def search(self, queryset, term: str):
+        """
+        Filter a queryset to posts matching a search term, annotated with rank and
+        snippet.
+        :param queryset: BlogPost QuerySet
+        :param term: Search term
+        :return: QuerySet
+        """
+        lookup = Q()
+
+        for word in term.split():
+            lookup &= (
+                Q(title__icontains=word)
+                | Q(excerpt__icontains=word)
+                | Q(content__icontains=word)
+            )
+
+        return queryset.filter(lookup).annotate(
+            rank=Value(0.0, output_field=FloatField()), snippet=F("excerpt")
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Postgres Search Backend, a weighted tsvector kept on the blog post row.
+    """
+
+    config = "english"
+    index_name = "blog_search_vector_gin_idx"
+
+    def get_vector(self):
+        """
+        Weighted search vector of a blog post, title ranks above excerpt and content.
+        :return: SearchVector
+        """
+        return (
+            SearchVector("title", weight="A", config=self.config)
+            + SearchVector("excerpt", weight="B", config=self.config)
+            + SearchVector("content", weight="C", config=self.config)
+        )
+
+    def install(self) -> None:
+        """
+        Create the GIN index over the search vector column.
+        :return: None
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.index_name} "
+                "ON blog_blogpost USING gin (search_vector)"
+            )
+
+    def index(self, post) -> None:
+        """
+        Recompute the search vector of a blog post.
+        :param post: BlogPost
+        :return: None
+        """
+        type(post).objects.using(self.using).filter(pk=post.pk).update(
+            search_vector=self.get_vector()
+        )
+
+    def index_many(self, posts: list) -> None:
+        """
+        Recompute the search vector of a batch of blog posts in one statement.
+        :param posts: List of BlogPost
+        :return: None
+        """
+        if posts:
+            type(posts[0]).objects.using(self.using).filter(
+                pk__in=[post.pk for post in posts]
+            ).update(search_vector=self.get_vector())
+
+    def rebuild(self, queryset) -> int:
+        """
+        Recompute the search vector of every blog post of a queryset in one statement.
+        :param queryset: BlogPost QuerySet
+        :return: Number of indexed posts
+        """
+        return queryset.using(self.using).update(search_vector=self.get_vector())
+
+    def search(self, queryset, term: str):
+        """
+        Filter a queryset to posts matching a web search style term.
+        :param queryset: BlogPost QuerySet
+        :param term: Search term
+        :return: QuerySet
+        """
+        query = SearchQuery(term, search_type="websearch", config=self.config)
+
+        return queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F("search_vector"), query),
+            snippet=SearchHeadline(
+                "content",
+                query,
+                config=self.config,
+                start_sel=SNIPPET_START,
+                stop_sel=SNIPPET_STOP,
+                max_words=SNIPPET_WORDS,
+                min_words=SNIPPET_WORDS // 2,
+            ),
+        )
+
+
+class SqliteSearchBackend(BaseSearchBackend):
+    """
+    SQLite Search Backend, an FTS5 table keyed by blog post id.
+    """
+
+    table = "blog_blogpost_fts"
+
+    def install(self) -> None:
+        """
+        Create the FTS5 table.
+        :return: None
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                "post_id UNINDEXED, title, excerpt, content, "
+                "tokenize = 'porter unicode61')"
+            )
+
+    def get_post_id(self, post):
+        """
+        Database value of a blog post id.
+        :param post: BlogPost
+        :return: Id as stored in the blog post table
+        """
+        return post._meta.pk.get_db_prep_value(post.pk, self.connection)
+
+    def index(self, post) -> None:
+        """
+        Replace the FTS5 row of a blog post.
+        :param post: BlogPost
+        :return: None
+        """
+        post_id = self.get_post_id(post)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE post_id = %s", [post_id])
+            cursor.execute(
+                f"INSERT INTO {self.table} (post_id, title, excerpt, content) "
+                "VALUES (%s, %s, %s, %s)",
+                [post_id, post.title, post.excerpt, post.content],
+            )
+
+    def remove(self, post) -> None:
+        """
+        Delete the FTS5 row of a blog post.
+        :param post: BlogPost
+        :return: None
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {self.table} WHERE post_id = %s", [self.get_post_id(post)]
+            )
+
+    def index_many(self, posts: list) -> None:
+        """
+        Replace the FTS5 rows of a batch of blog posts, with one delete and one insert.
+        :param posts: List of BlogPost
+        :return: None
+        """
+        if not posts:
+            return
+
+        self.remove_many(posts)
+
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {self.table} (post_id, title, excerpt, content) "
+                "VALUES (%s, %s, %s, %s)",
+                [
+                    [self.get_post_id(post), post.title, post.excerpt, post.content]
+                    for post in posts
+                ],
+            )
+
+    def remove_many(self, posts: list) -> None:
+        """
+        Delete the FTS5 rows of a batch of blog posts, one statement per 500 posts.
+        :param posts: List of BlogPost
+        :return: None
+        """
+        if not posts:
+            return
+
+        post_ids = [self.get_post_id(post) for post in posts]
+
+        with self.connection.cursor() as cursor:
+            # Chunked under SQLite's limit of query parameters.
+            for start in range(0, len(post_ids), 500):
+                chunk = post_ids[start : start + 500]
+                cursor.execute(
+                    f"DELETE FROM {self.table} WHERE post_id IN "
+                    f"({', '.join(['%s'] * len(chunk))})",
+                    chunk,
+                )
+
+    @staticmethod
+    def get_match(term: str) -> str:
+        """
+        Quote every word of a term so FTS5 query syntax in user input is matched as
+        text.
+        :param term: Search term
+        :return: FTS5 match expression
+        """
+        words = ['"{}"'.format(word.replace('"', '""')) for word in term.split()]
+
+        return " ".join(words)
+
+    def search(self, queryset, term: str):
+        """
+        Filter a queryset to posts matching every word of a term. bm25 ranks lower for
+        better matches, so it is negated to rank higher like Postgres.
+        :param queryset: BlogPost QuerySet
+        :param term: Search term
+        :return: QuerySet
+        """
+        match = self.get_match(term)
+
+        if not match:
+            return super().search(queryset.none(), term)
+
+        meta = queryset.model._meta
+        quote = self.connection.ops.quote_name
+
+        return queryset.extra(
+            select={
+                "rank": f"-bm25({self.table}, 0.0, 10.0, 4.0, 1.0)",
+                "snippet": f"snippet({self.table}, -1, '{SNIPPET_START}', "
+                f"'{SNIPPET_STOP}', '...', {SNIPPET_WORDS})",
+            },
+            tables=[self.table],
+            where=[
+                f"{self.table}.post_id = {quote(meta.db_table)}.{quote(meta.pk.column)}",
+                f"{self.table} MATCH %s",
+            ],
+            params=[match],
+        )
+
+
+SEARCH_BACKENDS = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SqliteSearchBackend,
+}
+
+
+def get_search_backend(using: str = None):
+    """
+    Get search backend for a database.
+    :param using: Database alias, defaults to the default database
+    :return: Search backend instance
+    """
+    using = using or DEFAULT_DB_ALIAS
+    backend = SEARCH_BACKENDS.get(connections[using].vendor, BaseSearchBackend)
+
+    return backend(using)
@@ -0,0 +1,37 @@
+"""
+Module for Blog Post search filter.
+This module replaces DRF substring search with the full text search backend for the
+"search" query param.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from rest_framework import filters
+
+from apps.blog.search.backends import get_search_backend
+
+
+class BlogSearchFilter(filters.SearchFilter):
+    """
+    Full text search filter, results are ordered by rank unless an ordering is requested.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filter queryset by the search terms.
+        :param request: request
+        :param queryset: BlogPost QuerySet
+        :param view: view
+        :return: QuerySet
+        """
+        terms = self.get_search_terms(request)
+
+        if not terms:
+            return queryset
+
+        queryset = get_search_backend(queryset.db).search(queryset, " ".join(terms))
+
+        if "ordering" not in request.query_params:
+            queryset = queryset.order_by("-rank", "-created_date")
+
+        return queryset
@@ -0,0 +1,19 @@
+"""
+Module for Blog Post search handlers.
+This module installs the search index database objects after migrations.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from apps.blog.search.backends import get_search_backend
+
+
+def install_search_index(sender, using: str = "default", **kwargs) -> None:
+    """
+    Create the search index of the database that was migrated.
+    :param sender: App config that was migrated
+    :param using: Database alias
+    :param kwargs:
+    :return: None
+    """
+    get_search_backend(using).install()
@@ -0,0 +1,122 @@
+"""
+Module for Blog Post Search Backend Tests.
+This module will test the full text index of blog posts.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.test import TestCase
+
+from apps.account.models import Account, User
+from apps.blog.models import BlogPost
+from apps.blog.search.backends import SqliteSearchBackend, get_search_backend
+
+
+class TestSearchBackend(TestCase):
+    """
+    Test Search Backend
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+    ]
+
+    def setUp(self) -> None:
+        self.account = Account.objects.first()
+        self.user = User.objects.first()
+        self.backend = get_search_backend()
+
+        self.whales = self.create_post(
+            title="Whales of the Arctic",
+            excerpt="Bowhead whales",
+            content="Bowhead whales migrate along the Beaufort Sea coast.",
+        )
+        self.caribou = self.create_post(
+            title="Caribou Hunting",
+            excerpt="Caribou",
+            content="Hunting caribou near the coast, far from the whales.",
+        )
+
+    def create_post(self, **kwargs):
+        """
+        Create a blog post.
+        :param kwargs: BlogPost fields
+        :return: BlogPost
+        """
+        return BlogPost.objects.create(
+            account=self.account, author=self.user, status="DRAFT", **kwargs
+        )
+
+    def search(self, term: str) -> list:
+        """
+        Search blog posts by rank.
+        :param term: Search term
+        :return: List of BlogPost
+        """
+        return list(self.backend.search(BlogPost.objects.all(), term).order_by("-rank"))
+
+    def test_backend(self):
+        """
+        Test SQLite databases use the FTS5 backend.
+        """
+
+        self.assertIsInstance(self.backend, SqliteSearchBackend)
+
+    def test_search_rank(self):
+        """
+        Test matches in the title rank above matches in the content.
+        """
+
+        results = self.search("whales")
+
+        self.assertEqual(results, [self.whales, self.caribou])
+        self.assertGreater(results[0].rank, results[1].rank)
+        self.assertIn("<b>", results[0].snippet)
+
+    def test_search_stemming(self):
+        """
+        Test search terms match other forms of the same word.
+        """
+
+        self.assertEqual(self.search("migrating"), [self.whales])
+
+    def test_search_syntax(self):
+        """
+        Test FTS5 query syntax in a search term is matched as text.
+        """
+
+        self.assertEqual(self.search('"caribou" NEAR(the coast'), [self.caribou])
+        self.assertEqual(self.search("   "), [])
+
+    def test_search_update(self):
+        """
+        Test saving a blog post replaces its index entry.
+        """
+
+        self.caribou.content = "Caribou herds."
+        self.caribou.save()
+
+        self.assertEqual(self.search("whales"), [self.whales])
+        self.assertEqual(self.search("herds"), [self.caribou])
+
+    def test_search_delete(self):
+        """
+        Test deleting a blog post removes its index entry.
+        """
+
+        self.whales.delete()
+
+        self.assertEqual(self.search("bowhead"), [])
+
+    def test_rebuild(self):
+        """
+        Test rebuilding the index of blog posts saved without the index.
+        """
+
+        with self.backend.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.backend.table}")
+
+        self.assertEqual(self.search("whales"), [])
+        self.assertEqual(self.backend.rebuild(BlogPost.objects.all()), 2)
+        self.assertEqual(self.search("whales"), [self.whales, self.caribou])
@@ -8,6 +8,7 @@ Version: 1.0
 from rest_framework import serializers
 
 from apps.blog.models import BlogPost
+from apps.common.serializers.projection import ProjectionSerializer
 
 
 class BlogPostSerializer(serializers.ModelSerializer):
@@ -73,6 +74,30 @@ class BlogPostExcerptSerializer(serializers.ModelSerializer):
         ]
 
 
+class BlogPostExcerptProjection(ProjectionSerializer):
+    """
+    BlogPost Excerpt Projection, renders list rows as BlogPostExcerptSerializer
+    """
+
+    serializer_class = BlogPostExcerptSerializer
+
+
+class BlogPostSearchSerializer(BlogPostExcerptSerializer):
+    """
+    BlogPost Search Result Serializer
+    """
+
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+
+    class Meta(BlogPostExcerptSerializer.Meta):
+        """
+        Meta for Serializer
+        """
+
+        fields = BlogPostExcerptSerializer.Meta.fields + ["rank", "snippet"]
+
+
 class CreateBlogPostSerializer(serializers.ModelSerializer):
     """
     Create BlogPost Serializer
@@ -95,3 +120,31 @@ class CreateBlogPostSerializer(serializers.ModelSerializer):
             "is_featured",
             "content",
         ]
+
+
+class BlogPostCounterSerializer(serializers.Serializer):
+    """
+    BlogPost Counter Increment Serializer
+    """
+
+    counter = serializers.ChoiceField(choices=["views", "likes", "dislikes"])
+    amount = serializers.IntegerField(default=1, min_value=1, max_value=100)
+
+    def create(self, validated_data):
+        """
+        No implemented
+        :param validated_data: None
+        :return:
+        """
+        return validated_data
+
+    def update(self, instance: BlogPost, validated_data):
+        """
+        Buffer the counter increment of a blog post.
+        :param instance: BlogPost
+        :param validated_data: Counter and amount
+        :return: Pending delta of the counter
+        """
+        return instance.increment(
+            field=validated_data["counter"], amount=validated_data["amount"]
+        )
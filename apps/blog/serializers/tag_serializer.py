@@ -31,6 +31,20 @@ class TagSerializer(serializers.ModelSerializer):
         ]
 
 
+class TagCloudSerializer(serializers.ModelSerializer):
+    """
+    Tag Cloud Serializer
+    """
+
+    class Meta:
+        """
+        Meta for Serializer
+        """
+
+        model = Tag
+        fields = ["id", "name", "slug", "post_count", "published_post_count"]
+
+
 class CreateTagSerializer(serializers.ModelSerializer):
     """
     Create Tag Serializer
@@ -0,0 +1,15 @@
+"""
+Module for Blog Post signals.
+This module contains the signals sent when blog posts are published or unpublished. They
+are sent once per batch of posts, with the list of posts whose status changed.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.dispatch import Signal
+
+# Sent with "posts", once they are written with a published status.
+posts_published = Signal()
+
+# Sent with "posts", once they are written with any other status.
+posts_unpublished = Signal()
@@ -0,0 +1,152 @@
+"""
+Module for Post Count Tests.
+This module will test the post counts of tags and categories as blog posts are tagged,
+published, and deleted.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.account.models import Account, User
+from apps.blog.models import BlogPost, Category, Tag
+from apps.common.pagination.counts import get_count_version
+
+
+class TestPostCounts(TestCase):
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/category.json",
+        "tests/tag.json",
+    ]
+
+    def setUp(self):
+        self.tags = list(Tag.objects.order_by("name"))
+        self.category = Category.objects.get(name="Python")
+        self.post = self.create_post("First")
+
+    def create_post(self, title: str, status: str = "DRAFT") -> BlogPost:
+        """
+        Create a blog post.
+        :param title: Title
+        :param status: Status
+        :return: Blog post
+        """
+        return BlogPost.objects.create(
+            account=Account.objects.first(),
+            author=User.objects.first(),
+            status=status,
+            title=title,
+            excerpt="Excerpt.",
+            content="Content.",
+        )
+
+    def get_counts(self, instance) -> tuple:
+        """
+        Get the stored post counts of a tag or category.
+        :param instance: Tag or category
+        :return: Tuple of post count and published post count
+        """
+        instance.refresh_from_db()
+
+        return instance.post_count, instance.published_post_count
+
+    def test_counts_follow_tags(self):
+        """
+        Test counts follow tags added, removed, and cleared from either side.
+        """
+        tag, other = self.tags[:2]
+        published = self.create_post("Second", status="PUBLISHED")
+
+        self.post.tags.add(tag, other)
+        published.tags.add(tag)
+        # Adding an existing tag is not counted twice.
+        published.tags.add(tag)
+
+        self.assertEqual(self.get_counts(tag), (2, 1))
+        self.assertEqual(self.get_counts(other), (1, 0))
+
+        # Removing a tag the post does not have is not counted.
+        published.tags.remove(tag, other)
+        self.post.tags.clear()
+
+        self.assertEqual(self.get_counts(tag), (0, 0))
+        self.assertEqual(self.get_counts(other), (0, 0))
+
+        tag.blogpost_set.add(self.post, published)
+
+        self.assertEqual(self.get_counts(tag), (2, 1))
+
+        tag.blogpost_set.clear()
+
+        self.assertEqual(self.get_counts(tag), (0, 0))
+
+    def test_counts_follow_status(self):
+        """
+        Test published counts follow status transitions and deletes.
+        """
+        self.post.categories.add(self.category)
+        self.post.status = "PUBLISHED"
+        self.post.save()
+
+        self.assertEqual(self.get_counts(self.category), (1, 1))
+
+        self.post.status = "ARCHIVED"
+        BlogPost.bulk_update_validated([self.post], ["status"])
+
+        self.assertEqual(self.get_counts(self.category), (1, 0))
+
+        self.post.delete()
+
+        self.assertEqual(self.get_counts(self.category), (0, 0))
+
+    def test_counts_follow_queryset_deletes(self):
+        """
+        Test deletes skipping the model, ie queryset deletes and cascades, and batch
+        deletes remove counts once.
+        """
+        tag = self.tags[0]
+        published = self.create_post("Second", status="PUBLISHED")
+        other = self.create_post("Third", status="PUBLISHED")
+
+        for post in (self.post, published, other):
+            post.tags.add(tag)
+
+        self.assertEqual(self.get_counts(tag), (3, 2))
+
+        BlogPost.objects.filter(pk=self.post.pk).delete()
+
+        self.assertEqual(self.get_counts(tag), (2, 2))
+
+        BlogPost.bulk_delete([published, other])
+
+        self.assertEqual(self.get_counts(tag), (0, 0))
+
+    def test_counts_invalidate_cached_counts(self):
+        """
+        Test count updates invalidate cached pagination counts of the related model.
+        """
+        version = get_count_version(Tag)
+
+        self.post.tags.add(self.tags[0])
+
+        self.assertNotEqual(get_count_version(Tag), version)
+
+    def test_repair_post_counts(self):
+        """
+        Test repairing counts recomputes them in chunks.
+        """
+        self.post.tags.set(self.tags)
+        Tag.objects.update(post_count=7, published_post_count=7)
+
+        out = StringIO()
+        call_command("repair_post_counts", batch_size=1, stdout=out)
+
+        self.assertIn(
+            f"Repaired the post counts of {len(self.tags)} tags.", out.getvalue()
+        )
+        self.assertEqual(self.get_counts(self.tags[0]), (1, 0))
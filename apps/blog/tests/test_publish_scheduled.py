@@ -0,0 +1,98 @@
+"""
+Module for Publish Scheduled Tests.
+This module will test publishing scheduled blog posts once they are due.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.account.models import Account, Followers, User
+from apps.blog.models import BlogPost, Tag, TimelineEntry
+from apps.blog.signals import posts_published
+
+
+class TestPublishScheduled(TestCase):
+    fixtures = ["tests/account.json", "tests/user.json", "tests/tag.json"]
+
+    def setUp(self):
+        self.account = Account.objects.first()
+        self.tag = Tag.objects.first()
+        self.follower = Account.objects.create(
+            account_name="Follower", contact_email="follower@kencar.ca"
+        )
+        Followers.objects.follow(self.follower.pk, self.account.pk)
+
+    def create_post(self, title: str, minutes: int) -> BlogPost:
+        """
+        Create a scheduled blog post.
+        :param title: Title
+        :param minutes: Minutes until the post is due
+        :return: Blog post
+        """
+        post = BlogPost.objects.create(
+            account=self.account,
+            author=User.objects.first(),
+            status="SCHEDULED",
+            title=title,
+            excerpt="Excerpt.",
+            content="Content.",
+            published_date=timezone.now() + timedelta(minutes=minutes),
+        )
+        post.tags.add(self.tag)
+
+        return post
+
+    def test_publish_due(self):
+        """
+        Test due posts are published in batches, with hooks run once per batch.
+        """
+        due = [self.create_post(f"Due {i}", -i - 1) for i in range(3)]
+        later = self.create_post("Later", 60)
+        batches = []
+
+        def receiver(sender, posts, **kwargs):
+            batches.append(len(posts))
+
+        posts_published.connect(receiver)
+
+        try:
+            out = StringIO()
+            call_command("publish_scheduled", "--batch-size", "2", stdout=out)
+        finally:
+            posts_published.disconnect(receiver)
+
+        self.assertIn("Published 3 scheduled blog posts.", out.getvalue())
+        self.assertEqual(batches, [2, 1])
+        self.assertEqual(
+            set(
+                BlogPost.objects.filter(status="PUBLISHED").values_list("pk", flat=True)
+            ),
+            {post.pk for post in due},
+        )
+        self.assertEqual(BlogPost.objects.get(pk=later.pk).status, "SCHEDULED")
+        self.assertEqual(TimelineEntry.objects.filter(account=self.follower).count(), 3)
+
+        self.tag.refresh_from_db()
+
+        self.assertEqual((self.tag.post_count, self.tag.published_post_count), (4, 3))
+
+        call_command("publish_scheduled", stdout=out)
+
+        self.assertEqual(TimelineEntry.objects.count(), 3)
+
+    def test_scheduled_needs_date(self):
+        """
+        Test scheduled posts cannot be saved without a published date.
+        """
+        post = self.create_post("Undated", 60)
+        post.published_date = None
+
+        with self.assertRaises(ValidationError):
+            post.save()
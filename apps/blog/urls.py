@@ -8,20 +8,38 @@ Version: 1.0
 
 from django.urls import path
 
-from apps.blog.views import category_api, tag_api, blog_api
+from apps.blog.views import category_api, tag_api, blog_api, feed_api
 
 urlpatterns = [
     # Blog Post Endpoints
     path("blogs", blog_api.BlogListLApi.as_view(), name="BlogListLApiV1"),
+    path("blogs/search", blog_api.BlogSearchApi.as_view(), name="BlogSearchApiV1"),
     path(
         "blogs/<uuid:pk>",
         blog_api.BlogDetailApi.as_view(),
         name="TagDetailApiV1",
     ),
+    path(
+        "accounts/<uuid:account>/blogs/<slug:slug>",
+        blog_api.BlogSlugDetailApi.as_view(),
+        name="BlogSlugDetailApiV1",
+    ),
+    path(
+        "blogs/<uuid:pk>/counters",
+        blog_api.BlogCounterApi.as_view(),
+        name="BlogCounterApiV1",
+    ),
+    # Feed Endpoints
+    path("feed", feed_api.FeedApi.as_view(), name="FeedApiV1"),
     # Category Endpoints
     path(
         "categories", category_api.CategoryListLApi.as_view(), name="CategoryListLApiV1"
     ),
+    path(
+        "categories/tree",
+        category_api.CategoryTreeApi.as_view(),
+        name="CategoryTreeApiV1",
+    ),
     path(
         "categories/<uuid:pk>",
         category_api.CategoryDetailApi.as_view(),
@@ -29,6 +47,7 @@ urlpatterns = [
     ),
     # Tag Endpoints
     path("tags", tag_api.TagListLApi.as_view(), name="TagListLApiV1"),
+    path("tags/cloud", tag_api.TagCloudApi.as_view(), name="TagCloudApiV1"),
     path(
         "tags/<uuid:pk>",
         tag_api.TagDetailApi.as_view(),
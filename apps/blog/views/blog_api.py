@@ -6,21 +6,32 @@ Authors: Kenneth Carmichael (kencar17)
 Date: March 17th 2023
 Version: 1.0
 """
+import uuid
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import Http404
-from rest_framework import filters
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
 
-from apps.blog.models import BlogPost
+from apps.authentication.backends import CachedJWTAuthentication
+from apps.blog.models import BlogPost, Category
+from apps.blog.search.backends import get_search_backend
+from apps.blog.search.filters import BlogSearchFilter
 from apps.blog.serializers.blog_serializers import (
     BlogPostSerializer,
+    BlogPostCounterSerializer,
+    BlogPostExcerptProjection,
     BlogPostExcerptSerializer,
+    BlogPostSearchSerializer,
     CreateBlogPostSerializer,
 )
+from apps.blog.slugs import resolve_slug
 from apps.common.mixins.list_create_mixin import BlogListCreateMixin
 from apps.common.mixins.retrieve_update_destroy_mixin import (
     BlogRetrieveUpdateDestroyMixin,
 )
+from apps.common.pagination.counts import COUNT_ESTIMATED
+from apps.common.utilities.utilities import json_response
 
 
 class BlogListLApi(BlogListCreateMixin):
@@ -28,9 +39,8 @@ class BlogListLApi(BlogListCreateMixin):
     Get a List of users bases on query params, or create a new blog post.
     """
 
-    authentication_classes = [JWTAuthentication]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ["title", "excerpt"]
+    authentication_classes = [CachedJWTAuthentication]
+    filter_backends = [BlogSearchFilter]
     ordering_fields = [
         "created_date",
         "updated_date",
@@ -39,18 +49,16 @@ class BlogListLApi(BlogListCreateMixin):
         "title",
     ]
     serializer_class = BlogPostExcerptSerializer
+    projection_class = BlogPostExcerptProjection
     create_serializer_class = CreateBlogPostSerializer
+    count_mode = COUNT_ESTIMATED
 
     def get_queryset(self):
         """
         This view should return a list of all users and perform any additional filtering.
         """
         ordering = self.request.query_params.get("ordering", "-created_date")
-        blogs = (
-            BlogPost.objects.select_related("account", "author")
-            .all()
-            .order_by(ordering)
-        )
+        blogs = BlogPost.objects.all().order_by(ordering)
 
         if "status" in self.request.query_params:
             blogs = blogs.filter(status=self.request.query_params["status"])
@@ -64,6 +72,54 @@ class BlogListLApi(BlogListCreateMixin):
         if "author" in self.request.query_params:
             blogs = blogs.filter(author=self.request.query_params["author"])
 
+        if "category_tree" in self.request.query_params:
+            blogs = blogs.filter(pk__in=self.get_category_tree_posts())
+
+        return blogs
+
+    def get_category_tree_posts(self):
+        """
+        Get the ids of blog posts in the "category_tree" category or any category below
+        it, as a subquery.
+        :return: Queryset of blog post ids
+        """
+        try:
+            category = uuid.UUID(self.request.query_params["category_tree"])
+        except ValueError as exc:
+            raise ValidationError({"category_tree": "Must be a valid UUID."}) from exc
+
+        return BlogPost.categories.through.objects.filter(
+            category__in=Category.objects.subtree(category)
+        ).values("blogpost_id")
+
+
+class BlogSearchApi(BlogListLApi):
+    """
+    Search blog posts by relevance, with highlighted snippets of the matching content.
+    """
+
+    http_method_names = ["get", "options"]
+    filter_backends = []
+    serializer_class = BlogPostSearchSerializer
+    projection_class = None
+
+    def get_queryset(self):
+        """
+        This view should return blog posts matching the "q" query param, ordered by rank
+        unless an ordering is requested.
+        """
+        term = self.request.query_params.get("q", "").strip()
+
+        if not term:
+            raise ValidationError({"q": "A search term is required."})
+
+        blogs = get_search_backend(BlogPost.objects.db).search(
+            super().get_queryset(), term
+        )
+
+        if "ordering" not in self.request.query_params:
+            blogs = blogs.order_by("-rank", "-created_date")
+
         return blogs
 
 
@@ -72,7 +128,8 @@ class BlogDetailApi(BlogRetrieveUpdateDestroyMixin):
     Get, update, or delete individual blog post information.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
+    detail_cache = True
     serializer_class = BlogPostSerializer
 
     def get_object(self):
@@ -80,9 +137,8 @@ class BlogDetailApi(BlogRetrieveUpdateDestroyMixin):
         Returns the object the view is displaying.
         """
         try:
-            blog = BlogPost.objects.select_related("account", "author").get(
-                pk=self.kwargs["pk"]
-            )
+            blogs = self.plan_queryset(BlogPost.objects.all())
+            blog = blogs.get(pk=self.kwargs["pk"])
         except ObjectDoesNotExist as exc:
             raise Http404 from exc
 
@@ -90,3 +146,76 @@ class BlogDetailApi(BlogRetrieveUpdateDestroyMixin):
         self.check_object_permissions(self.request, blog)
 
         return blog
+
+
+class BlogSlugDetailApi(BlogDetailApi):
+    """
+    Get, update, or delete individual blog post information, by the slug of the blog
+    post within its account.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Resolve the slug to the blog post primary key, so the blog post is then found
+        and cached as by its primary key.
+        """
+        super().initial(request, *args, **kwargs)
+
+        pk = resolve_slug(
+            BlogPost.objects.all(), self.kwargs["account"], self.kwargs["slug"]
+        )
+
+        if pk is None:
+            raise Http404
+
+        self.kwargs["pk"] = pk
+
+
+class BlogCounterApi(GenericAPIView):
+    """
+    Increment the views, likes, or dislikes counter of a blog post. Increments are
+    buffered and written in batches, so counters read back lag by up to one flush
+    interval.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+    serializer_class = BlogPostCounterSerializer
+
+    def get_object(self):
+        """
+        Returns the object the view is displaying.
+        """
+        try:
+            blog = BlogPost.objects.only("id").get(pk=self.kwargs["pk"])
+        except ObjectDoesNotExist as exc:
+            raise Http404 from exc
+
+        # May raise a permission denied
+        self.check_object_permissions(self.request, blog)
+
+        return blog
+
+    def post(self, request, *args, **kwargs):
+        """
+        Increment a blog post counter.
+        :param request: request
+        :return: Pending delta of the counter.
+        """
+
+        serializer = self.get_serializer_class()
+        serializer = serializer(data=request.data, many=False)
+
+        if not serializer.is_valid():
+            return json_response(message=serializer.errors, error=True)
+
+        pending = serializer.update(
+            instance=self.get_object(), validated_data=serializer.validated_data
+        )
+
+        return json_response(
+            data={
+                "id": str(self.kwargs["pk"]),
+                "counter": serializer.validated_data["counter"],
+                "pending": pending,
+            }
+        )
@@ -9,8 +9,9 @@ Version: 1.0
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import Http404
 from rest_framework import filters
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.generics import GenericAPIView
 
+from apps.authentication.backends import CachedJWTAuthentication
 from apps.blog.models import Category
 from apps.blog.serializers.category_serializer import (
     CategorySerializer,
@@ -20,6 +21,7 @@ from apps.common.mixins.list_create_mixin import BlogListCreateMixin
 from apps.common.mixins.retrieve_update_destroy_mixin import (
     BlogRetrieveUpdateDestroyMixin,
 )
+from apps.common.utilities.utilities import json_response
 
 # TODO: How to do delete childs of parents
 
@@ -29,7 +31,7 @@ class CategoryListLApi(BlogListCreateMixin):
     Get a List of users bases on query params, or create a new account.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [filters.SearchFilter]
     search_fields = ["name", "description"]
     serializer_class = CategorySerializer
@@ -52,7 +54,8 @@ class CategoryDetailApi(BlogRetrieveUpdateDestroyMixin):
     Get, update, or delete individual category information.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
+    detail_cache = True
     serializer_class = CategorySerializer
 
     def get_object(self):
@@ -60,7 +63,7 @@ class CategoryDetailApi(BlogRetrieveUpdateDestroyMixin):
         Returns the object the view is displaying.
         """
         try:
-            category = Category.objects.select_related("parent").get(
+            category = self.plan_queryset(Category.objects.all()).get(
                 pk=self.kwargs["pk"]
             )
         except ObjectDoesNotExist as exc:
@@ -70,3 +73,20 @@ class CategoryDetailApi(BlogRetrieveUpdateDestroyMixin):
         self.check_object_permissions(self.request, category)
 
         return category
+
+
+class CategoryTreeApi(GenericAPIView):
+    """
+    Get every category nested below its parent, ie for navigation menus. The tree is
+    cached until a category changes.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Get the category tree.
+        :param request: request
+        :return: Json of root categories, each with its "children".
+        """
+        return json_response(data=Category.objects.tree())
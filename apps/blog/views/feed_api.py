@@ -0,0 +1,53 @@
+"""
+Module for Feed Api Endpoints.
+This module determines the home feed api endpoint, the published blog posts of the
+accounts followed by the account of the request user. Supported methods are Get.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from rest_framework.exceptions import ValidationError
+
+from apps.authentication.backends import CachedJWTAuthentication
+from apps.blog.feed import FeedPagination
+from apps.blog.models import BlogPost
+from apps.blog.serializers.blog_serializers import BlogPostExcerptSerializer
+from apps.common.mixins.list_create_mixin import BlogListCreateMixin
+from apps.common.utilities.utilities import json_response
+
+
+class FeedApi(BlogListCreateMixin):
+    """
+    Get the home feed, newest published first. Pages are found by cursor only.
+    """
+
+    http_method_names = ["get", "options"]
+    authentication_classes = [CachedJWTAuthentication]
+    serializer_class = BlogPostExcerptSerializer
+    cursor_ordering = "-published_date"
+
+    def get_queryset(self):
+        """
+        This view should return the blog posts a feed page is loaded from.
+        """
+        return self.plan_queryset(BlogPost.objects.all())
+
+    def get(self, request, *args, **kwargs):
+        """
+        Get a page of the home feed.
+        :param request: request
+        :return: Json list of blog posts.
+        """
+        pagination = FeedPagination()
+
+        try:
+            page = pagination.paginate_feed(
+                queryset=self.get_queryset(),
+                request=request,
+                account=request.user.account_id,
+            )
+        except ValidationError as exc:
+            message = {"message": "Get Failed", "errors": exc.detail}
+            return json_response(message=message, error=True)
+
+        return self.get_page_response(pagination=pagination, page=page)
@@ -10,10 +10,13 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.http import Http404
 from rest_framework import filters
 
-from rest_framework_simplejwt.authentication import JWTAuthentication
-
+from apps.authentication.backends import CachedJWTAuthentication
 from apps.blog.models import Tag
-from apps.blog.serializers.tag_serializer import TagSerializer, CreateTagSerializer
+from apps.blog.serializers.tag_serializer import (
+    TagCloudSerializer,
+    TagSerializer,
+    CreateTagSerializer,
+)
 from apps.common.mixins.list_create_mixin import BlogListCreateMixin
 from apps.common.mixins.retrieve_update_destroy_mixin import (
     BlogRetrieveUpdateDestroyMixin,
@@ -25,7 +28,7 @@ class TagListLApi(BlogListCreateMixin):
     Get a List of users bases on query params, or create a new account.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [filters.SearchFilter]
     search_fields = ["name", "description"]
 
@@ -34,12 +37,27 @@ class TagListLApi(BlogListCreateMixin):
     queryset = Tag.objects.all().order_by("-created_date", "name")
 
 
+class TagCloudApi(BlogListCreateMixin):
+    """
+    Get tags with published blog posts, the most used first. Counts are kept on the
+    tags, so the list is read straight from the count index.
+    """
+
+    http_method_names = ["get", "options"]
+    authentication_classes = [CachedJWTAuthentication]
+    serializer_class = TagCloudSerializer
+    queryset = Tag.objects.filter(published_post_count__gt=0).order_by(
+        "-published_post_count", "name"
+    )
+
+
 class TagDetailApi(BlogRetrieveUpdateDestroyMixin):
     """
     Get, update, or delete individual category information.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
+    detail_cache = True
     serializer_class = TagSerializer
 
     def get_object(self):
@@ -47,7 +65,7 @@ class TagDetailApi(BlogRetrieveUpdateDestroyMixin):
         Returns the object the view is displaying.
         """
         try:
-            tag = Tag.objects.get(pk=self.kwargs["pk"])
+            tag = self.plan_queryset(Tag.objects.all()).get(pk=self.kwargs["pk"])
         except ObjectDoesNotExist as exc:
             raise Http404 from exc
 
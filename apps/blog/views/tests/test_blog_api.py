@@ -6,15 +6,22 @@ Date: March 17th 2023
 Version: 1.0
 """
 import json
+from io import StringIO
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.account.models import User, Account
-from apps.blog.models import BlogPost
+from apps.blog.models import BlogPost, Category, Tag
+from apps.blog.models.blog import blog_counters
+from apps.blog.slugs import slug_cache
 
 
 class TestBlogPostEndpoint(TestCase):
@@ -26,6 +33,7 @@ class TestBlogPostEndpoint(TestCase):
     ]
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = User.objects.first()
         self.account = Account.objects.first()
@@ -46,6 +54,145 @@ class TestBlogPostEndpoint(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, expected)
 
+    def test_get_blog_post_list_count_mode(self):
+        """
+        Test get blog post list endpoint reports the count mode.
+        :return:
+        """
+
+        response = self.client.get("/api/blogs")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Count-Mode"], "exact")
+
+    def test_get_blog_post_list_category_tree(self):
+        """
+        Test get blog post list endpoint filtered to a category subtree.
+        :return:
+        """
+
+        root = Category.objects.create(name="Culture", description="Culture")
+        child = Category.objects.create(name="Arctic", description="A", parent=root)
+        other = Category.objects.create(name="Travel", description="Travel")
+        BlogPost.objects.first().categories.set([child])
+
+        response = self.client.get(f"/api/blogs?category_tree={root.pk}")
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(content["count"], 1)
+
+        response = self.client.get(f"/api/blogs?category_tree={other.pk}")
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(content["count"], 0)
+
+        response = self.client.get("/api/blogs?category_tree=python")
+
+        self.assertTrue(json.loads(response.content)["is_error"])
+
+    def test_get_blog_post_list_query_count(self):
+        """
+        Test get blog post list endpoint runs the same number of queries for any page
+        size.
+        :return:
+        """
+
+        category = Category.objects.create(name="Arctic", description="Arctic")
+        tags = list(Tag.objects.all())
+
+        for number in range(10):
+            blog = BlogPost.objects.create(
+                account=self.account,
+                author=self.user,
+                status="DRAFT",
+                title=f"Inuvialuit Culture {number}",
+                excerpt="Inuvialuit Culture",
+                content="Inuvialuit Culture",
+            )
+            blog.categories.set([category])
+            blog.tags.set(tags)
+
+        queries = []
+        # Authenticate once first, repeat requests are served from the auth cache.
+        self.client.get("/api/blogs")
+
+        for page_size in (2, 10):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get("/api/blogs", data={"page_size": page_size})
+
+            results = json.loads(response.content)["content"]["results"]
+            self.assertEqual(len(results), page_size)
+            self.assertEqual(results[0]["tags"], [str(tag.id) for tag in tags])
+            queries.append(len(context.captured_queries))
+
+        self.assertEqual(queries[0], queries[1])
+
+    def test_get_blog_post_list_streamed(self):
+        """
+        Test get blog post list endpoint streams large pages with the same body.
+        :return:
+        """
+
+        for number in range(5):
+            BlogPost.objects.create(
+                account=self.account,
+                author=self.user,
+                status="DRAFT",
+                title=f"Inuvialuit Culture {number}",
+                excerpt="Inuvialuit Culture",
+                content="Inuvialuit Culture",
+            )
+
+        with self.settings(JSON_STREAM_MIN_ROWS=1000):
+            buffered = self.client.get("/api/blogs")
+
+        with self.settings(JSON_STREAM_MIN_ROWS=5):
+            streamed = self.client.get("/api/blogs")
+
+        self.assertFalse(buffered.streaming)
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed["X-Count-Mode"], "exact")
+        self.assertEqual(b"".join(streamed.streaming_content), buffered.content)
+
+    def test_get_blog_post_list_fields(self):
+        """
+        Test get blog post list endpoint returns and loads only the requested fields.
+        :return:
+        """
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                "/api/blogs", data={"fields": "id,title,created_date"}
+            )
+
+        sql = " ".join(query["sql"] for query in context.captured_queries)
+        results = json.loads(response.content)["content"]["results"]
+
+        self.assertEqual(list(results[0]), ["id", "created_date", "title"])
+        self.assertNotIn('"excerpt"', sql)
+        self.assertNotIn("blog_blogpost_tags", sql)
+
+        response = self.client.get("/api/blogs", data={"exclude": "excerpt,tags"})
+        results = json.loads(response.content)["content"]["results"]
+
+        self.assertNotIn("excerpt", results[0])
+        self.assertNotIn("tags", results[0])
+        self.assertIn("categories", results[0])
+
+    def test_get_blog_post_list_fields_fail(self):
+        """
+        Test get blog post list endpoint rejects unknown fields.
+        :return:
+        """
+
+        response = self.client.get("/api/blogs", data={"fields": "id,body"})
+        content = json.loads(response.content)
+
+        self.assertTrue(content["is_error"])
+        self.assertEqual(
+            content["error"]["errors"], {"fields": "Unknown fields: body."}
+        )
+
     def test_get_blog_post_list_filter_status(self):
         """
         Test get blog post list endpoint.
@@ -98,6 +245,101 @@ class TestBlogPostEndpoint(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, expected)
 
+    def test_get_blog_post_list_search(self):
+        """
+        Test get blog post list endpoint searches content and orders by rank.
+        :return:
+        """
+
+        call_command("rebuild_search_index", stdout=StringIO())
+        blog = BlogPost.objects.create(
+            account=self.account,
+            author=self.user,
+            status="DRAFT",
+            title="Mukluks",
+            excerpt="Sewing mukluks",
+            content="Sewing mukluks from caribou hide.",
+        )
+
+        response = self.client.get("/api/blogs", data={"search": "mukluks"})
+        results = json.loads(response.content)["content"]["results"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in results],
+            [str(blog.id), "335ce286-c177-4f9a-af25-05c3a94975fb"],
+        )
+
+    def test_search_blog_posts(self):
+        """
+        Test search blog posts endpoint.
+        :return:
+        """
+
+        call_command("rebuild_search_index", stdout=StringIO())
+
+        response = self.client.get("/api/blogs/search", data={"q": "Tuktoyaktuk"})
+        results = json.loads(response.content)["content"]["results"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(results), 1)
+        self.assertIn("<b>Tuktoyaktuk</b>", results[0]["snippet"])
+        self.assertIsInstance(results[0]["rank"], float)
+
+        response = self.client.get("/api/blogs/search", data={"q": "penguins"})
+
+        self.assertEqual(json.loads(response.content)["content"]["results"], [])
+
+    def test_search_blog_posts_fail(self):
+        """
+        Test search blog posts endpoint without a term.
+        :return:
+        """
+
+        response = self.client.get("/api/blogs/search")
+        expected = b'{"is_error": true, "error": {"message": "Get Failed", "errors": {"q": "A search term is required."}}, "content": {}}'
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, expected)
+
+    def test_increment_blog_post_counter(self):
+        """
+        Test increment blog post counter endpoint.
+        :return:
+        """
+
+        blog = BlogPost.objects.first()
+
+        for _ in range(3):
+            response = self.client.post(
+                f"/api/blogs/{blog.id}/counters", data={"counter": "likes"}
+            )
+
+        expected = {"id": str(blog.id), "counter": "likes", "pending": 3}
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["content"], expected)
+
+        blog_counters.flush()
+        blog.refresh_from_db()
+
+        self.assertEqual(blog.likes, 3)
+
+    def test_increment_blog_post_counter_fail(self):
+        """
+        Test increment blog post counter endpoint with an unknown counter.
+        :return:
+        """
+
+        response = self.client.post(
+            "/api/blogs/335ce286-c177-4f9a-af25-05c3a94975fb/counters",
+            data={"counter": "title"},
+        )
+        expected = b'{"is_error": true, "error": {"counter": ["\\"title\\" is not a valid choice."]}, "content": {}}'
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, expected)
+
     def test_create_new_blog_post(self):
         """
         Test post blog post endpoint to create a new blog post.
@@ -206,6 +448,149 @@ class TestBlogPostEndpoint(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertDictEqual(ret, expected)
 
+    def test_get_blog_post_cached(self):
+        """
+        Test get blog post endpoint serves repeat hits from the detail cache until the
+        post changes.
+        :return:
+        """
+
+        url = "/api/blogs/335ce286-c177-4f9a-af25-05c3a94975fb"
+        blog = BlogPost.objects.get(pk="335ce286-c177-4f9a-af25-05c3a94975fb")
+        miss = self.client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            hit = self.client.get(url)
+
+        tables = " ".join(query["sql"] for query in context.captured_queries)
+
+        self.assertEqual(miss["X-Detail-Cache"], "MISS")
+        self.assertEqual(hit["X-Detail-Cache"], "HIT")
+        self.assertEqual(hit.content, miss.content)
+        self.assertNotIn("blog_blogpost", tables)
+
+        blog.title = "Cached Title"
+        blog.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response["X-Detail-Cache"], "MISS")
+        self.assertEqual(
+            json.loads(response.content)["content"]["title"], "Cached Title"
+        )
+
+        blog.tags.set(Tag.objects.all())
+        response = self.client.get(url)
+
+        self.assertEqual(response["X-Detail-Cache"], "MISS")
+        self.assertEqual(
+            json.loads(response.content)["content"]["tags"],
+            [str(tag.id) for tag in Tag.objects.all()],
+        )
+
+        blog.increment("views")
+        blog_counters.flush()
+        response = self.client.get(url)
+
+        self.assertEqual(json.loads(response.content)["content"]["views"], 1)
+
+    def test_get_blog_post_by_slug(self):
+        """
+        Test get blog post endpoint by account and slug resolves without a slug query
+        once cached, and follows title changes.
+        :return:
+        """
+
+        blog = BlogPost.objects.get(pk="335ce286-c177-4f9a-af25-05c3a94975fb")
+        url = f"/api/accounts/{blog.account_id}/blogs/{blog.slug}"
+        miss = self.client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            hit = self.client.get(url)
+
+        tables = " ".join(query["sql"] for query in context.captured_queries)
+
+        self.assertEqual(json.loads(miss.content)["content"]["id"], str(blog.pk))
+        self.assertEqual(hit["X-Detail-Cache"], "HIT")
+        self.assertNotIn("blog_blogpost", tables)
+
+        blog.title = "Renamed Post"
+        blog.save()
+
+        response = json.loads(self.client.get(url).content)
+
+        self.assertTrue(response["is_error"])
+
+        url = f"/api/accounts/{blog.account_id}/blogs/renamed-post"
+        response = json.loads(self.client.get(url).content)
+
+        self.assertEqual(response["content"]["title"], "Renamed Post")
+
+    @override_settings(CACHE_SHARED=False)
+    def test_get_blog_post_local_cache(self):
+        """
+        Test get blog post endpoint skips the detail cache when the cache is per
+        process, so posts changed by other processes are not served stale.
+        :return:
+        """
+
+        url = "/api/blogs/335ce286-c177-4f9a-af25-05c3a94975fb"
+        self.client.get(url)
+
+        BlogPost.objects.filter(pk="335ce286-c177-4f9a-af25-05c3a94975fb").update(
+            title="Changed Elsewhere"
+        )
+        response = self.client.get(url)
+
+        self.assertNotIn("X-Detail-Cache", response)
+        self.assertEqual(
+            json.loads(response.content)["content"]["title"], "Changed Elsewhere"
+        )
+
+    @override_settings(CACHE_SHARED=False)
+    def test_get_blog_post_by_slug_local_cache(self):
+        """
+        Test get blog post endpoint by account and slug looks up every slug when the
+        cache is per process, so slugs renamed by other processes are not served.
+        :return:
+        """
+
+        slug_cache.clear()
+        blog = BlogPost.objects.get(pk="335ce286-c177-4f9a-af25-05c3a94975fb")
+        url = f"/api/accounts/{blog.account_id}/blogs/{blog.slug}"
+        self.client.get(url)
+
+        BlogPost.objects.filter(pk=blog.pk).update(slug="renamed-post")
+        response = json.loads(self.client.get(url).content)
+
+        self.assertTrue(response["is_error"])
+        self.assertEqual(len(slug_cache), 0)
+
+    def test_get_blog_post_fields(self):
+        """
+        Test get blog post endpoint leaves out excluded fields without loading them,
+        and caches each field selection apart.
+        :return:
+        """
+
+        url = "/api/blogs/335ce286-c177-4f9a-af25-05c3a94975fb"
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, data={"exclude": "content,tags"})
+
+        sql = " ".join(query["sql"] for query in context.captured_queries)
+        content = json.loads(response.content)["content"]
+
+        self.assertNotIn("content", content)
+        self.assertNotIn("tags", content)
+        self.assertIn("categories", content)
+        self.assertNotIn('"content"', sql)
+        self.assertNotIn("blog_blogpost_tags", sql)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response["X-Detail-Cache"], "MISS")
+        self.assertIn("content", json.loads(response.content)["content"])
+
     def test_get_blog_post_fail(self):
         """
         Test get blog post endpoint to get a blog post fail.
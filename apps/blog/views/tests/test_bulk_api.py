@@ -0,0 +1,173 @@
+"""
+Module for Bulk Endpoints.
+This module will test bulk create, update, and delete of list endpoints.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import Account, User
+from apps.blog.models import BlogPost, Category, Tag
+
+
+class TestBulkEndpoint(TestCase):
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/category.json",
+        "tests/tag.json",
+        "tests/blog.json",
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.first()
+        self.account = Account.objects.first()
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}"
+        )
+
+    def get_post(self, title: str) -> dict:
+        """
+        Get a blog post item.
+        :param title: Title
+        :return: Item
+        """
+        return {
+            "account": str(self.account.id),
+            "author": str(self.user.id),
+            "status": "DRAFT",
+            "title": title,
+            "excerpt": "Excerpt.",
+            "content": "Content.",
+            "categories": [
+                str(pk) for pk in Category.objects.values_list("pk", flat=True)
+            ],
+            "tags": [str(pk) for pk in Tag.objects.values_list("pk", flat=True)],
+        }
+
+    def test_bulk_create_blog_posts(self):
+        """
+        Test a batch of blog posts is created with bounded queries, invalid items are
+        reported by position.
+        """
+        items = [self.get_post(f"Bulk Post {i}") for i in range(20)]
+        items[3]["author"] = "10c331ef-0000-488e-8c0f-e398d7c8d9d3"
+        items[5] = "not an object"
+
+        # Queries per relation and table, not per item.
+        with self.assertNumQueries(19):
+            response = self.client.post("/api/blogs", data=items, format="json")
+
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(content["created"], 18)
+        self.assertEqual([error["index"] for error in content["errors"]], [3, 5])
+        self.assertIn("author", content["errors"][0]["errors"])
+        self.assertEqual(
+            [result["index"] for result in content["results"]],
+            [i for i in range(20) if i not in (3, 5)],
+        )
+
+        post = BlogPost.objects.get(title="Bulk Post 19")
+
+        self.assertEqual(post.slug, "bulk-post-19")
+        self.assertEqual(post.categories.count(), Category.objects.count())
+        self.assertEqual(post.tags.count(), Tag.objects.count())
+
+    def test_bulk_create_ndjson_conflicts(self):
+        """
+        Test an NDJSON batch with a duplicate within it creates every other item.
+        """
+        lines = [
+            {"name": "Rust", "description": "Rust."},
+            {"name": "Go", "description": "Go."},
+            {"name": "Rust", "description": "Rust again."},
+        ]
+        body = "\n".join(json.dumps(line) for line in lines) + "\n\n"
+
+        response = self.client.post(
+            "/api/tags", data=body, content_type="application/x-ndjson"
+        )
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(content["created"], 2)
+        self.assertEqual(content["errors"][0]["index"], 2)
+        self.assertEqual(Tag.objects.filter(name__in=["Rust", "Go"]).count(), 2)
+
+    def test_bulk_create_too_many(self):
+        """
+        Test batches over the item limit are rejected.
+        """
+        with self.settings(BULK_MAX_ITEMS=1):
+            response = self.client.post("/api/tags", data=[{}, {}], format="json")
+
+        self.assertTrue(json.loads(response.content)["is_error"])
+
+    def test_bulk_update(self):
+        """
+        Test a batch of blog posts is updated, unknown ids are reported.
+        """
+        post = BlogPost.objects.first()
+        tag = Tag.objects.first()
+        items = [
+            {
+                "id": str(post.pk),
+                "title": "Renamed",
+                "is_featured": True,
+                "tags": [str(tag.pk)],
+            },
+            {"id": "missing"},
+        ]
+
+        response = self.client.patch("/api/blogs", data=items, format="json")
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(content["updated"], 1)
+        self.assertEqual(
+            content["errors"], [{"index": 1, "errors": {"id": ["Not found."]}}]
+        )
+
+        post.refresh_from_db()
+
+        self.assertEqual(post.slug, "renamed")
+        self.assertTrue(post.is_featured)
+        self.assertEqual(list(post.tags.all()), [tag])
+
+        tag.refresh_from_db()
+
+        self.assertEqual(tag.post_count, 1)
+
+    def test_bulk_delete(self):
+        """
+        Test a batch of tags is deleted in one statement.
+        """
+        ids = [str(pk) for pk in Tag.objects.values_list("pk", flat=True)]
+
+        response = self.client.delete("/api/tags", data=ids, format="json")
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(content["deleted"], len(ids))
+        self.assertFalse(Tag.objects.exists())
+
+    def test_bulk_delete_users_deactivates(self):
+        """
+        Test deleting a batch of users deactivates them.
+        """
+        user = User.objects.last()
+
+        response = self.client.delete("/api/users", data=[str(user.pk)], format="json")
+
+        self.assertEqual(json.loads(response.content)["content"]["deleted"], 1)
+
+        user.refresh_from_db()
+
+        self.assertFalse(user.is_active)
@@ -7,7 +7,8 @@ Version: 1.0
 """
 import json
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -21,6 +22,7 @@ class TestCategoryEndpoint(TestCase):
     fixtures = ["tests/account.json", "tests/user.json", "tests/category.json"]
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = User.objects.first()
         self.account = Account.objects.first()
@@ -223,3 +225,40 @@ class TestCategoryEndpoint(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertDictEqual(ret, expected)
+
+    def test_get_category_tree(self):
+        """
+        Test get category tree endpoint is cached until a category changes.
+        :return:
+        """
+
+        response = self.client.get("/api/categories/tree")
+        tree = json.loads(response.content)["content"]
+
+        self.assertEqual([node["name"] for node in tree], ["Django", "Python"])
+        self.assertEqual(tree[1]["children"][0]["name"], "Portfolio")
+
+        with self.assertNumQueries(0):
+            self.client.get("/api/categories/tree")
+
+        Category.objects.create(name="Rust", description="Rust")
+        response = self.client.get("/api/categories/tree")
+        tree = json.loads(response.content)["content"]
+
+        self.assertEqual([node["name"] for node in tree], ["Django", "Python", "Rust"])
+
+    @override_settings(CACHE_SHARED=False)
+    def test_get_category_tree_local_cache(self):
+        """
+        Test get category tree endpoint loads the tree every time when the cache is per
+        process, so categories changed by other processes are not served stale.
+        :return:
+        """
+
+        self.client.get("/api/categories/tree")
+        Category.objects.filter(name="Django").update(name="Flask")
+
+        response = self.client.get("/api/categories/tree")
+        tree = json.loads(response.content)["content"]
+
+        self.assertEqual([node["name"] for node in tree], ["Flask", "Python"])
@@ -0,0 +1,148 @@
+"""
+Module for Feed Endpoints.
+This module will test following accounts and the home feed.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import Account, User
+from apps.blog.models import BlogPost, TimelineEntry
+
+
+class TestFeedEndpoint(TestCase):
+    fixtures = ["tests/account.json", "tests/user.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.first()
+        self.followed = Account.objects.create(
+            account_name="Followed", contact_email="followed@kencar.ca"
+        )
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}"
+        )
+
+    def create_post(self, title: str, days: int = 0, status: str = "PUBLISHED"):
+        """
+        Create a blog post of the followed account.
+        :param title: Title
+        :param days: Days since publishing
+        :param status: Status
+        :return: Blog post
+        """
+        return BlogPost.objects.create(
+            account=self.followed,
+            author=self.user,
+            status=status,
+            title=title,
+            excerpt="Excerpt.",
+            content="Content.",
+            published_date=timezone.now() - timedelta(days=days),
+        )
+
+    def get_feed(self, url: str = "/api/feed") -> dict:
+        """
+        Get a page of the home feed.
+        :param url: Url
+        :return: Content
+        """
+        return json.loads(self.client.get(url).content)["content"]
+
+    def get_titles(self, content: dict) -> list:
+        """
+        Get the titles of a feed page.
+        :param content: Content
+        :return: List of titles
+        """
+        return [post["title"] for post in content["results"]]
+
+    def test_follow_fans_out(self):
+        """
+        Test following backfills the feed, publishing fans out, and unpublishing or
+        unfollowing removes posts.
+        """
+        self.create_post("Old", days=2)
+        url = f"/api/accounts/{self.followed.pk}/follow"
+
+        response = self.client.post(url)
+
+        self.assertTrue(json.loads(response.content)["content"]["following"])
+        self.assertEqual(self.get_titles(self.get_feed()), ["Old"])
+
+        # Following twice is a no op.
+        self.client.post(url)
+        post = self.create_post("New")
+
+        self.assertEqual(self.get_titles(self.get_feed()), ["New", "Old"])
+
+        post.status = "ARCHIVED"
+        post.save()
+
+        self.assertEqual(self.get_titles(self.get_feed()), ["Old"])
+
+        self.client.delete(url)
+
+        self.assertEqual(self.get_titles(self.get_feed()), [])
+        self.assertFalse(TimelineEntry.objects.exists())
+
+    def test_follow_self(self):
+        """
+        Test an account cannot follow itself.
+        """
+        response = self.client.post(f"/api/accounts/{self.user.account_id}/follow")
+
+        self.assertTrue(json.loads(response.content)["is_error"])
+
+    def test_pulled_account_merged(self):
+        """
+        Test posts of accounts over the fan out limit are merged when read, and pages
+        follow the cursor across both sources.
+        """
+        other = Account.objects.create(
+            account_name="Other", contact_email="other@kencar.ca"
+        )
+        self.client.post(f"/api/accounts/{other.pk}/follow")
+        BlogPost.objects.create(
+            account=other,
+            author=self.user,
+            status="PUBLISHED",
+            title="Fanned",
+            excerpt="Excerpt.",
+            content="Content.",
+            published_date=timezone.now() - timedelta(days=1),
+        )
+
+        with self.settings(FEED_FANOUT_LIMIT=1):
+            self.client.post(f"/api/accounts/{self.followed.pk}/follow")
+
+        self.followed.refresh_from_db()
+        self.create_post("Pulled")
+        self.create_post("Older", days=2)
+
+        self.assertTrue(self.followed.feed_pull)
+        self.assertEqual(TimelineEntry.objects.count(), 1)
+
+        titles = []
+        url = "/api/feed?page_size=1"
+
+        while url:
+            content = self.get_feed(url)
+            titles += self.get_titles(content)
+            url = content["next"]
+
+        self.assertEqual(titles, ["Pulled", "Fanned", "Older"])
+
+        content = self.get_feed(content["previous"])
+
+        self.assertEqual(self.get_titles(content), ["Fanned"])
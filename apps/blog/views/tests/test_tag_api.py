@@ -7,6 +7,7 @@ Version: 1.0
 """
 import json
 
+from django.core.cache import cache
 from django.test import TestCase
 
 from rest_framework.test import APIClient
@@ -21,6 +22,7 @@ class TestTagEndpoint(TestCase):
     fixtures = ["tests/account.json", "tests/user.json", "tests/tag.json"]
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user = User.objects.first()
         self.account = Account.objects.first()
@@ -204,3 +206,23 @@ class TestTagEndpoint(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertDictEqual(ret, expected)
+
+    def test_get_tag_cloud(self):
+        """
+        Test get tag cloud endpoint lists tags by published post count.
+        :return:
+        """
+
+        tag, other = Tag.objects.order_by("name")[:2]
+        Tag.objects.filter(pk=tag.pk).update(published_post_count=1)
+        Tag.objects.filter(pk=other.pk).update(published_post_count=3)
+
+        response = self.client.get("/api/tags/cloud")
+        content = json.loads(response.content)["content"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["id"] for result in content["results"]],
+            [str(other.pk), str(tag.pk)],
+        )
+        self.assertEqual(content["results"][0]["published_post_count"], 3)
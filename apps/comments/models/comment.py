@@ -7,10 +7,18 @@ Version: 1.0
 """
 import uuid
 
-from django.db.models import ForeignKey, TextField, DateTimeField, CASCADE, UUIDField
+from django.db.models import (
+    ForeignKey,
+    TextField,
+    DateTimeField,
+    CASCADE,
+    UUIDField,
+    Index,
+)
 
 from apps.account.models import User
 from apps.blog.models import BlogPost
+from apps.comments.models.managers.comment import CommentManager
 from apps.common.globals.database import DEFAULT_CHAR_LEN
 from apps.common.models.base_model import BaseTable
 
@@ -38,5 +46,23 @@ class Comment(BaseTable):
         default="", max_length=DEFAULT_CHAR_LEN, help_text="Comment Content."
     )
 
+    objects = CommentManager()
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        indexes = [
+            Index(
+                fields=["blog", "created_date", "id"],
+                name="comment_blog_created_id_idx",
+            ),
+            Index(
+                fields=["author", "created_date", "id"],
+                name="comment_user_created_id_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.blog} - {self.author}: {self.content}"
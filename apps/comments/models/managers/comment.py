@@ -0,0 +1,33 @@
+"""
+Comment Manager.
+This module will contain custom functionality related to comment manager. IE Threads.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.db import models
+
+from apps.comments.models.queryset.comment_queryset import CommentQuerySet
+
+
+class CommentManager(models.Manager):
+    """
+    Custom Comment Manager
+    """
+
+    def get_queryset(self):
+        """
+        Get Comment Queryset
+        :return:
+        """
+        return CommentQuerySet(self.model, using=self._db)
+
+    def descendants(self, roots, depth: int = None) -> dict:
+        """
+        Get replies below root comments grouped by parent.
+        :param roots: Root comment instances or primary keys
+        :param depth: Number of reply levels to load, all levels when None
+        :return: Dictionary of parent primary key to list of child comments
+        """
+        return self.get_queryset().descendants(roots=roots, depth=depth)
@@ -0,0 +1,78 @@
+"""
+Module for Comment Manager Tests.
+This module will test loading comment threads.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.test import TestCase
+
+from apps.account.models import User
+from apps.blog.models import BlogPost
+from apps.comments.models import Comment
+
+
+class TestCommentManager(TestCase):
+    """
+    Test Comment Manager
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/blog.json",
+        "tests/comments.json",
+    ]
+
+    def setUp(self) -> None:
+        self.user = User.objects.first()
+        self.blog = BlogPost.objects.first()
+        self.root = Comment.objects.first()
+
+        parent = self.root
+        self.thread = []
+
+        for number in range(4):
+            parent = Comment.objects.create(
+                blog=self.blog, author=self.user, parent=parent, content=f"{number}"
+            )
+            self.thread.append(parent)
+
+        self.sibling = Comment.objects.create(
+            blog=self.blog, author=self.user, parent=self.root, content="sibling"
+        )
+
+    def test_descendants(self):
+        """
+        Test loading a whole thread in one query.
+        """
+
+        with self.assertNumQueries(1):
+            tree = Comment.objects.descendants([self.root])
+
+        self.assertEqual(tree[self.root.pk], [self.thread[0], self.sibling])
+
+        for parent, child in zip(self.thread, self.thread[1:]):
+            self.assertEqual(tree[parent.pk], [child])
+
+        self.assertNotIn(self.thread[-1].pk, tree)
+
+    def test_descendants_depth(self):
+        """
+        Test loading a bounded depth of a thread.
+        """
+
+        tree = Comment.objects.descendants([self.root.pk], depth=2)
+
+        self.assertEqual(tree[self.root.pk], [self.thread[0], self.sibling])
+        self.assertEqual(tree[self.thread[0].pk], [self.thread[1]])
+        self.assertNotIn(self.thread[1].pk, tree)
+
+    def test_descendants_empty(self):
+        """
+        Test loading descendants with no roots or no depth.
+        """
+
+        with self.assertNumQueries(0):
+            self.assertEqual(Comment.objects.descendants([]), {})
+            self.assertEqual(Comment.objects.descendants([self.root], depth=0), {})
@@ -0,0 +1,79 @@
+"""
+Comment QuerySet.
+This module will contain custom functionality related to comment querysets. IE Loading
+comment threads.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.conf import settings
+from django.db import connections, models
+
+
+class CommentQuerySet(models.QuerySet):
+    """
+    Custom Comment QuerySet Class
+    """
+
+    def descendants(self, roots, depth: int = None) -> dict:
+        """
+        Load every reply below the root comments with a single recursive query on the
+        parent foreign key, and group them by parent in memory. Roots are not expanded
+        again when they are replies of other roots, so every reply is loaded once.
+        :param roots: Root comment instances or primary keys
+        :param depth: Number of reply levels to load, capped by COMMENT_MAX_DEPTH
+        :return: Dictionary of parent primary key to ordered list of child comments
+        """
+        root_ids = [getattr(root, "pk", root) for root in roots]
+        max_depth = getattr(settings, "COMMENT_MAX_DEPTH", 50)
+        depth = max_depth if depth is None else min(depth, max_depth)
+
+        if not root_ids or depth < 1:
+            return {}
+
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        meta = self.model._meta
+        table = quote(meta.db_table)
+        pk_column = quote(meta.pk.column)
+        parent_column = quote(meta.get_field("parent").column)
+        created_column = quote(meta.get_field("created_date").column)
+
+        ids = [meta.pk.get_db_prep_value(pk, connection) for pk in root_ids]
+        placeholders = ", ".join(["%s"] * len(ids))
+
+        # Roots are excluded from the recursive step, they are expanded by the anchor.
+        sql = (
+            f"WITH RECURSIVE thread (id, depth) AS ("
+            f"SELECT {pk_column}, 1 FROM {table} WHERE {parent_column} IN ({placeholders}) "
+            f"UNION ALL "
+            f"SELECT child.{pk_column}, thread.depth + 1 FROM {table} child "
+            f"INNER JOIN thread ON child.{parent_column} = thread.id "
+            f"WHERE thread.depth < %s AND thread.id NOT IN ({placeholders})"
+            f") "
+            f"SELECT DISTINCT node.* FROM {table} node "
+            f"INNER JOIN thread ON node.{pk_column} = thread.id "
+            f"ORDER BY node.{created_column}, node.{pk_column}"
+        )
+
+        nodes = {}
+        tree = {}
+
+        for comment in self.model.objects.db_manager(self.db).raw(
+            sql, [*ids, depth, *ids]
+        ):
+            nodes[comment.pk] = comment
+            tree.setdefault(comment.parent_id, []).append(comment)
+
+        # A stored parent cycle comes back through a root, it is not listed as a reply
+        # of its own replies.
+        for pk in {meta.pk.to_python(pk) for pk in root_ids} & nodes.keys():
+            parent_id, steps = nodes[pk].parent_id, 0
+
+            while parent_id in nodes and parent_id != pk and steps < len(nodes):
+                parent_id, steps = nodes[parent_id].parent_id, steps + 1
+
+            if parent_id == pk:
+                tree[nodes[pk].parent_id].remove(nodes[pk])
+
+        return tree
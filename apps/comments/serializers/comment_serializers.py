@@ -35,15 +35,47 @@ class CommentSerializer(serializers.ModelSerializer):
             "children",
         ]
 
-    @staticmethod
-    def get_children_comments(instance):
+    def get_children_comments(self, instance):
         """
-        Get child elements for comment
+        Get child elements for comment, from the preloaded comment tree when the
+        serializer context has one.
         :param instance: comment instance
         :return: list of comment childs
         """
-        comments = instance.children.all().order_by("created_date")
-        return CommentSerializer(comments, many=True).data
+        tree = self.context.get("comment_tree")
+
+        if tree is None:
+            comments = instance.children.all().order_by("created_date")
+        else:
+            comments = tree.get(instance.pk, [])
+
+        return CommentSerializer(comments, many=True, context=self.context).data
+
+    def update(self, instance, validated_data):
+        """
+        Update a comment, the parent cannot be the comment or one of its replies, which
+        would make the thread a cycle.
+        :param instance: comment instance
+        :param validated_data: validated data
+        :return: updated comment
+        """
+        parent = validated_data.get("parent")
+
+        if parent is not None:
+            replies = Comment.objects.descendants([instance])
+
+            if parent.pk == instance.pk or any(
+                parent.pk == reply.pk for level in replies.values() for reply in level
+            ):
+                raise serializers.ValidationError(
+                    {
+                        "parent": [
+                            "A comment cannot reply to itself or one of its replies."
+                        ]
+                    }
+                )
+
+        return super().update(instance, validated_data)
 
 
 class CreateCommentSerializer(serializers.ModelSerializer):
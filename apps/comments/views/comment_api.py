@@ -10,8 +10,8 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.http import Http404
 from rest_framework import filters
 from rest_framework.exceptions import ValidationError
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.authentication.backends import CachedJWTAuthentication
 from apps.comments.models import Comment
 from apps.comments.serializers.comment_serializers import (
     CreateCommentSerializer,
@@ -23,12 +23,30 @@ from apps.common.mixins.retrieve_update_destroy_mixin import (
 )
 
 
-class CommentListLApi(BlogListCreateMixin):
+class CommentTreeMixin:
+    """
+    Comment Tree Mixin, loads the replies of every serialized comment at once.
+    """
+
+    def get_instances_context(self, instances) -> dict:
+        """
+        Load the comment tree below the serialized comments, limited by the optional
+        "depth" query param. All levels are loaded when depth is not a number.
+        :param instances: comments to be serialized
+        :return: serializer context with the comment tree
+        """
+        depth = self.request.query_params.get("depth", "")
+        depth = int(depth) if depth.isdigit() else None
+
+        return {"comment_tree": Comment.objects.descendants(instances, depth=depth)}
+
+
+class CommentListLApi(CommentTreeMixin, BlogListCreateMixin):
     """
     Get a List of users bases on query params, or create a new account.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [filters.SearchFilter]
     search_fields = ["content"]
 
@@ -46,16 +64,19 @@ class CommentListLApi(BlogListCreateMixin):
 
         comments = Comment.objects.filter(blog__pk=blog_id).order_by("-created_date")
 
+        if self.request.query_params.get("root", "").lower() == "true":
+            comments = comments.filter(parent__isnull=True)
+
         return comments
 
 
-class CommentUserListLApi(BlogListCreateMixin):
+class CommentUserListLApi(CommentTreeMixin, BlogListCreateMixin):
     """
     Get a List of users bases on query params, or create a new account.
     """
 
     http_method_names = ["get"]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     filter_backends = [filters.SearchFilter]
     search_fields = ["content"]
     serializer_class = CommentSerializer
@@ -74,12 +95,12 @@ class CommentUserListLApi(BlogListCreateMixin):
         return comments
 
 
-class CommentDetailApi(BlogRetrieveUpdateDestroyMixin):
+class CommentDetailApi(CommentTreeMixin, BlogRetrieveUpdateDestroyMixin):
     """
     Get, update, or delete individual comment information.
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     serializer_class = CommentSerializer
 
     def get_object(self):
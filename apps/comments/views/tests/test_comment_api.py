@@ -50,6 +50,121 @@ class TestCommentEndpoint(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, expected)
 
+    def test_get_comment_list_thread(self):
+        """
+        Test get comment list endpoint loads nested replies in constant queries.
+        :return:
+        """
+
+        root = Comment.objects.first()
+        parent = root
+
+        for number in range(3):
+            parent = Comment.objects.create(
+                blog=self.blog, author=self.user, parent=parent, content=f"{number}"
+            )
+
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                "/api/comments",
+                data={"blog": str(self.blog.id), "root": "true", "depth": 2},
+            )
+
+        results = json.loads(response.content)["content"]["results"]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["id"], str(root.id))
+        self.assertEqual(results[0]["children"][0]["content"], "0")
+        self.assertEqual(results[0]["children"][0]["children"][0]["content"], "1")
+        self.assertEqual(results[0]["children"][0]["children"][0]["children"], [])
+
+    def test_get_comment_list_nested_page(self):
+        """
+        Test get comment list endpoint lists replies once when a comment and its
+        parent are on the same page.
+        :return:
+        """
+
+        root = Comment.objects.first()
+        child = Comment.objects.create(
+            blog=self.blog, author=self.user, parent=root, content="child"
+        )
+        Comment.objects.create(
+            blog=self.blog, author=self.user, parent=child, content="grandchild"
+        )
+
+        response = self.client.get("/api/comments", data={"blog": str(self.blog.id)})
+        results = json.loads(response.content)["content"]["results"]
+        by_content = {result["content"]: result for result in results}
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(
+            [reply["content"] for reply in by_content["child"]["children"]],
+            ["grandchild"],
+        )
+        self.assertEqual(
+            [reply["content"] for reply in by_content[root.content]["children"]],
+            ["child"],
+        )
+
+    def test_update_comment_parent_cycle_fail(self):
+        """
+        Test put comment endpoint rejects a parent below the comment.
+        :return:
+        """
+
+        root = Comment.objects.first()
+        child = Comment.objects.create(
+            blog=self.blog, author=self.user, parent=root, content="child"
+        )
+        grandchild = Comment.objects.create(
+            blog=self.blog, author=self.user, parent=child, content="grandchild"
+        )
+
+        for parent in (root, grandchild):
+            response = self.client.put(
+                f"/api/comments/view/{root.id}", data={"parent": str(parent.id)}
+            )
+            ret = json.loads(response.content)
+
+            self.assertTrue(ret["is_error"])
+            self.assertEqual(
+                ret["error"]["errors"]["parent"],
+                ["A comment cannot reply to itself or one of its replies."],
+            )
+
+        root.refresh_from_db()
+        self.assertIsNone(root.parent_id)
+
+    def test_get_comment_list_parent_cycle(self):
+        """
+        Test get comment list endpoint terminates on a thread stored as a cycle.
+        :return:
+        """
+
+        root = Comment.objects.first()
+        child = Comment.objects.create(
+            blog=self.blog, author=self.user, parent=root, content="child"
+        )
+        grandchild = Comment.objects.create(
+            blog=self.blog, author=self.user, parent=child, content="grandchild"
+        )
+        Comment.objects.filter(pk=root.pk).update(parent=grandchild)
+
+        response = self.client.get(
+            "/api/comments", data={"blog": str(self.blog.id), "root": "false"}
+        )
+        ret = json.loads(response.content)
+
+        self.assertFalse(ret["is_error"])
+        self.assertEqual(len(ret["content"]["results"]), 3)
+
+        tree = Comment.objects.descendants([child])
+        self.assertEqual(
+            sorted(reply.content for level in tree.values() for reply in level),
+            sorted(["grandchild", root.content]),
+        )
+
     def test_get_comment_list_param_fail(self):
         """
         Test get comment list endpoint.
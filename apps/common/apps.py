@@ -0,0 +1,28 @@
+"""
+Module for Common App Config File.
+This module django Common App Config File.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed
+
+from apps.common.utilities.response_cache import invalidate_m2m_detail
+
+
+class CommonConfig(AppConfig):
+    """
+    Common App Config File
+    """
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.common"
+
+    def ready(self):
+        """
+        Invalidate cached detail responses when many to many relations change.
+        :return:
+        """
+        m2m_changed.connect(invalidate_m2m_detail)
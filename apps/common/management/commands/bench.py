@@ -0,0 +1,579 @@
+"""
+Module for benchmarking api endpoints.
+This module will be a management command that will seed a synthetic dataset with bulk
+inserts, ie accounts, users, tags, categories, blog posts with their tags and
+categories, and comment threads, then drive every GET route of the apps through the test
+client and report latency percentiles, query counts, and allocated memory as JSON. Routes
+answering with an error are reported as failed instead of measured. The run uses its own
+cache, so nothing cached from the seeded rows outlives them. A saved report can be
+compared against, regressions are flagged and fail the command.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+import re
+import statistics
+import tracemalloc
+import uuid
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import Account, Followers, User
+from apps.authentication.backends import auth_cache
+from apps.blog.models import BlogPost, Category, Tag
+from apps.blog.models.managers.category import invalidate_tree
+from apps.blog.slugs import invalidate_slugs, slug_cache
+from apps.comments.models import Comment
+from apps.common.pagination.counts import invalidate_counts
+from apps.common.serializers.bulk import set_many_to_many
+
+SEEDED_MODELS = (Account, User, Followers, Tag, Category, BlogPost, Comment)
+
+# Cache of a run, its entries are dropped with it.
+BENCH_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "bench",
+    }
+}
+
+# Routes not driven, and why.
+SKIPPED_ROUTES = {"metrics": "Served to metrics scrapers, not api clients."}
+
+# Route parameters, "<uuid:pk>" is filled with a sample of the path segment before it.
+CONVERTER = re.compile(r"<(?:\w+:)?(\w+)>")
+
+# Query params of routes that require them, "{name}" params are filled with samples.
+ROUTE_PARAMS = {
+    "api/blogs/search": {"q": "culture"},
+    "api/comments": {"blog": "{blog}"},
+    "api/comments/user": {"user": "{user}"},
+}
+
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def create(model, objs: list, batch_size: int) -> list:
+    """
+    Insert instances batch by batch, with the derived fields and hooks of saves.
+    :param model: Model
+    :param objs: Instances to insert
+    :param batch_size: Rows per batch
+    :return: Inserted instances
+    """
+    created = []
+
+    for start in range(0, len(objs), batch_size):
+        created.extend(
+            model.bulk_create_validated(
+                objs[start : start + batch_size], batch_size=batch_size
+            )
+        )
+
+    return created
+
+
+def seed(options: dict) -> tuple:
+    """
+    Seed the dataset, every table is written with bulk inserts.
+    :param options: Command options, dataset sizes
+    :return: Tuple of the benchmark user and sample ids by name
+    """
+    name = f"bench-{uuid.uuid4().hex[:12]}"
+    batch_size = options["batch_size"]
+
+    accounts = create(
+        Account,
+        [
+            Account(account_name=f"{name}-{number}", contact_email=f"{name}@bench.ca")
+            for number in range(options["accounts"])
+        ],
+        batch_size,
+    )
+    users = create(
+        User,
+        [
+            User(
+                account=account,
+                username=f"{name}-{index}-{number}@bench.ca",
+                password=name,
+                first_name="Bench",
+                last_name=str(number),
+            )
+            for index, account in enumerate(accounts)
+            for number in range(options["users"])
+        ],
+        batch_size,
+    )
+    tags = create(
+        Tag,
+        [
+            Tag(name=f"{name}-tag-{number}", description=name)
+            for number in range(options["tags"])
+        ],
+        batch_size,
+    )
+    roots = create(
+        Category,
+        [
+            Category(name=f"{name}-category-{number}", description=name)
+            for number in range((options["categories"] + 1) // 2)
+        ],
+        batch_size,
+    )
+    categories = roots + create(
+        Category,
+        [
+            Category(
+                name=f"{name}-category-{len(roots) + number}",
+                description=name,
+                parent=roots[number % len(roots)],
+            )
+            for number in range(options["categories"] // 2)
+        ],
+        batch_size,
+    )
+
+    authors = {}
+
+    for user in users:
+        authors.setdefault(user.account_id, []).append(user)
+
+    posts = create(
+        BlogPost,
+        [
+            BlogPost(
+                account=account,
+                author=authors[account.pk][number % options["users"]],
+                status="DRAFT" if number % 10 == 9 else "PUBLISHED",
+                title=f"Exploring the Rich Culture of the Inuvialuit People {number}",
+                excerpt="The Inuvialuit people have a rich cultural heritage. " * 4,
+                content="The Inuvialuit people have a rich cultural heritage. " * 40,
+            )
+            for account in accounts
+            for number in range(options["posts"])
+        ],
+        batch_size,
+    )
+    set_many_to_many(
+        BlogPost,
+        [
+            (
+                post,
+                {
+                    "tags": [
+                        tags[(index + offset) % len(tags)]
+                        for offset in range(min(options["tags_per_post"], len(tags)))
+                    ],
+                    "categories": [categories[index % len(categories)]],
+                },
+            )
+            for index, post in enumerate(posts)
+        ],
+        batch_size=batch_size,
+        replace=False,
+    )
+
+    # Threads are written a level at a time, each level replying to the last.
+    level = [None] * (len(posts) * options["comments"])
+    threads = []
+
+    for depth in range(options["depth"]):
+        level = create(
+            Comment,
+            [
+                Comment(
+                    blog=posts[index // options["comments"]],
+                    author=users[index % len(users)],
+                    parent=parent,
+                    content=f"Reply at depth {depth}.",
+                )
+                for index, parent in enumerate(level)
+            ],
+            batch_size,
+        )
+        threads = threads or level
+
+    user = users[0]
+
+    for account in accounts[1:]:
+        Followers.objects.follow(user.account_id, account.pk)
+
+    blog = next(post for post in posts if post.status == "PUBLISHED")
+    samples = {
+        "accounts": user.account_id,
+        "users": user.pk,
+        "blogs": blog.pk,
+        "categories": categories[0].pk,
+        "tags": tags[0].pk,
+        "view": threads[0].pk if threads else uuid.uuid4(),
+        "account": blog.account_id,
+        "slug": blog.slug,
+        "blog": blog.pk,
+        "user": user.pk,
+    }
+
+    return user, {key: str(value) for key, value in samples.items()}
+
+
+def get_routes(patterns=None, prefix: str = "") -> list:
+    """
+    Get the GET routes of the apps url configurations.
+    :param patterns: Url patterns, defaults to the root url configuration
+    :param prefix: Route of the enclosing patterns
+    :return: List of route and view class tuples
+    """
+    routes = []
+
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        route = f"{prefix}{pattern.pattern}"
+
+        if isinstance(pattern, URLResolver):
+            module = getattr(pattern.urlconf_module, "__name__", "")
+
+            if module.startswith("apps."):
+                routes.extend(get_routes(pattern.url_patterns, route))
+            continue
+
+        view_class = getattr(pattern.callback, "view_class", None)
+
+        if (
+            view_class is not None
+            and "get" in view_class.http_method_names
+            and hasattr(view_class, "get")
+        ):
+            routes.append((route, view_class))
+
+    return routes
+
+
+def get_url(route: str, samples: dict) -> str:
+    """
+    Fill the parameters of a route, and its query params, with samples.
+    :param route: Route pattern, ie "api/blogs/<uuid:pk>"
+    :param samples: Sample ids by name
+    :return: Url
+    """
+
+    def fill(match) -> str:
+        name = match.group(1)
+
+        if name == "pk":
+            name = route[: match.start()].rstrip("/").rsplit("/", 1)[-1]
+
+        return samples[name]
+
+    url = f"/{CONVERTER.sub(fill, route)}"
+    params = ROUTE_PARAMS.get(route, {})
+
+    if params:
+        url += "?" + "&".join(
+            f"{key}={value.format(**samples)}" for key, value in params.items()
+        )
+
+    return url
+
+
+def get_body(response) -> bytes:
+    """
+    Get the body of a response, streamed bodies are consumed.
+    :param response: Response
+    :return: Body
+    """
+    if response.streaming:
+        return b"".join(response.streaming_content)
+
+    return response.content
+
+
+def get_error(response, body: bytes):
+    """
+    Get the error of a response, api errors are answered with is_error and a 200.
+    :param response: Response
+    :param body: Body
+    :return: Error, or None
+    """
+    if response.status_code >= 400:
+        return f"HTTP {response.status_code}"
+
+    if not response.get("Content-Type", "").startswith("application/json"):
+        return None
+
+    try:
+        content = json.loads(body)
+    except ValueError:
+        return "Invalid JSON"
+
+    if isinstance(content, dict) and content.get("is_error"):
+        return content.get("error") or "is_error"
+
+    return None
+
+
+def measure(client, url: str, requests: int, warmup: int) -> dict:
+    """
+    Measure a route. Latency is timed without instrumentation, queries and allocated
+    memory are measured on one more request.
+    :param client: Test client
+    :param url: Url
+    :param requests: Number of timed requests
+    :param warmup: Number of requests before timing
+    :return: Dict of route stats
+    """
+    for _ in range(warmup):
+        get_body(client.get(url))
+
+    latencies = []
+
+    for _ in range(requests):
+        start = perf_counter()
+        get_body(client.get(url))
+        latencies.append(perf_counter() - start)
+
+    with CaptureQueriesContext(connection) as context:
+        tracemalloc.start()
+
+        try:
+            response = client.get(url)
+            size = len(get_body(response))
+            _, allocated = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "url": url,
+        "status": response.status_code,
+        "requests": requests,
+        "p50_ms": round(quantiles[49] * 1000, 3),
+        "p95_ms": round(quantiles[94] * 1000, 3),
+        "p99_ms": round(quantiles[98] * 1000, 3),
+        "queries": len(context.captured_queries),
+        "allocated_bytes": allocated,
+        "response_bytes": size,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float, min_delta: float) -> list:
+    """
+    Find routes that regressed against a baseline report. Latency and memory regress
+    when over the threshold, queries regress when any more are made.
+    :param report: Report
+    :param baseline: Baseline report
+    :param threshold: Allowed increase, ie 0.2 for 20%
+    :param min_delta: Latency increase in milliseconds always allowed, ie noise
+    :return: List of regressions
+    """
+    regressions = []
+
+    for route, stats in report["routes"].items():
+        base = baseline.get("routes", {}).get(route)
+
+        if base is None:
+            continue
+
+        for metric in (*LATENCY_METRICS, "allocated_bytes", "queries"):
+            current, previous = stats[metric], base.get(metric)
+
+            if previous is None:
+                continue
+
+            if metric == "queries":
+                regressed = current > previous
+            elif metric in LATENCY_METRICS:
+                regressed = (
+                    current > previous * (1 + threshold)
+                    and current - previous > min_delta
+                )
+            else:
+                regressed = current > previous * (1 + threshold)
+
+            if regressed:
+                regressions.append(
+                    {
+                        "route": route,
+                        "metric": metric,
+                        "baseline": previous,
+                        "current": current,
+                    }
+                )
+
+    return regressions
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to benchmark api endpoints
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        sizes = [
+            ("--accounts", 5, "Number of accounts."),
+            ("--users", 10, "Number of users per account."),
+            ("--tags", 50, "Number of tags."),
+            ("--categories", 20, "Number of categories, half nested below the rest."),
+            ("--posts", 100, "Number of blog posts per account."),
+            ("--tags-per-post", 3, "Number of tags per blog post."),
+            ("--comments", 3, "Number of comment threads per blog post."),
+            ("--depth", 5, "Number of comments per thread, each replying to the last."),
+            ("--batch-size", 1000, "Rows per bulk insert."),
+            ("--requests", 50, "Number of timed requests per route."),
+            ("--warmup", 3, "Number of requests per route before timing."),
+        ]
+
+        for flag, default, description in sizes:
+            parser.add_argument(
+                flag,
+                type=int,
+                default=default,
+                help=f"{description} (Default: {default})",
+            )
+
+        parser.add_argument("--output", help="Write the JSON report to a file.")
+        parser.add_argument(
+            "--compare", help="Baseline JSON report to flag regressions against."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed latency and memory increase over the baseline (Default: 0.2)",
+        )
+        parser.add_argument(
+            "--min-delta-ms",
+            type=float,
+            default=1.0,
+            help="Latency increase always allowed, ie noise (Default: 1.0)",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the seeded dataset instead of rolling it back.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Benchmark api endpoints, on a dataset seeded in a transaction that is rolled
+        back unless kept.
+        :param args:
+        :param options:
+        :return:
+        """
+        if options["requests"] < 2:
+            raise CommandError("At least 2 timed requests per route are needed.")
+
+        if min(options["accounts"], options["users"], options["posts"]) < 1:
+            raise CommandError("At least 1 account, user, and blog post are needed.")
+
+        if min(options["tags"], options["categories"]) < 1:
+            raise CommandError("At least 1 tag and category are needed.")
+
+        baseline = None
+
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as file:
+                baseline = json.load(file)
+
+        with override_settings(CACHES=BENCH_CACHES), transaction.atomic():
+            start = perf_counter()
+            user, samples = seed(options)
+            seconds = perf_counter() - start
+            token = RefreshToken.for_user(user).access_token
+            client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+            report = {
+                "database": connection.vendor,
+                "debug": settings.DEBUG,
+                "dataset": {
+                    name: options[name]
+                    for name in (
+                        "accounts",
+                        "users",
+                        "tags",
+                        "categories",
+                        "posts",
+                        "tags_per_post",
+                        "comments",
+                        "depth",
+                    )
+                },
+                "seed_seconds": round(seconds, 3),
+                "routes": {},
+                "skipped": {},
+                "failed": {},
+            }
+
+            for route, view_class in get_routes():
+                if route in SKIPPED_ROUTES:
+                    report["skipped"][route] = SKIPPED_ROUTES[route]
+                    continue
+
+                try:
+                    url = get_url(route, samples)
+                except KeyError as exc:
+                    report["skipped"][route] = f"No sample for {exc.args[0]}."
+                    continue
+
+                response = client.get(url)
+                error = get_error(response, get_body(response))
+
+                if error is not None:
+                    report["failed"][route] = {
+                        "url": url,
+                        "status": response.status_code,
+                        "error": error,
+                    }
+                    continue
+
+                report["routes"][route] = {
+                    "view": view_class.__name__,
+                    **measure(client, url, options["requests"], options["warmup"]),
+                }
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        # Entries of the seeded rows were only cached in process, or in the run's cache.
+        auth_cache.clear()
+        slug_cache.clear()
+
+        if options["keep"]:
+            for model in SEEDED_MODELS:
+                invalidate_counts(model=model)
+
+            invalidate_slugs()
+            invalidate_tree()
+
+        if baseline is not None:
+            report["regressions"] = compare(
+                report, baseline, options["threshold"], options["min_delta_ms"]
+            )
+
+        output = json.dumps(report, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output)
+
+        self.stdout.write(output)
+
+        if report["failed"]:
+            raise CommandError(f"{len(report['failed'])} routes answered with errors.")
+
+        if report.get("regressions"):
+            raise CommandError(
+                f"{len(report['regressions'])} regressions against the baseline."
+            )
@@ -0,0 +1,143 @@
+"""
+Module for benchmarking api response encoding.
+This module will be a management command that will compare encode time and peak memory
+of each available JSON backend on a page of serialized blog posts, buffered as by
+json_response and streamed as by stream_json_response.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import timeit
+import tracemalloc
+import uuid
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from apps.account.models import Account, User
+from apps.blog.models import BlogPost
+from apps.blog.serializers.blog_serializers import BlogPostSerializer
+from apps.common.utilities.json_backends import (
+    JSON_ORJSON,
+    JSON_STDLIB,
+    get_json_backend,
+    orjson,
+)
+from apps.common.utilities.utilities import default_pagination, stream_json_envelope
+
+
+def build_page(rows: int) -> list:
+    """
+    Serialize a page of blog posts, created in a transaction that is rolled back.
+    :param rows: Number of blog posts
+    :return: List of serialized blog posts
+    """
+    with transaction.atomic():
+        name = f"bench-{uuid.uuid4().hex}"
+        account = Account.objects.create(
+            account_name=name, contact_email=f"{name}@example.com"
+        )
+        author = User.objects.create_user(
+            account=account, username=f"{name}@example.com", password=name
+        )
+        posts = BlogPost.bulk_create_validated(
+            BlogPost(
+                account=account,
+                author=author,
+                status="PUBLISHED",
+                title=f"Exploring the Rich Culture of the Inuvialuit People {number}",
+                excerpt="The Inuvialuit people have a rich cultural heritage. " * 8,
+                content="The Inuvialuit people have a rich cultural heritage. " * 40,
+            )
+            for number in range(rows)
+        )
+        page = list(BlogPostSerializer(posts, many=True).data)
+        transaction.set_rollback(True)
+
+    return page
+
+
+def measure(encode, repeat: int) -> tuple:
+    """
+    Measure an encode function.
+    :param encode: Function returning the encoded size
+    :param repeat: Number of timed runs
+    :return: Best run milliseconds, peak KiB, and bytes
+    """
+    size = encode()
+    best = min(timeit.repeat(encode, number=1, repeat=repeat))
+
+    tracemalloc.start()
+    encode()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1000, peak / 1024, size
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to benchmark api response encoding
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=100,
+            help="Number of blog posts in the page.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of timed runs, the best run is reported.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Benchmark api response encoding
+        :param args:
+        :param options:
+        :return:
+        """
+        page = build_page(options["rows"])
+        data = default_pagination(data=[])
+        del data["results"]
+        names = [JSON_STDLIB] + ([JSON_ORJSON] if orjson is not None else [])
+
+        self.stdout.write(
+            f"{'encoder':<8} {'mode':<9} {'ms':>8} {'peak KiB':>10} {'bytes':>9}"
+        )
+
+        for name in names:
+            backend = get_json_backend(name)
+
+            modes = {
+                "buffered": lambda: len(
+                    backend.dumps(
+                        {
+                            "is_error": False,
+                            "error": {},
+                            "content": {**data, "results": page},
+                        }
+                    )
+                ),
+                # A server writes each chunk out, so only one chunk is held at a time.
+                "streamed": lambda: sum(
+                    len(chunk)
+                    for chunk in stream_json_envelope(data, page, backend=backend)
+                ),
+            }
+
+            for mode, encode in modes.items():
+                best, peak, size = measure(encode, options["repeat"])
+
+                self.stdout.write(
+                    f"{name:<8} {mode:<9} {best:>8.2f} {peak:>10.1f} {size:>9}"
+                )
@@ -0,0 +1,139 @@
+"""
+Module for benchmarking projection serializers.
+This module will be a management command that will compare the throughput of list pages
+rendered by model serializers and by the projection serializers compiled from them, for
+blog posts and users, fetching included.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import timeit
+import uuid
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from apps.account.models import Account, User
+from apps.account.serializers.user_serializer import UserProjection, UserSerializer
+from apps.blog.models import BlogPost, Category, Tag
+from apps.blog.serializers.blog_serializers import (
+    BlogPostExcerptProjection,
+    BlogPostExcerptSerializer,
+)
+from apps.common.utilities.query_planner import plan_related
+
+BENCH_CASES = [
+    ("blogs", BlogPost, BlogPostExcerptSerializer, BlogPostExcerptProjection),
+    ("users", User, UserSerializer, UserProjection),
+]
+
+
+def seed(rows: int) -> Account:
+    """
+    Create an account with users and blog posts, with categories and tags.
+    :param rows: Number of users and of blog posts
+    :return: Account
+    """
+    name = f"bench-{uuid.uuid4().hex}"
+    account = Account.objects.create(
+        account_name=name, contact_email=f"{name}@example.com"
+    )
+    users = User.bulk_create_validated(
+        User(
+            account=account,
+            username=f"{name}-{number}@example.com",
+            password=name,
+            first_name="Bench",
+            last_name=str(number),
+        )
+        for number in range(rows)
+    )
+    category = Category.objects.create(name=name, description=name)
+    tags = [
+        Tag.objects.create(name=f"{name}-{number}", description=name)
+        for number in range(3)
+    ]
+    posts = BlogPost.bulk_create_validated(
+        BlogPost(
+            account=account,
+            author=users[number],
+            status="PUBLISHED",
+            title=f"Exploring the Rich Culture of the Inuvialuit People {number}",
+            excerpt="The Inuvialuit people have a rich cultural heritage. " * 8,
+            content="The Inuvialuit people have a rich cultural heritage.",
+        )
+        for number in range(rows)
+    )
+
+    for post in posts:
+        post.categories.add(category)
+        post.tags.add(*tags)
+
+    return account
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to benchmark projection serializers
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=100,
+            help="Number of rows in the page.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of timed runs, the best run is reported.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Benchmark projection serializers, on rows created in a transaction that is
+        rolled back.
+        :param args:
+        :param options:
+        :return:
+        """
+        rows = options["rows"]
+
+        self.stdout.write(
+            f"{'page':<6} {'serializer':<10} {'ms':>8} {'rows/s':>10} {'speedup':>8}"
+        )
+
+        with transaction.atomic():
+            account = seed(rows)
+
+            for label, model, serializer, projection in BENCH_CASES:
+                queryset = model.objects.filter(account=account).order_by("pk")
+
+                runs = {
+                    "model": lambda: serializer(
+                        plan_related(queryset, serializer)[:rows], many=True
+                    ).data,
+                    "projection": lambda: projection(
+                        projection.project(queryset)[:rows], many=True
+                    ).data,
+                }
+                timings = {
+                    name: min(timeit.repeat(run, number=1, repeat=options["repeat"]))
+                    for name, run in runs.items()
+                }
+
+                for name, best in timings.items():
+                    speedup = timings["model"] / best
+                    self.stdout.write(
+                        f"{label:<6} {name:<10} {best * 1000:>8.2f} "
+                        f"{rows / best:>10.0f} {speedup:>7.1f}x"
+                    )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,138 @@
+"""
+Module for inspecting list endpoint query plans.
+This module will be a management command that will run EXPLAIN for the common filter
+combinations of each list endpoint and flag sequential scans and sorts not served by an
+index, to catch index regressions before deploy.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import uuid
+
+from django.core.management import BaseCommand, CommandError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.account.models import Account, User
+from apps.account.views.account_api import AccountListLApi
+from apps.account.views.user_api import UserListLApi
+from apps.blog.models import BlogPost
+from apps.blog.views.blog_api import BlogListLApi
+from apps.blog.views.category_api import CategoryListLApi
+from apps.blog.views.tag_api import TagListLApi
+from apps.comments.views.comment_api import CommentListLApi, CommentUserListLApi
+from apps.common.pagination.paginations import ApiPagination
+from apps.common.utilities.explain import explain_queryset
+
+# Endpoint, list view, and query params, "{name}" params are filled with sample ids.
+EXPLAIN_CASES = [
+    ("blogs", BlogListLApi, {}),
+    ("blogs", BlogListLApi, {"status": "PUBLISHED"}),
+    ("blogs", BlogListLApi, {"is_featured": "True"}),
+    ("blogs", BlogListLApi, {"account": "{account}"}),
+    ("blogs", BlogListLApi, {"author": "{user}"}),
+    ("blogs", BlogListLApi, {"account": "{account}", "status": "PUBLISHED"}),
+    ("categories", CategoryListLApi, {}),
+    ("tags", TagListLApi, {}),
+    ("accounts", AccountListLApi, {}),
+    ("users", UserListLApi, {}),
+    ("comments", CommentListLApi, {"blog": "{blog}"}),
+    ("comments", CommentListLApi, {"blog": "{blog}", "root": "true"}),
+    ("comments/user", CommentUserListLApi, {"user": "{user}"}),
+]
+
+
+def get_samples() -> dict:
+    """
+    Sample ids to fill filter params, random ids when a table is empty.
+    :return: Dict of sample name and id
+    """
+    samples = {"account": Account, "user": User, "blog": BlogPost}
+
+    for name, model in samples.items():
+        pk = model.objects.values_list("pk", flat=True).first()
+        samples[name] = str(pk or uuid.uuid4())
+
+    return samples
+
+
+def get_list_queryset(view_class, params: dict):
+    """
+    Build the queryset of a list view for query params, shaped as the view pages it,
+    ie projected or planned, and sliced to the first page.
+    :param view_class: List view class
+    :param params: Query params
+    :return: QuerySet
+    """
+    view = view_class()
+    view.request = Request(APIRequestFactory().get("/", params))
+    view.format_kwarg = None
+    view.kwargs = {}
+
+    queryset = view.filter_queryset(view.get_queryset())
+    queryset = view.shape_queryset(queryset, fields=view.get_sparse_fields())
+
+    return queryset[: ApiPagination.page_size]
+
+
+class Command(BaseCommand):
+    """
+    Django Management command to inspect list endpoint query plans
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguements for the command
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run EXPLAIN ANALYZE to find sorts that spill to disk, Postgres only.",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="Ignore sequential scans estimated below this many rows, Postgres only.",
+        )
+        parser.add_argument(
+            "--fail",
+            action="store_true",
+            help="Exit with an error when any plan is flagged.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Explain list endpoint queries
+        :param args:
+        :param options:
+        :return:
+        """
+        samples = get_samples()
+        flagged = 0
+
+        for endpoint, view_class, params in EXPLAIN_CASES:
+            params = {key: value.format(**samples) for key, value in params.items()}
+            query = "&".join(f"{key}={value}" for key, value in params.items())
+            label = f"/api/{endpoint}?{query}" if query else f"/api/{endpoint}"
+
+            findings = explain_queryset(
+                get_list_queryset(view_class, params),
+                analyze=options["analyze"],
+                min_rows=options["min_rows"],
+            )
+
+            if not findings:
+                self.stdout.write(f"{self.style.SUCCESS('OK')}    {label}")
+                continue
+
+            flagged += 1
+            self.stdout.write(f"{self.style.WARNING('FLAG')}  {label}")
+
+            for flag, step in findings:
+                self.stdout.write(f"      {flag}: {step}")
+
+        if flagged and options["fail"]:
+            raise CommandError(f"{flagged} list queries have flagged plans.")
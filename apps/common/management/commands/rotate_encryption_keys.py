@@ -0,0 +1,135 @@
+"""
+Module for Rotate Encryption Keys Command.
+This module will be a management command that will re-encrypt encrypted fields with the
+current encryption key, so retired keys can be removed. Rows are streamed in primary key
+order in chunks, each read locked and written in one transaction so concurrent writes
+are not overwritten. Rows already on the current key are skipped so an interrupted run
+can be started again or resumed after the last reported key.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.apps import apps
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.common.models.fields import EncryptedFieldMixin, EncryptedToken
+from apps.common.utilities.encryption import rotate_token
+
+
+def get_encrypted_models(label: str = None) -> list:
+    """
+    Get models with encrypted fields and their encrypted fields.
+    :param label: Optional "app_label.ModelName" to limit to one model
+    :return: List of model and field list tuples
+    """
+    models = [apps.get_model(label)] if label else apps.get_models()
+    result = []
+
+    for model in models:
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if isinstance(field, EncryptedFieldMixin)
+        ]
+
+        if fields:
+            result.append((model, fields))
+
+    return result
+
+
+class Command(BaseCommand):
+    """
+    Django Management Command
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command.
+        :param parser:
+        :return:
+        """
+        parser.add_argument(
+            "--model",
+            type=str,
+            help="Only rotate 'app_label.ModelName'.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Rows read and written per chunk (Default: 500)",
+        )
+        parser.add_argument(
+            "--after",
+            type=str,
+            help="Resume after this primary key, requires --model.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Rotate encrypted fields to the current key.
+        :param args:
+        :param options:
+        :return:
+        """
+
+        if options["after"] and not options["model"]:
+            raise CommandError("--after requires --model.")
+
+        for model, fields in get_encrypted_models(options["model"]):
+            rotated = self.rotate_model(
+                model, fields, options["chunk_size"], options["after"]
+            )
+            self.stdout.write(f"{model._meta.label}: rotated {rotated} rows.")
+
+    def rotate_model(self, model, fields, chunk_size: int, after=None) -> int:
+        """
+        Rotate encrypted fields of a model chunk by chunk.
+        :param model: Model class
+        :param fields: Encrypted fields
+        :param chunk_size: Rows per chunk
+        :param after: Primary key to resume after
+        :return: Number of rotated rows
+        """
+        attnames = [field.attname for field in fields]
+        queryset = model._base_manager.order_by("pk")
+        rotated = 0
+
+        while True:
+            chunk = queryset.filter(pk__gt=after) if after is not None else queryset
+
+            with transaction.atomic():
+                rows = list(
+                    chunk.select_for_update().values_list("pk", *attnames)[:chunk_size]
+                )
+
+                if not rows:
+                    return rotated
+
+                changed = []
+
+                for pk, *tokens in rows:
+                    rotations = [
+                        None if token is None else rotate_token(token)
+                        for token in tokens
+                    ]
+
+                    if not any(rotations):
+                        continue
+
+                    values = {
+                        attname: EncryptedToken(rotation) if rotation else token
+                        for attname, token, rotation in zip(attnames, tokens, rotations)
+                    }
+                    changed.append(model(pk=pk, **values))
+
+                model._base_manager.bulk_update(
+                    changed, attnames, batch_size=chunk_size
+                )
+
+            rotated += len(changed)
+            after = rows[-1][0]
+            self.stdout.write(f"{model._meta.label}: rotated up to {after}")
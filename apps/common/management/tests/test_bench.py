@@ -0,0 +1,130 @@
+"""
+Module for Bench Command Tests.
+This module will test benchmarking api endpoints.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from apps.account.models import Account
+from apps.blog.models import BlogPost
+from apps.blog.slugs import get_slug_version
+from apps.common.management.commands import bench
+from apps.common.pagination.counts import get_count_version
+
+TINY = [
+    "--accounts=2",
+    "--users=2",
+    "--tags=3",
+    "--categories=2",
+    "--posts=3",
+    "--comments=1",
+    "--depth=2",
+    "--requests=2",
+    "--warmup=0",
+]
+
+
+class TestBench(TestCase):
+    """
+    Test Bench Command
+    """
+
+    def test_bench(self):
+        """
+        Test every route is driven and the dataset is rolled back.
+        """
+
+        out = StringIO()
+        call_command("bench", *TINY, stdout=out)
+        report = json.loads(out.getvalue())
+
+        for route in (
+            "api/blogs/<uuid:pk>",
+            "api/accounts/<uuid:account>/blogs/<slug:slug>",
+            "api/comments",
+            "api/comments/view/<uuid:pk>",
+            "api/accounts/<uuid:pk>/followers",
+        ):
+            self.assertEqual(report["routes"][route]["status"], 200, route)
+
+        blog = report["routes"]["api/blogs"]
+        self.assertLessEqual(blog["p50_ms"], blog["p99_ms"])
+        self.assertGreater(blog["queries"], 0)
+        self.assertGreater(blog["allocated_bytes"], 0)
+        self.assertNotIn("regressions", report)
+        self.assertEqual(report["failed"], {})
+        self.assertIn("metrics", report["skipped"])
+
+        self.assertFalse(Account.objects.filter(account_name__startswith="bench-"))
+        self.assertFalse(BlogPost.objects.exists())
+
+    def test_bench_compare(self):
+        """
+        Test routes slower or making more queries than the baseline are flagged.
+        """
+
+        baseline = {
+            "routes": {
+                "api/blogs": {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "queries": 0}
+            }
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(baseline, file)
+
+            out = StringIO()
+
+            with self.assertRaises(CommandError):
+                call_command(
+                    "bench", *TINY, "--compare", path, "--min-delta-ms=0", stdout=out
+                )
+
+        report = json.loads(out.getvalue())
+        metrics = {regression["metric"] for regression in report["regressions"]}
+
+        self.assertEqual(metrics, {"p50_ms", "p95_ms", "p99_ms", "queries"})
+        self.assertEqual(
+            {regression["route"] for regression in report["regressions"]},
+            {"api/blogs"},
+        )
+
+    def test_bench_failed_route(self):
+        """
+        Test routes answering with an error are reported as failed, not measured.
+        """
+
+        params = {**bench.ROUTE_PARAMS, "api/comments": {}}
+        out = StringIO()
+
+        with mock.patch.object(bench, "ROUTE_PARAMS", params):
+            with self.assertRaises(CommandError):
+                call_command("bench", *TINY, stdout=out)
+
+        report = json.loads(out.getvalue())
+
+        self.assertEqual(list(report["failed"]), ["api/comments"])
+        self.assertEqual(report["failed"]["api/comments"]["status"], 200)
+        self.assertNotIn("api/comments", report["routes"])
+
+    def test_bench_cache_isolated(self):
+        """
+        Test the run caches nothing, nor moves versions, in the default cache.
+        """
+
+        versions = (get_count_version(BlogPost), get_slug_version())
+
+        call_command("bench", *TINY, stdout=StringIO())
+
+        self.assertEqual((get_count_version(BlogPost), get_slug_version()), versions)
@@ -0,0 +1,66 @@
+"""
+Module for Explain Queries Command Tests.
+This module will test inspecting list endpoint query plans.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from apps.account.models import User
+from apps.account.views.user_api import UserListLApi
+from apps.common.management.commands import explain_queries
+
+
+class UserBioListLApi(UserListLApi):
+    """
+    Users list sorted by a column without an index.
+    """
+
+    def get_queryset(self):
+        return User.objects.order_by("bio")
+
+
+class TestExplainQueries(TestCase):
+    """
+    Test Explain Queries Command
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/blog.json",
+    ]
+
+    def test_explain_queries(self):
+        """
+        Test every list endpoint filter is served by an index.
+        """
+
+        out = StringIO()
+        call_command("explain_queries", "--fail", stdout=out)
+
+        self.assertNotIn("FLAG", out.getvalue())
+        self.assertIn("/api/blogs?status=PUBLISHED", out.getvalue())
+        self.assertIn("OK    /api/users", out.getvalue())
+
+    def test_explain_queries_flagged(self):
+        """
+        Test a list endpoint sorting without an index is flagged.
+        """
+
+        out = StringIO()
+        cases = [("users", UserBioListLApi, {})]
+
+        with mock.patch.object(explain_queries, "EXPLAIN_CASES", cases):
+            call_command("explain_queries", stdout=out)
+
+            with self.assertRaises(CommandError):
+                call_command("explain_queries", "--fail", stdout=out)
+
+        self.assertIn("FLAG  /api/users", out.getvalue())
+        self.assertIn("sort: USE TEMP B-TREE FOR ORDER BY", out.getvalue())
@@ -0,0 +1,266 @@
+"""
+Module for Bulk Write Mixin.
+This module contains bulk create, update, and delete for list endpoints. A batch is sent
+as a json array or NDJSON body, validated together with one query per relation, and
+written in one transaction. Invalid items are reported by position and the others are
+still written.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.settings import api_settings
+
+from apps.common.serializers.bulk import (
+    load_instances,
+    set_many_to_many,
+    split_many_to_many,
+    validate_items,
+)
+from apps.common.utilities.parsers import NDJSONParser
+from apps.common.utilities.response_cache import invalidate_detail
+from apps.common.utilities.utilities import json_response
+
+CONFLICT_ERROR = {"non_field_errors": ["Conflicts with an existing item."]}
+PROTECTED_ERROR = {"non_field_errors": ["Still referred to by other items."]}
+
+
+class BulkWriteMixin:
+    """
+    Bulk Write Mixin
+    """
+
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, NDJSONParser]
+    bulk_max_items = None
+
+    def get_bulk_items(self, request) -> list:
+        """
+        Get the items of a bulk request.
+        :param request: request
+        :return: List of raw items
+        """
+        items = request.data
+        max_items = self.bulk_max_items or getattr(settings, "BULK_MAX_ITEMS", 5000)
+
+        if not isinstance(items, list):
+            raise ValidationError("Expected a list of items.")
+
+        if len(items) > max_items:
+            raise ValidationError(f"Expected at most {max_items} items.")
+
+        return items
+
+    def check_bulk_permissions(self, request, instances: dict, errors: dict) -> None:
+        """
+        Check object permissions of every instance, denied instances are dropped and
+        reported.
+        :param request: request
+        :param instances: Instances by position
+        :param errors: Errors by position
+        :return: None
+        """
+        for index, instance in list(instances.items()):
+            try:
+                self.check_object_permissions(request, instance)
+            except PermissionDenied as exc:
+                errors[index] = {"non_field_errors": [exc.detail]}
+                del instances[index]
+
+    @staticmethod
+    def get_bulk_response(action: str, written: list, errors: dict):
+        """
+        Report written items and errors by position.
+        :param action: Name of the written count
+        :param written: List of position and instance tuples
+        :param errors: Errors by position
+        :return: Json Response
+        """
+        return json_response(
+            data={
+                action: len(written),
+                "results": [
+                    {"index": index, "id": instance.pk}
+                    for index, instance in sorted(written, key=lambda pair: pair[0])
+                ],
+                "errors": [
+                    {"index": index, "errors": errors[index]}
+                    for index in sorted(errors)
+                ],
+            }
+        )
+
+    @staticmethod
+    def write_batch(write, pending: list, errors: dict, conflict: dict) -> list:
+        """
+        Write a batch in one savepoint. When the batch conflicts, ie duplicates within
+        it, each item is written in its own savepoint to find the ones that conflict.
+        :param write: Function writing a list of pending items, returns written items
+        :param pending: List of pending items, position first
+        :param errors: Errors by position
+        :param conflict: Error of conflicting items
+        :return: List of position and instance tuples written
+        """
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    return write(pending)
+            except IntegrityError:
+                written = []
+
+            for entry in pending:
+                try:
+                    with transaction.atomic():
+                        written.extend(write([entry]))
+                except IntegrityError:
+                    errors[entry[0]] = conflict
+
+            return written
+
+    @staticmethod
+    def drop_invalid(entries: list, found: dict, errors: dict) -> list:
+        """
+        Report model validation errors of pending items and drop them.
+        :param entries: List of pending items, position first
+        :param found: Errors by position in entries
+        :param errors: Errors by position
+        :return: List of valid pending items
+        """
+        for position, messages in found.items():
+            errors[entries[position][0]] = messages
+
+        return [
+            entry for position, entry in enumerate(entries) if position not in found
+        ]
+
+    def bulk_create(self, request):
+        """
+        Create a batch of instances.
+        :param request: request
+        :return: Json of created ids and errors by position.
+        """
+        try:
+            items = self.get_bulk_items(request)
+        except ValidationError as exc:
+            message = {"message": "Creation Failed", "errors": exc.detail}
+            return json_response(message=message, error=True)
+
+        serializer = self.get_create_serializer()()
+        model = serializer.Meta.model
+        validated, errors = validate_items(serializer, dict(enumerate(items)))
+        get_instance_data = getattr(serializer, "get_instance_data", dict)
+        batch_size = getattr(settings, "BULK_BATCH_SIZE", 1000)
+        pending = []
+
+        for index, data in validated.items():
+            fields, many = split_many_to_many(model, get_instance_data(data))
+            pending.append((index, model(**fields), many))
+
+        def write(entries: list) -> list:
+            found = {}
+            model.bulk_create_validated(
+                [obj for _, obj, _ in entries], batch_size=batch_size, errors=found
+            )
+            entries = self.drop_invalid(entries, found, errors)
+            set_many_to_many(
+                model,
+                [(obj, many) for _, obj, many in entries],
+                batch_size=batch_size,
+                replace=False,
+            )
+
+            return [(index, obj) for index, obj, _ in entries]
+
+        written = self.write_batch(write, pending, errors, CONFLICT_ERROR)
+
+        return self.get_bulk_response("created", written, errors)
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Update a batch of instances, each item has the "id" of its instance and the
+        fields to change.
+        :param request: request
+        :return: Json of updated ids and errors by position.
+        """
+        try:
+            items = self.get_bulk_items(request)
+        except ValidationError as exc:
+            message = {"message": "Update failed", "errors": exc.detail}
+            return json_response(message=message, error=True)
+
+        serializer = self.get_serializer_class()(partial=True)
+        model = serializer.Meta.model
+        instances, errors = load_instances(
+            model.objects.all(),
+            [item.get("id") if isinstance(item, dict) else None for item in items],
+        )
+        self.check_bulk_permissions(request, instances, errors)
+        validated, found = validate_items(
+            serializer, {index: items[index] for index in instances}, instances
+        )
+        errors.update(found)
+        batch_size = getattr(settings, "BULK_BATCH_SIZE", 1000)
+        fields = set()
+        pending = []
+
+        for index, data in validated.items():
+            data, many = split_many_to_many(model, data)
+            instance = instances[index]
+            fields.update(instance.set_values(pairs=data))
+            pending.append((index, instance, many))
+
+        def write(entries: list) -> list:
+            found = {}
+            model.bulk_update_validated(
+                [obj for _, obj, _ in entries],
+                fields,
+                batch_size=batch_size,
+                errors=found,
+            )
+            entries = self.drop_invalid(entries, found, errors)
+            changed = [(obj, many) for _, obj, many in entries if many]
+            set_many_to_many(model, changed, batch_size=batch_size)
+            invalidate_detail(model, [obj.pk for obj, _ in changed])
+
+            return [(index, obj) for index, obj, _ in entries]
+
+        written = self.write_batch(write, pending, errors, CONFLICT_ERROR)
+
+        return self.get_bulk_response("updated", written, errors)
+
+    def perform_bulk_delete(self, model, objs: list) -> None:
+        """
+        Delete a batch of instances.
+        :param model: Model
+        :param objs: Instances
+        :return: None
+        """
+        model.bulk_delete(objs)
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Delete a batch of instances, items are ids.
+        :param request: request
+        :return: Json of deleted ids and errors by position.
+        """
+        try:
+            items = self.get_bulk_items(request)
+        except ValidationError as exc:
+            message = {"message": "Delete failed", "errors": exc.detail}
+            return json_response(message=message, error=True)
+
+        model = self.get_serializer_class().Meta.model
+        instances, errors = load_instances(model.objects.all(), items)
+        self.check_bulk_permissions(request, instances, errors)
+
+        def write(entries: list) -> list:
+            self.perform_bulk_delete(model, [obj for _, obj in entries])
+
+            return entries
+
+        written = self.write_batch(
+            write, list(instances.items()), errors, PROTECTED_ERROR
+        )
+
+        return self.get_bulk_response("deleted", written, errors)
@@ -6,19 +6,31 @@ Authors: Kenneth Carmichael (kencar17)
 Date: March 18th, 2023
 Version: 1.0
 """
+from django.conf import settings
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListCreateAPIView
 
-from apps.common.pagination.paginations import ApiPagination
-from apps.common.utilities.utilities import json_response, default_pagination
+from apps.common.mixins.bulk_write_mixin import BulkWriteMixin
+from apps.common.mixins.sparse_fields_mixin import SparseFieldsMixin
+from apps.common.pagination.paginations import ApiPagination, ApiKeysetPagination
+from apps.common.utilities.metrics import serializer_data
+from apps.common.utilities.utilities import (
+    json_response,
+    default_pagination,
+    stream_json_response,
+)
 
 
-class BlogListCreateMixin(ListCreateAPIView):
+class BlogListCreateMixin(SparseFieldsMixin, BulkWriteMixin, ListCreateAPIView):
     """
     Mixin
     """
 
     create_serializer_class = None
+    projection_class = None
+    cursor_ordering = None
+    count_mode = None
+    stream_min_rows = None
 
     def get_create_serializer(self):
         """
@@ -27,6 +39,15 @@ class BlogListCreateMixin(ListCreateAPIView):
         """
         return self.create_serializer_class
 
+    def get_instances_context(self, instances) -> dict:
+        """
+        Get extra serializer context for the instances being serialized, ie relations
+        loaded for the whole page at once.
+        :param instances: instances to be serialized
+        :return: serializer context
+        """
+        return {}
+
     def get(self, request, *args, **kwargs):
         """
         Get instances for the system
@@ -35,31 +56,125 @@ class BlogListCreateMixin(ListCreateAPIView):
         """
 
         try:
+            fields = self.get_sparse_fields()
             queryset = self.get_queryset()
         except ValidationError as exc:
             message = {"message": "Get Failed", "errors": exc.detail}
             return json_response(message=message, error=True)
 
         queryset = self.filter_queryset(queryset=queryset)
-        pagination = ApiPagination()
+        queryset = self.shape_queryset(queryset=queryset, fields=fields)
+
+        if ApiKeysetPagination.cursor_query_param in request.query_params:
+            return self.get_cursor_page(request=request, queryset=queryset)
+
+        pagination = ApiPagination(count_mode=self.count_mode)
         page = pagination.paginate_queryset(queryset=queryset, request=request)
-        serializer = self.get_serializer_class()
+        serializer = self.projection_class or self.get_serializer_class()
 
         if not page:
-            serializer = serializer(queryset, many=True)
-            return json_response(data=default_pagination(data=serializer.data))
+            serializer = self.get_page_serializer(serializer, queryset)
+            return json_response(
+                data=default_pagination(data=serializer_data(serializer))
+            )
+
+        response = self.get_page_response(pagination=pagination, page=page)
+        response["X-Count-Mode"] = pagination.get_count_mode()
+
+        return response
+
+    def shape_queryset(self, queryset, fields: tuple = None):
+        """
+        Shape a filtered queryset into the rows a page is serialized from, projected
+        when the view has a projection class, else planned for the selected fields.
+        :param queryset: Filtered QuerySet
+        :param fields: Selected fields, None for every field
+        :return: QuerySet
+        """
+        if self.projection_class is not None:
+            return self.projection_class.project(
+                queryset, ordering=self.cursor_ordering, fields=fields
+            )
+
+        return self.plan_queryset(queryset)
+
+    def get_page_response(self, pagination, page):
+        """
+        Serialize a page of instances, or of projected rows when the view has a
+        projection class. Pages of at least stream_min_rows rows are streamed, encoding
+        each row as it is serialized.
+        :param pagination: pagination that produced the page
+        :param page: page of instances
+        :return: Json list of instances.
+        """
+        serializer = self.projection_class or self.get_serializer_class()
+        serializer = self.get_page_serializer(serializer, page)
+        stream_min_rows = self.stream_min_rows
+
+        if stream_min_rows is None:
+            stream_min_rows = getattr(settings, "JSON_STREAM_MIN_ROWS", 50)
+
+        if len(page) < stream_min_rows:
+            return json_response(
+                data=pagination.get_paginated_response(serializer_data(serializer))
+            )
 
-        serializer = serializer(page, many=True)
+        data = pagination.get_paginated_response([])
+        del data["results"]
 
-        return json_response(data=pagination.get_paginated_response(serializer.data))
+        if self.projection_class is not None:
+            rows = serializer.iter_representations()
+        else:
+            rows = (serializer.child.to_representation(instance) for instance in page)
+
+        return stream_json_response(data=data, results=rows)
+
+    def get_page_serializer(self, serializer, page):
+        """
+        Build the serializer of a page, limited to the selected fields.
+        :param serializer: serializer or projection class
+        :param page: page of instances
+        :return: serializer
+        """
+        context = self.get_instances_context(page)
+
+        if serializer is self.projection_class:
+            return serializer(
+                page, many=True, context=context, fields=self.get_sparse_fields()
+            )
+
+        return self.trim_serializer(serializer(page, many=True, context=context))
+
+    def get_cursor_page(self, request, queryset):
+        """
+        Get a page of instances using keyset pagination, seeking on the view's
+        ordering key and id.
+        :param request: request
+        :param queryset: filtered queryset
+        :return: Json list of instances.
+        """
+        pagination = ApiKeysetPagination()
+
+        try:
+            page = pagination.paginate_queryset(
+                queryset=queryset, request=request, ordering=self.cursor_ordering
+            )
+        except ValidationError as exc:
+            message = {"message": "Get Failed", "errors": exc.detail}
+            return json_response(message=message, error=True)
+
+        return self.get_page_response(pagination=pagination, page=page)
 
     def post(self, request, *args, **kwargs):
         """
-        Create a new instance.
+        Create a new instance, or a batch of instances from a list.
         :param request: request
         :return: Json of instance.
         """
 
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
+
         json_data = request.data
         serializer = self.get_create_serializer()
         serializer = serializer(data=json_data, many=False)
@@ -75,4 +190,4 @@ class BlogListCreateMixin(ListCreateAPIView):
 
         serializer = self.get_serializer_class()
 
-        return json_response(data=serializer(instance, many=False).data)
+        return json_response(data=serializer_data(serializer(instance, many=False)))
@@ -6,17 +6,49 @@ Authors: Kenneth Carmichael (kencar17)
 Date: March 18th, 2023
 Version: 1.0
 """
+from django.http import HttpResponse
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import RetrieveUpdateDestroyAPIView
+from rest_framework.permissions import BasePermission
 
-from apps.common.utilities.utilities import json_response
+from apps.common.mixins.sparse_fields_mixin import SparseFieldsMixin
+from apps.common.utilities.metrics import serializer_data
+from apps.common.utilities.response_cache import get_cached_detail, set_cached_detail
+from apps.common.utilities.utilities import is_cache_shared, json_response
 
 
-class BlogRetrieveUpdateDestroyMixin(RetrieveUpdateDestroyAPIView):
+class BlogRetrieveUpdateDestroyMixin(SparseFieldsMixin, RetrieveUpdateDestroyAPIView):
     """
     Blog Retrieve Update Destroy Mixin
     """
 
+    detail_cache = False
+
+    def get_instances_context(self, instances) -> dict:
+        """
+        Get extra serializer context for the instances being serialized, ie relations
+        loaded for all of them at once.
+        :param instances: instances to be serialized
+        :return: serializer context
+        """
+        return {}
+
+    def can_cache_detail(self) -> bool:
+        """
+        Whether responses can be served from the detail cache, cache hits skip
+        get_object so views with object permissions are never cached. A per process
+        cache is never used, since invalidations would not reach other processes.
+        :return: Boolean
+        """
+        if not self.detail_cache or not is_cache_shared():
+            return False
+
+        return all(
+            type(permission).has_object_permission
+            is BasePermission.has_object_permission
+            for permission in self.get_permissions()
+        )
+
     def get(self, request, *args, **kwargs):
         """
         Get instance information.
@@ -24,9 +56,47 @@ class BlogRetrieveUpdateDestroyMixin(RetrieveUpdateDestroyAPIView):
         :return: Instance Json.
         """
         serializer = self.get_serializer_class()
-        serializer = serializer(self.get_object(), many=False)
 
-        return json_response(data=serializer.data)
+        try:
+            fields = self.get_sparse_fields()
+        except ValidationError as exc:
+            message = {"message": "Get Failed", "errors": exc.detail}
+            return json_response(message=message, error=True)
+
+        if not self.can_cache_detail():
+            return self.get_detail(serializer, self.get_object())
+
+        model = serializer.Meta.model
+        view = type(self).__name__
+
+        if fields is not None:
+            view = f"{view}:{','.join(fields)}"
+        body = get_cached_detail(model, self.kwargs["pk"], view)
+
+        if body is not None:
+            response = HttpResponse(body, content_type="application/json")
+            response["X-Detail-Cache"] = "HIT"
+            return response
+
+        instance = self.get_object()
+        response = self.get_detail(serializer, instance)
+        set_cached_detail(instance, view, response.content)
+        response["X-Detail-Cache"] = "MISS"
+
+        return response
+
+    def get_detail(self, serializer, instance):
+        """
+        Serialize instance information.
+        :param serializer: serializer class
+        :param instance: instance
+        :return: Instance Json.
+        """
+        serializer = serializer(
+            instance, many=False, context=self.get_instances_context([instance])
+        )
+
+        return json_response(data=serializer_data(self.trim_serializer(serializer)))
 
     def put(self, request, *args, **kwargs):
         """
@@ -50,7 +120,7 @@ class BlogRetrieveUpdateDestroyMixin(RetrieveUpdateDestroyAPIView):
             message = {"message": "Update failed", "errors": exc.detail}
             return json_response(message=message, error=True)
 
-        return json_response(data=serializer.data)
+        return json_response(data=serializer_data(serializer))
 
     def delete(self, request, *args, **kwargs):
         """
@@ -0,0 +1,118 @@
+"""
+Module for Sparse Fields Mixin.
+This module contains the "fields" and "exclude" query params of get endpoints. The
+selected fields trim the serializer output, and only their columns and relations are
+loaded.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from functools import lru_cache
+from typing import Optional
+
+from rest_framework.exceptions import ValidationError
+
+from apps.common.utilities.query_planner import (
+    get_only_fields,
+    get_ordering_columns,
+    plan_related,
+)
+
+
+@lru_cache(maxsize=None)
+def get_readable_fields(serializer_class) -> tuple:
+    """
+    Get the output field names of a serializer class, in output order.
+    :param serializer_class: Serializer class
+    :return: Tuple of field names
+    """
+    return tuple(field.field_name for field in serializer_class()._readable_fields)
+
+
+class SparseFieldsMixin:
+    """
+    Sparse Fields Mixin
+    """
+
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    cursor_ordering = None
+
+    def get_query_param_names(self, param: str) -> list:
+        """
+        Get the comma separated names of a query param.
+        :param param: Query param
+        :return: List of names
+        """
+        value = self.request.query_params.get(param, "")
+
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    def get_sparse_fields(self) -> Optional[tuple]:
+        """
+        Get the fields selected by the "fields" and "exclude" query params of a get
+        request, in output order.
+        :return: Tuple of field names, or None when every field is selected
+        """
+        if self.request.method != "GET":
+            return None
+
+        fields = self.get_query_param_names(self.fields_query_param)
+        exclude = self.get_query_param_names(self.exclude_query_param)
+
+        if not fields and not exclude:
+            return None
+
+        available = get_readable_fields(self.get_serializer_class())
+        unknown = [name for name in fields + exclude if name not in available]
+
+        if unknown:
+            raise ValidationError({"fields": f"Unknown fields: {', '.join(unknown)}."})
+
+        return tuple(
+            name
+            for name in available
+            if (not fields or name in fields) and name not in exclude
+        )
+
+    def plan_queryset(self, queryset):
+        """
+        Plan the related lookups and columns of a queryset for the selected fields.
+        Columns are only limited when every selected field reads a model field.
+        :param queryset: QuerySet to be serialized
+        :return: QuerySet
+        """
+        serializer = self.get_serializer_class()
+        fields = self.get_sparse_fields()
+        queryset = plan_related(queryset, serializer, fields=fields)
+
+        if fields is None:
+            return queryset
+
+        only = get_only_fields(serializer, fields)
+
+        if only is None:
+            return queryset
+
+        return queryset.only(
+            *only, *get_ordering_columns(queryset, self.cursor_ordering)
+        )
+
+    def trim_serializer(self, serializer):
+        """
+        Remove the fields that are not selected from a serializer.
+        :param serializer: Serializer instance, or list serializer
+        :return: Serializer
+        """
+        fields = self.get_sparse_fields()
+
+        if fields is None:
+            return serializer
+
+        child = getattr(serializer, "child", serializer)
+
+        for name in list(child.fields):
+            if name not in fields:
+                child.fields.pop(name)
+
+        return serializer
@@ -6,10 +6,14 @@ Date: January 29th 2023
 Version: 1.0
 """
 
-from cryptography.fernet import Fernet
+from django.core.exceptions import ValidationError
 from django.db.models import Model
+from django.template.defaultfilters import slugify
+from django.utils import timezone
 
-from simple_blog.settings import DB_ENCRYPTION_KEY
+from apps.common.pagination.counts import invalidate_counts
+from apps.common.utilities.encryption import decrypt_value, encrypt_value
+from apps.common.utilities.response_cache import invalidate_detail
 
 
 class BaseTable(Model):
@@ -17,6 +21,10 @@ class BaseTable(Model):
     Base Table Class
     """
 
+    # Field set to the save time, and field slugified into "slug", on every save.
+    timestamp_field = None
+    slug_source_field = None
+
     class Meta:
         """
         Meta Class
@@ -48,11 +56,7 @@ class BaseTable(Model):
         :param value: str value to be encrypted
         :return: Encrypted Value
         """
-
-        fernet_encrypt = Fernet(DB_ENCRYPTION_KEY.encode())
-        token = fernet_encrypt.encrypt(value.encode())
-
-        return token.decode("utf-8")
+        return encrypt_value(value)
 
     @staticmethod
     def decrypt(token: str) -> str:
@@ -61,18 +65,419 @@ class BaseTable(Model):
         :param token: Token to be decrypted
         :return: Decrypted Value
         """
-        fernet_encrypt = Fernet(DB_ENCRYPTION_KEY.encode())
-        value = fernet_encrypt.decrypt(token.encode())
+        return decrypt_value(token)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot()
 
-        return value.decode("utf-8")
+        return instance
+
+    # Override
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self.snapshot(fields)
+
+    def snapshot(self, fields=None) -> None:
+        """
+        Record current field values as the values stored in the database, changes are
+        measured against them.
+        :param fields: field names to record, defaults to all loaded fields
+        :return: None
+        """
+        stored = self.__dict__.setdefault("_stored_values", {})
+        loaded = self.__dict__
+
+        for field in self._meta.concrete_fields:
+            if fields is not None and not {field.name, field.attname} & set(fields):
+                continue
+            if field.attname in loaded:
+                stored[field.attname] = loaded[field.attname]
+
+    def get_changed_fields(self) -> set:
+        """
+        Get names of fields whose value differs from the stored value, or that were
+        deferred when loaded and have since been set.
+        :return: Set of field names
+        """
+        stored = self.__dict__.get("_stored_values", {})
+        loaded = self.__dict__
+
+        return {
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname in loaded
+            and (
+                field.attname not in stored
+                or stored[field.attname] != loaded[field.attname]
+            )
+        }
+
+    def prepare_save(self, update_fields=None, now=None) -> set:
+        """
+        Compute derived fields before a save, ie timestamps and slugs.
+        :param update_fields: field names being written, None for all fields
+        :param now: save time, shared across a batch
+        :return: Set of derived field names that were set
+        """
+        derived = set()
+
+        if self.timestamp_field:
+            setattr(self, self.timestamp_field, now or timezone.now())
+            derived.add(self.timestamp_field)
+
+        if self.slug_source_field and (
+            update_fields is None or self.slug_source_field in update_fields
+        ):
+            self.slug = slugify(getattr(self, self.slug_source_field))
+            derived.add("slug")
+
+        return derived
+
+    @classmethod
+    def prepare_batch(cls, objs: list, derived: set) -> None:
+        """
+        Hook run after the derived fields of a batch are computed, before it is
+        validated, ie to make derived values unique across the batch.
+        :param objs: instances to be written
+        :param derived: derived field names that were set
+        :return: None
+        """
+
+    @classmethod
+    def get_auto_now_fields(cls) -> set:
+        """
+        Get names of fields Django sets to the save time.
+        :return: Set of field names
+        """
+        return {
+            field.name
+            for field in cls._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        }
+
+    def clean_save_fields(self, update_fields=None, exclude=()) -> None:
+        """
+        Validate the fields being written.
+        :param update_fields: field names being written, None for all fields
+        :param exclude: field names validated elsewhere
+        :return: None
+        """
+        self.clean_fields(
+            exclude=[
+                field.name
+                for field in self._meta.fields
+                if field.name in exclude
+                or update_fields is not None
+                and field.name not in update_fields
+                and field.attname not in update_fields
+            ]
+        )
+
+    @classmethod
+    def get_batch_relations(cls, update_fields=None) -> list:
+        """
+        Get the foreign keys being written, validated for a whole batch at once.
+        :param update_fields: field names being written, None for all fields
+        :return: List of foreign key fields
+        """
+        return [
+            field
+            for field in cls._meta.concrete_fields
+            if field.is_relation
+            and (field.many_to_one or field.one_to_one)
+            and (
+                update_fields is None
+                or field.name in update_fields
+                or field.attname in update_fields
+            )
+        ]
+
+    @classmethod
+    def validate_relations(cls, objs: list, relations: list, errors: dict) -> None:
+        """
+        Check the related rows of a batch exist, with one query per foreign key.
+        :param objs: instances to be written
+        :param relations: foreign key fields
+        :param errors: message dicts by position, errors are added to
+        :return: None
+        """
+        for field in relations:
+            remote = field.remote_field
+            values = {getattr(obj, field.attname) for obj in objs} - {None}
+
+            if not values:
+                continue
+
+            found = set(
+                remote.model._base_manager.filter(
+                    **{f"{remote.field_name}__in": values}
+                )
+                .complex_filter(field.get_limit_choices_to())
+                .values_list(remote.field_name, flat=True)
+            )
+
+            for index, obj in enumerate(objs):
+                value = getattr(obj, field.attname)
+
+                if value is None or value in found:
+                    continue
+
+                messages = ValidationError(
+                    field.error_messages["invalid"],
+                    code="invalid",
+                    params={
+                        "model": remote.model._meta.verbose_name,
+                        "pk": value,
+                        "field": remote.field_name,
+                        "value": value,
+                    },
+                ).messages
+                errors.setdefault(index, {}).setdefault(field.name, []).extend(messages)
+
+    def after_save(self, update_fields=None) -> None:
+        """
+        Hook run after the row is written.
+        :param update_fields: field names written, None for all fields
+        :return: None
+        """
+
+    @classmethod
+    def after_bulk_save(cls, objs: list, update_fields=None) -> None:
+        """
+        Hook run after a batch of rows is written.
+        :param objs: instances written
+        :param update_fields: field names written, None for all fields
+        :return: None
+        """
 
     # Override
     def save(self, *args, **kwargs) -> None:
         """
-        Save
+        Save, rows loaded from the database write only changed and derived fields
+        unless update_fields is given.
         :param args:
         :param kwargs:
         :return:
         """
-        self.clean_fields()
+        update_fields = kwargs.get("update_fields")
+
+        if (
+            update_fields is None
+            and not args
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+            and "_stored_values" in self.__dict__
+        ):
+            update_fields = self.get_changed_fields()
+
+        if update_fields is None:
+            type(self).prepare_batch([self], self.prepare_save())
+            self.clean_save_fields()
+        else:
+            update_fields = set(update_fields)
+            derived = self.prepare_save(update_fields)
+            type(self).prepare_batch([self], derived)
+            update_fields |= derived
+            update_fields |= self.get_auto_now_fields()
+            self.clean_save_fields(update_fields)
+            kwargs["update_fields"] = update_fields
+
         super().save(*args, **kwargs)
+        self.snapshot(update_fields)
+        self.after_save(update_fields)
+        invalidate_counts(model=type(self))
+        invalidate_detail(type(self), [self.pk])
+
+    @classmethod
+    def validate_batch(
+        cls, objs: list, update_fields=None, now=None, errors: dict = None
+    ) -> set:
+        """
+        Compute derived fields and validate a batch of instances, errors of every
+        instance are raised together keyed by position and field, ie "3.name".
+        :param objs: instances to be written
+        :param update_fields: field names being written, None for all fields
+        :param now: save time, shared across the batch
+        :param errors: dict collecting errors by position instead of raising them
+        :return: Set of derived field names that were set
+        """
+        now = now or timezone.now()
+        derived = set()
+        found = {}
+        relations = cls.get_batch_relations(update_fields)
+
+        for obj in objs:
+            derived |= obj.prepare_save(update_fields, now=now)
+
+        cls.prepare_batch(objs, derived)
+
+        for index, obj in enumerate(objs):
+            fields = None if update_fields is None else set(update_fields) | derived
+            # Set foreign keys are checked for the whole batch after.
+            exclude = {
+                field.name
+                for field in relations
+                if getattr(obj, field.attname) is not None
+            }
+
+            try:
+                obj.clean_save_fields(fields, exclude=exclude)
+            except ValidationError as exc:
+                found[index] = exc.message_dict
+
+        cls.validate_relations(objs, relations, found)
+
+        if errors is not None:
+            errors.update(found)
+        elif found:
+            raise ValidationError(
+                {
+                    f"{index}.{field}": messages
+                    for index, message_dict in found.items()
+                    for field, messages in message_dict.items()
+                }
+            )
+
+        return derived
+
+    @classmethod
+    def bulk_create_validated(
+        cls, objs, batch_size: int = 1000, errors: dict = None
+    ) -> list:
+        """
+        Validate and insert a batch of instances with the same derived fields as save.
+        :param objs: instances to be created
+        :param batch_size: rows per INSERT
+        :param errors: dict collecting errors by position, invalid instances are
+        skipped instead of failing the batch
+        :return: created instances
+        """
+        objs = list(objs)
+        found = {}
+        cls.validate_batch(objs, errors=found if errors is not None else None)
+
+        if found:
+            errors.update(found)
+            objs = [obj for index, obj in enumerate(objs) if index not in found]
+
+        created = cls.objects.bulk_create(objs, batch_size=batch_size)
+
+        for obj in created:
+            obj.snapshot()
+
+        cls.after_bulk_save(created)
+        invalidate_counts(model=cls)
+        invalidate_detail(cls, [obj.pk for obj in created])
+
+        return created
+
+    @classmethod
+    def bulk_update_validated(
+        cls, objs, fields, batch_size: int = 1000, errors: dict = None
+    ) -> int:
+        """
+        Validate and update fields of a batch of instances, derived fields are
+        written with them.
+        :param objs: instances to be updated
+        :param fields: field names to write
+        :param batch_size: rows per UPDATE
+        :param errors: dict collecting errors by position, invalid instances are
+        skipped instead of failing the batch
+        :return: number of rows updated
+        """
+        objs = list(objs)
+        now = timezone.now()
+        fields = set(fields) | cls.get_auto_now_fields()
+        found = {}
+
+        for obj in objs:
+            for name in cls.get_auto_now_fields():
+                setattr(obj, name, now)
+
+        fields |= cls.validate_batch(
+            objs,
+            update_fields=fields,
+            now=now,
+            errors=found if errors is not None else None,
+        )
+
+        if found:
+            errors.update(found)
+            objs = [obj for index, obj in enumerate(objs) if index not in found]
+
+        updated = 0
+
+        if fields:
+            updated = cls.objects.bulk_update(
+                objs, sorted(fields), batch_size=batch_size
+            )
+
+        for obj in objs:
+            obj.snapshot(fields)
+
+        cls.after_bulk_save(objs, fields)
+        invalidate_counts(model=cls)
+        invalidate_detail(cls, [obj.pk for obj in objs])
+
+        return updated
+
+    @classmethod
+    def before_bulk_m2m(cls, field, objs: list) -> None:
+        """
+        Hook run before the many to many rows of a batch are deleted to be replaced.
+        :param field: many to many field
+        :param objs: instances whose rows are deleted
+        :return: None
+        """
+
+    @classmethod
+    def after_bulk_m2m(cls, field, values: list) -> None:
+        """
+        Hook run after the many to many rows of a batch are inserted.
+        :param field: many to many field
+        :param values: list of instance and related primary keys tuples inserted
+        :return: None
+        """
+
+    @classmethod
+    def before_bulk_delete(cls, objs: list) -> None:
+        """
+        Hook run before a batch of rows is deleted.
+        :param objs: instances to be deleted
+        :return: None
+        """
+
+    @classmethod
+    def bulk_delete(cls, objs) -> int:
+        """
+        Delete a batch of instances in one statement, with their cascades.
+        :param objs: instances to be deleted
+        :return: number of instances deleted
+        """
+        objs = list(objs)
+        pks = [obj.pk for obj in objs]
+
+        cls.before_bulk_delete(objs)
+        cls.objects.filter(pk__in=pks).delete()
+        invalidate_counts(model=cls)
+        invalidate_detail(cls, pks)
+
+        return len(objs)
+
+    # Override
+    def delete(self, *args, **kwargs) -> tuple:
+        """
+        Delete
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        pk = self.pk
+        deleted = super().delete(*args, **kwargs)
+        invalidate_counts(model=type(self))
+        invalidate_detail(type(self), [pk])
+
+        return deleted
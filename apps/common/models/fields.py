@@ -0,0 +1,142 @@
+"""
+Encrypted database Fields.
+This module will contain model fields stored encrypted with the database encryption key.
+Values are decrypted lazily on first access, rows that are saved without touching an
+encrypted field write the stored token back untouched.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.core.exceptions import FieldError
+from django.db.models import CharField, TextField
+from django.db.models.query_utils import DeferredAttribute
+
+from apps.common.utilities.encryption import (
+    decrypt_value,
+    decrypt_values,
+    encrypt_value,
+)
+
+
+class EncryptedToken(str):
+    """
+    Token loaded from the database, a str of the ciphertext that caches its value once
+    decrypted.
+    """
+
+    def decrypt(self) -> str:
+        """
+        Decrypt token, once.
+        :return: Value
+        """
+        if not hasattr(self, "value"):
+            self.value = decrypt_value(str(self))
+
+        return self.value
+
+
+class EncryptedAttribute(DeferredAttribute):
+    """
+    Model attribute returning the decrypted value of a loaded token. Defining __set__
+    makes it a data descriptor, so it is consulted even once the token is loaded.
+    """
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        value = super().__get__(instance, cls)
+
+        if isinstance(value, EncryptedToken):
+            return value.decrypt()
+
+        return value
+
+    def __set__(self, instance, value):
+        token = instance.__dict__.get(self.field.attname)
+
+        # Assigning the decrypted value back, ie clean_fields, keeps the stored token.
+        if isinstance(token, EncryptedToken) and getattr(token, "value", None) == value:
+            return
+
+        instance.__dict__[self.field.attname] = value
+
+
+class EncryptedFieldMixin:
+    """
+    Encrypted Field Mixin, stored as text in the database whatever the value length.
+    Encrypted values cannot be filtered on other than isnull.
+    """
+
+    descriptor_class = EncryptedAttribute
+
+    def get_internal_type(self) -> str:
+        return "TextField"
+
+    def get_lookup(self, lookup_name):
+        if lookup_name != "isnull":
+            raise FieldError(
+                f"Encrypted field '{self.name}' does not support '{lookup_name}' lookups."
+            )
+
+        return super().get_lookup(lookup_name)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+
+        return EncryptedToken(value)
+
+    def pre_save(self, model_instance, add):
+        return model_instance.__dict__.get(self.attname)
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, EncryptedToken):
+            return value
+
+        return encrypt_value(str(super().get_prep_value(value)))
+
+
+class EncryptedCharField(EncryptedFieldMixin, CharField):
+    """
+    Encrypted Char Field, max_length limits the value and not the stored token.
+    """
+
+
+class EncryptedTextField(EncryptedFieldMixin, TextField):
+    """
+    Encrypted Text Field
+    """
+
+
+def decrypt_instances(instances, fields=None) -> list:
+    """
+    Decrypt encrypted fields of loaded instances in one pass with one cipher, ie before
+    serializing a page.
+    :param instances: Iterable of model instances
+    :param fields: Encrypted field names, defaults to every encrypted field
+    :return: List of instances
+    """
+    instances = list(instances)
+
+    if not instances:
+        return instances
+
+    attnames = [
+        field.attname
+        for field in instances[0]._meta.concrete_fields
+        if isinstance(field, EncryptedFieldMixin)
+        and (fields is None or field.name in fields)
+    ]
+    tokens = [
+        instance.__dict__[attname]
+        for instance in instances
+        for attname in attnames
+        if isinstance(instance.__dict__.get(attname), EncryptedToken)
+        and not hasattr(instance.__dict__[attname], "value")
+    ]
+
+    for token, value in zip(tokens, decrypt_values(tokens)):
+        token.value = value
+
+    return instances
@@ -0,0 +1,184 @@
+"""
+Module for Base Model Tests.
+This module will test field limited and batch save paths of the base model.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.account.models import Account, User
+from apps.blog.models import BlogPost, Tag
+from apps.blog.search.backends import get_search_backend
+
+
+class TestBaseTable(TestCase):
+    """
+    Test Base Table
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/tag.json",
+    ]
+
+    def get_updates(self, context) -> list:
+        """
+        Get UPDATE statements of captured queries.
+        :param context: CaptureQueriesContext
+        :return: List of sql
+        """
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+
+    def test_save_changed_fields(self):
+        """
+        Test saving a loaded row writes only changed and derived fields.
+        """
+
+        tag = Tag.objects.first()
+        tag.name = "Renamed Tag"
+
+        with CaptureQueriesContext(connection) as context:
+            tag.save()
+
+        updates = self.get_updates(context)
+
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"name"', updates[0])
+        self.assertIn('"slug"', updates[0])
+        self.assertIn('"updated_date"', updates[0])
+        self.assertNotIn('"description"', updates[0])
+
+        tag.refresh_from_db()
+        self.assertEqual(tag.slug, "renamed-tag")
+
+    def test_save_unchanged(self):
+        """
+        Test saving an unchanged row writes only fields Django sets on save.
+        """
+
+        account = Account.objects.first()
+
+        with CaptureQueriesContext(connection) as context:
+            account.save()
+
+        updates = self.get_updates(context)
+
+        self.assertEqual(len(updates), 1)
+        self.assertIn('SET "created_date" =', updates[0])
+        self.assertNotIn('"bio"', updates[0])
+
+    def test_save_update_fields(self):
+        """
+        Test update fields are the only fields validated and written.
+        """
+
+        tag = Tag.objects.first()
+        tag.description = "x" * 1000
+
+        with self.assertRaises(ValidationError):
+            tag.save(update_fields=["description"])
+
+        tag.name = "Limited"
+
+        with CaptureQueriesContext(connection) as context:
+            tag.save(update_fields=["name"])
+
+        self.assertNotIn('"description"', self.get_updates(context)[0])
+
+    def test_save_deferred_field(self):
+        """
+        Test setting a deferred field of a loaded row writes it.
+        """
+
+        tag = Tag.objects.only("id").first()
+        tag.description = "Deferred description"
+        tag.save()
+
+        self.assertEqual(Tag.objects.get(pk=tag.pk).description, "Deferred description")
+
+    def test_bulk_create_validated(self):
+        """
+        Test batch inserts derive slugs and timestamps in one statement.
+        """
+
+        tags = [
+            Tag(name=f"Bulk Tag {number}", description="Bulk") for number in range(5)
+        ]
+
+        with self.assertNumQueries(1):
+            created = Tag.bulk_create_validated(tags)
+
+        self.assertEqual(len(created), 5)
+        self.assertEqual(
+            Tag.objects.get(name="Bulk Tag 3").slug,
+            "bulk-tag-3",
+        )
+        self.assertEqual(len({tag.updated_date for tag in created}), 1)
+
+    def test_bulk_create_validated_fail(self):
+        """
+        Test batch inserts report errors by position and insert nothing.
+        """
+
+        tags = [
+            Tag(name="Valid Tag", description="Valid"),
+            Tag(name="Invalid Tag", description="x" * 1000),
+        ]
+
+        with self.assertRaises(ValidationError) as context:
+            Tag.bulk_create_validated(tags)
+
+        self.assertEqual(list(context.exception.error_dict), ["1.description"])
+        self.assertFalse(Tag.objects.filter(name="Valid Tag").exists())
+
+    def test_bulk_update_validated(self):
+        """
+        Test batch updates write requested and derived fields.
+        """
+
+        tags = list(Tag.objects.all())
+
+        for number, tag in enumerate(tags):
+            tag.name = f"Updated Tag {number}"
+
+        updated = Tag.bulk_update_validated(tags, fields=["name"])
+
+        self.assertEqual(updated, len(tags))
+        self.assertEqual(
+            set(Tag.objects.values_list("slug", flat=True)),
+            {f"updated-tag-{number}" for number in range(len(tags))},
+        )
+
+    def test_bulk_create_validated_search_index(self):
+        """
+        Test batch inserted blog posts are searchable.
+        """
+
+        account = Account.objects.first()
+        user = User.objects.first()
+        posts = [
+            BlogPost(
+                account=account,
+                author=user,
+                status="DRAFT",
+                title=f"Narwhal {number}",
+                excerpt="Narwhal",
+                content="Narwhal tusks",
+            )
+            for number in range(3)
+        ]
+
+        BlogPost.bulk_create_validated(posts)
+        found = get_search_backend().search(BlogPost.objects.all(), "tusks")
+
+        self.assertEqual(found.count(), 3)
+        self.assertEqual(BlogPost.objects.get(title="Narwhal 1").slug, "narwhal-1")
@@ -0,0 +1,177 @@
+"""
+Module for Encrypted Field Tests.
+This module will test encrypted model fields and rotating their encryption keys.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import uuid
+from io import StringIO
+
+from cryptography.fernet import Fernet
+from django.core.exceptions import FieldError, ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import UUIDField
+from django.test import TestCase, override_settings
+
+from apps.common.models.base_model import BaseTable
+from apps.common.models.fields import (
+    EncryptedCharField,
+    EncryptedTextField,
+    EncryptedToken,
+    decrypt_instances,
+)
+from apps.common.utilities.encryption import build_cipher
+
+OLD_KEY = Fernet.generate_key().decode()
+NEW_KEY = Fernet.generate_key().decode()
+
+
+class EncryptedRecord(BaseTable):
+    """
+    Test model with encrypted fields, the test database is created after test modules
+    are imported so its table is created with the project tables.
+    """
+
+    id = UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    secret = EncryptedCharField(max_length=20)
+    notes = EncryptedTextField(null=True, blank=True)
+
+    class Meta:
+        """
+        Meta Class
+        """
+
+        app_label = "common"
+
+
+@override_settings(DB_ENCRYPTION_KEY=NEW_KEY, DB_ENCRYPTION_OLD_KEYS=[])
+class TestEncryptedFields(TestCase):
+    """
+    Test Encrypted Fields
+    """
+
+    def get_stored(self, record, column: str = "secret") -> str:
+        """
+        Get the stored token of a record.
+        :param record: EncryptedRecord
+        :param column: Column name
+        :return: Token
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {column} FROM common_encryptedrecord WHERE id = %s",
+                [record.id.hex],
+            )
+            return cursor.fetchone()[0]
+
+    def test_encrypted_round_trip(self):
+        """
+        Test values are stored encrypted and read back decrypted.
+        """
+
+        record = EncryptedRecord.objects.create(secret="hunter2", notes="notes")
+        stored = self.get_stored(record)
+
+        self.assertNotIn("hunter2", stored)
+        self.assertEqual(Fernet(NEW_KEY).decrypt(stored.encode()), b"hunter2")
+
+        record = EncryptedRecord.objects.get(pk=record.pk)
+
+        self.assertIsInstance(record.__dict__["secret"], EncryptedToken)
+        self.assertEqual(record.secret, "hunter2")
+        self.assertEqual(record.notes, "notes")
+
+    def test_encrypted_lazy(self):
+        """
+        Test tokens are decrypted on first access and not rewritten when unchanged.
+        """
+
+        record = EncryptedRecord.objects.create(secret="hunter2")
+        stored = self.get_stored(record)
+        record = EncryptedRecord.objects.get(pk=record.pk)
+
+        self.assertFalse(hasattr(record.__dict__["secret"], "value"))
+        self.assertEqual(record.secret, "hunter2")
+        self.assertTrue(hasattr(record.__dict__["secret"], "value"))
+
+        record.save(update_fields=["secret"])
+        self.assertEqual(self.get_stored(record), stored)
+
+        record.secret = "changed"
+        record.save()
+        self.assertNotEqual(self.get_stored(record), stored)
+        self.assertEqual(EncryptedRecord.objects.get(pk=record.pk).secret, "changed")
+
+    def test_encrypted_validation(self):
+        """
+        Test max length applies to the value and not the token.
+        """
+
+        with self.assertRaises(ValidationError):
+            EncryptedRecord.objects.create(secret="x" * 21)
+
+        with self.assertRaises(FieldError):
+            EncryptedRecord.objects.filter(secret="hunter2")
+
+        self.assertEqual(EncryptedRecord.objects.filter(notes__isnull=True).count(), 0)
+
+    def test_decrypt_instances(self):
+        """
+        Test a page of instances is decrypted in one pass.
+        """
+
+        for number in range(3):
+            EncryptedRecord.objects.create(secret=f"secret {number}")
+
+        records = decrypt_instances(EncryptedRecord.objects.order_by("secret"))
+
+        for record in records:
+            self.assertTrue(hasattr(record.__dict__["secret"], "value"))
+
+        self.assertEqual(
+            sorted(record.secret for record in records),
+            ["secret 0", "secret 1", "secret 2"],
+        )
+
+    def test_rotate_encryption_keys(self):
+        """
+        Test rows are re-encrypted with the current key in chunks.
+        """
+
+        with override_settings(DB_ENCRYPTION_KEY=OLD_KEY):
+            records = [
+                EncryptedRecord.objects.create(secret=f"secret {number}", notes=None)
+                for number in range(5)
+            ]
+
+        with override_settings(DB_ENCRYPTION_OLD_KEYS=[OLD_KEY]):
+            self.assertEqual(
+                EncryptedRecord.objects.get(pk=records[0].pk).secret, "secret 0"
+            )
+
+            out = StringIO()
+            call_command(
+                "rotate_encryption_keys",
+                "--model=common.EncryptedRecord",
+                "--chunk-size=2",
+                stdout=out,
+            )
+
+            self.assertIn("common.EncryptedRecord: rotated 5 rows.", out.getvalue())
+
+            out = StringIO()
+            call_command(
+                "rotate_encryption_keys", "--model=common.EncryptedRecord", stdout=out
+            )
+
+            self.assertIn("common.EncryptedRecord: rotated 0 rows.", out.getvalue())
+
+        for record in records:
+            self.assertEqual(
+                EncryptedRecord.objects.get(pk=record.pk).secret, record.secret
+            )
+            self.assertIsNone(self.get_stored(record, "notes"))
+
+        self.assertEqual(build_cipher.cache_info().maxsize, 8)
@@ -0,0 +1,272 @@
+"""
+Module for pagination count strategies.
+This module determines how the total count of a paginated queryset is produced. Counts
+can be exact, cached per filter signature, or estimated by the database planner.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from apps.common.utilities.utilities import is_cache_shared
+
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+
+COUNT_VERSION_KEY = "blog:count-version:{label}"
+COUNT_KEY = "blog:count:{label}:{version}:{signature}"
+
+
+def get_count_version(model) -> str:
+    """
+    Get the current count cache version for a model.
+    :param model: Model class
+    :return: Version string
+    """
+    key = COUNT_VERSION_KEY.format(label=model._meta.label_lower)
+    version = cache.get(key)
+
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(key, version, timeout=None)
+
+    return version
+
+
+def invalidate_counts(model) -> None:
+    """
+    Invalidate all cached counts for a model by moving it to a new version.
+    :param model: Model class
+    :return: None
+    """
+    key = COUNT_VERSION_KEY.format(label=model._meta.label_lower)
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+def get_filter_signature(queryset) -> str:
+    """
+    Normalize a queryset into a signature of its filters. Ordering does not change a
+    count, so it is removed before hashing the sql and params.
+    :param queryset: QuerySet
+    :return: Signature hash
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    payload = f"{queryset.db}:{sql}:{params!r}".encode("utf-8")
+
+    return hashlib.sha1(payload).hexdigest()
+
+
+class ExactCount:
+    """
+    Exact count strategy, a SELECT COUNT(*) over the filtered queryset.
+    """
+
+    mode = COUNT_EXACT
+
+    def count(self, queryset) -> tuple:
+        """
+        Count queryset.
+        :param queryset: QuerySet
+        :return: Tuple of count and the mode that produced it
+        """
+        return queryset.count(), COUNT_EXACT
+
+
+class CachedCount(ExactCount):
+    """
+    Cached count strategy, exact counts kept per filter signature until the ttl expires
+    or a row of the model is saved. Counts are exact when the cache is per process, since
+    invalidations would not reach other processes.
+    """
+
+    mode = COUNT_CACHED
+
+    def __init__(self, ttl: int = None):
+        if ttl is None:
+            ttl = getattr(settings, "PAGINATION_COUNT_CACHE_TTL", 60)
+        self.ttl = ttl
+
+    def count(self, queryset) -> tuple:
+        """
+        Count queryset, using the cached count when present.
+        :param queryset: QuerySet
+        :return: Tuple of count and the mode that produced it
+        """
+        if not is_cache_shared():
+            return super().count(queryset)
+
+        key = COUNT_KEY.format(
+            label=queryset.model._meta.label_lower,
+            version=get_count_version(queryset.model),
+            signature=get_filter_signature(queryset),
+        )
+        total = cache.get(key)
+
+        if total is not None:
+            return total, self.mode
+
+        total, _ = super().count(queryset)
+        cache.set(key, total, timeout=self.ttl)
+
+        return total, COUNT_EXACT
+
+
+class EstimatedCount(ExactCount):
+    """
+    Estimated count strategy, uses planner row estimates on Postgres. Estimates below the
+    threshold are replaced with an exact count, other databases always count exactly.
+    """
+
+    mode = COUNT_ESTIMATED
+
+    def __init__(self, threshold: int = None):
+        if threshold is None:
+            threshold = getattr(settings, "PAGINATION_COUNT_ESTIMATE_THRESHOLD", 10000)
+        self.threshold = threshold
+
+    @staticmethod
+    def table_estimate(queryset):
+        """
+        Get the planner statistics row count of the queryset table.
+        :param queryset: QuerySet
+        :return: Row estimate or None if the table has not been analyzed
+        """
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        if not row or row[0] < 0:
+            return None
+
+        return row[0]
+
+    @staticmethod
+    def plan_estimate(queryset):
+        """
+        Get the planner row estimate of the filtered queryset from EXPLAIN.
+        :param queryset: QuerySet
+        :return: Row estimate
+        """
+        plan = json.loads(queryset.order_by().explain(format="json"))
+
+        return plan[0]["Plan"]["Plan Rows"]
+
+    def count(self, queryset) -> tuple:
+        """
+        Count queryset, using a planner estimate when it is above the threshold.
+        :param queryset: QuerySet
+        :return: Tuple of count and the mode that produced it
+        """
+        if connections[queryset.db].vendor != "postgresql":
+            return super().count(queryset)
+
+        if queryset.query.has_filters() or queryset.query.distinct:
+            estimate = self.plan_estimate(queryset)
+        else:
+            estimate = self.table_estimate(queryset)
+
+        if estimate is None or estimate < self.threshold:
+            return super().count(queryset)
+
+        return estimate, self.mode
+
+
+COUNT_STRATEGIES = {
+    COUNT_EXACT: ExactCount,
+    COUNT_CACHED: CachedCount,
+    COUNT_ESTIMATED: EstimatedCount,
+}
+
+
+def get_count_strategy(mode: str = None):
+    """
+    Get count strategy for a mode, defaults to the project setting.
+    :param mode: One of exact, cached, or estimated
+    :return: Count strategy instance
+    """
+    if mode is None:
+        mode = getattr(settings, "PAGINATION_COUNT_MODE", COUNT_EXACT)
+
+    try:
+        return COUNT_STRATEGIES[mode]()
+    except KeyError as exc:
+        raise ValueError(f"Unknown pagination count mode '{mode}'.") from exc
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Django Paginator that produces its count through a count strategy. An estimated
+    count only bounds the reported count, pages past it are served while they hold rows.
+    """
+
+    def __init__(self, object_list, per_page, strategy=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.strategy = strategy or ExactCount()
+        self.count_mode = None
+
+    @cached_property
+    def count(self) -> int:
+        """
+        Total number of objects, across all pages.
+        :return: Count
+        """
+        if not hasattr(self.object_list, "query"):
+            self.count_mode = COUNT_EXACT
+            return len(self.object_list)
+
+        total, self.count_mode = self.strategy.count(self.object_list)
+
+        return total
+
+    def validate_number(self, number) -> int:
+        """
+        Validate a page number, pages past an estimated count are checked when sliced.
+        :param number: Page number
+        :return: Page number
+        """
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_mode != COUNT_ESTIMATED or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        """
+        Get a page. With an estimated count the page is sliced without clamping to the
+        count, and the count is corrected by the rows seen, so has_next stays right.
+        :param number: Page number
+        :return: Page
+        """
+        _ = self.count
+
+        if self.count_mode != COUNT_ESTIMATED:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+
+        if not rows and number > 1:
+            raise EmptyPage("That page contains no results")
+
+        seen = bottom + len(rows)
+
+        # A page short of a full one is the last, its rows give the exact count.
+        if len(rows) <= self.per_page or seen > self.count:
+            self.__dict__["count"] = seen
+            self.__dict__.pop("num_pages", None)
+
+        return self._get_page(rows[: self.per_page], number, self)
@@ -7,9 +7,20 @@ Authors: Kenneth Carmichael (kencar17)
 Date: January 26th 2023
 Version: 1.0
 """
+import base64
+import json
 import math
+from datetime import date, datetime
+from typing import Optional
 
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
 from rest_framework import pagination
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.urls import replace_query_param
+
+from apps.common.pagination.counts import CountStrategyPaginator, get_count_strategy
 
 
 class ApiPagination(pagination.PageNumberPagination):
@@ -22,6 +33,25 @@ class ApiPagination(pagination.PageNumberPagination):
     max_page_size = 100
     page_query_param = "page"
 
+    def __init__(self, count_mode: str = None):
+        self.count_strategy = get_count_strategy(mode=count_mode)
+
+    def django_paginator_class(self, queryset, page_size) -> CountStrategyPaginator:
+        """
+        Build the django paginator, counting through the configured count strategy.
+        :param queryset: QuerySet to paginate
+        :param page_size: Page size
+        :return: Paginator
+        """
+        return CountStrategyPaginator(queryset, page_size, strategy=self.count_strategy)
+
+    def get_count_mode(self) -> str:
+        """
+        Get the count mode that produced the count of the current page.
+        :return: exact, cached, or estimated
+        """
+        return self.page.paginator.count_mode
+
     def get_paginated_response(self, data) -> dict:
         """
         Format pagination response into a standard format with response fields.
@@ -42,3 +72,242 @@ class ApiPagination(pagination.PageNumberPagination):
             "next": self.get_next_link(),
             "results": data,
         }
+
+
+class ApiKeysetPagination:
+    """
+    Keyset (cursor) pagination class. Pages are found by seeking past the last
+    (ordering key, id) pair seen instead of an OFFSET, so the cost of a page does
+    not depend on how deep it is and no COUNT(*) is issued.
+    """
+
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+
+    def __init__(self):
+        self.request = None
+        self.field = None
+        self.descending = True
+        self.cursor = ""
+        self.has_next = False
+        self.has_previous = False
+        self.page = []
+
+    def get_page_size(self, request) -> int:
+        """
+        Get page size from request, limited to the max page size.
+        :param request: request
+        :return: page size
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    @staticmethod
+    def get_ordering(queryset, ordering: str = None) -> tuple:
+        """
+        Determine the keyset ordering field. Defaults to the first ordering key of the
+        queryset, falls back to the primary key when it is not a concrete column.
+        :param queryset: QuerySet to paginate
+        :param ordering: Explicit ordering key, ie "-created_date"
+        :return: Tuple of model field and descending boolean
+        """
+        if ordering is None:
+            order_by = queryset.query.order_by
+            ordering = order_by[0] if order_by else "-pk"
+
+        if not isinstance(ordering, str):
+            ordering = "-pk"
+
+        descending = ordering.startswith("-")
+        name = ordering.lstrip("-")
+
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = queryset.model._meta.pk
+
+        if not field.concrete or field.is_relation:
+            field = queryset.model._meta.pk
+
+        return field, descending
+
+    def encode_cursor(self, instance, reverse: bool) -> str:
+        """
+        Encode cursor for an instance position.
+        :param instance: Model instance or projected row at the edge of a page
+        :param reverse: Whether the cursor seeks backwards
+        :return: Url safe cursor string
+        """
+        if isinstance(instance, dict):
+            value = instance[self.field.attname]
+            key = instance[self.field.model._meta.pk.attname]
+        else:
+            value = getattr(instance, self.field.attname)
+            key = instance.pk
+
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif value is not None and not isinstance(value, (int, float, bool, str)):
+            value = str(value)
+
+        position = {"v": value, "k": str(key), "r": reverse}
+        token = base64.urlsafe_b64encode(json.dumps(position).encode("utf-8"))
+
+        return token.decode("utf-8")
+
+    def decode_cursor(self, model, cursor: str) -> tuple:
+        """
+        Decode cursor into a position.
+        :param model: Model class being paginated
+        :param cursor: Cursor string
+        :return: Tuple of value, primary key, and reverse boolean
+        """
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+            value = position["v"]
+
+            if value is not None:
+                value = self.field.to_python(value)
+
+            key = model._meta.pk.to_python(position["k"])
+            reverse = bool(position["r"])
+        except (TypeError, ValueError, KeyError, DjangoValidationError) as exc:
+            raise ValidationError("Invalid cursor.") from exc
+
+        return value, key, reverse
+
+    def seek(self, value, key, forward: bool, key_name: str = "pk") -> Q:
+        """
+        Build the seek condition for rows after a position. Null ordering values
+        always sort as the smallest value.
+        :param value: Ordering value of the position
+        :param key: Primary key of the position
+        :param forward: Whether to seek in the direction of the ordering
+        :param key_name: Field holding the key, ie a foreign key to the paginated model
+        :return: Q filter
+        """
+        name = self.field.attname
+        smaller = forward == self.descending
+
+        if value is None:
+            if smaller:
+                return Q(**{f"{name}__isnull": True, f"{key_name}__lt": key})
+            return Q(**{f"{name}__isnull": True, f"{key_name}__gt": key}) | Q(
+                **{f"{name}__isnull": False}
+            )
+
+        lookup = "lt" if smaller else "gt"
+        condition = Q(**{f"{name}__{lookup}": value}) | Q(
+            **{name: value, f"{key_name}__{lookup}": key}
+        )
+
+        if smaller and self.field.null:
+            condition |= Q(**{f"{name}__isnull": True})
+
+        return condition
+
+    def order(self, queryset, forward: bool, key_name: str = "pk"):
+        """
+        Order queryset by (ordering key, id) in the requested direction.
+        :param queryset: QuerySet
+        :param forward: Whether to order in the direction of the ordering
+        :param key_name: Field holding the key, ie a foreign key to the paginated model
+        :return: Ordered QuerySet
+        """
+        descending = forward == self.descending
+
+        if descending:
+            return queryset.order_by(
+                F(self.field.attname).desc(nulls_last=True), f"-{key_name}"
+            )
+
+        return queryset.order_by(F(self.field.attname).asc(nulls_first=True), key_name)
+
+    def paginate_queryset(self, queryset, request, ordering: str = None) -> list:
+        """
+        Paginate queryset by seeking from the request cursor.
+        :param queryset: QuerySet to paginate
+        :param request: request
+        :param ordering: Explicit ordering key, defaults to queryset ordering
+        :return: List of instances for the page
+        """
+        self.request = request
+        self.field, self.descending = self.get_ordering(queryset, ordering)
+        self.cursor = request.query_params.get(self.cursor_query_param, "")
+        page_size = self.get_page_size(request)
+        forward = True
+
+        if self.cursor:
+            value, key, reverse = self.decode_cursor(queryset.model, self.cursor)
+            forward = not reverse
+            queryset = queryset.filter(self.seek(value, key, forward=forward))
+
+        rows = list(self.order(queryset, forward=forward)[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if forward:
+            self.has_next = has_more
+            self.has_previous = bool(self.cursor)
+        else:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+
+        self.page = rows
+
+        return rows
+
+    def get_next_link(self) -> Optional[str]:
+        """
+        Get link to the next page.
+        :return: Url or None
+        """
+        if not self.has_next or not self.page:
+            return None
+
+        cursor = self.encode_cursor(self.page[-1], reverse=False)
+
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def get_previous_link(self) -> Optional[str]:
+        """
+        Get link to the previous page.
+        :return: Url or None
+        """
+        if not self.has_previous or not self.page:
+            return None
+
+        cursor = self.encode_cursor(self.page[0], reverse=True)
+
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def get_paginated_response(self, data) -> dict:
+        """
+        Format pagination response into the standard format. Count and pages are not
+        known in cursor mode, current is the cursor used for this page.
+        :param data: QuerySet data
+        :return: Dictionary of pagination results.
+        """
+
+        return {
+            "count": None,
+            "pages": None,
+            "current": self.cursor or None,
+            "previous": self.get_previous_link(),
+            "next": self.get_next_link(),
+            "results": data,
+        }
@@ -0,0 +1,162 @@
+"""
+Module for Pagination Count Strategy Tests.
+This module will test all pagination count strategies.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.test import TestCase, override_settings
+
+from apps.blog.models import Tag
+from apps.common.pagination.counts import (
+    CachedCount,
+    CountStrategyPaginator,
+    EstimatedCount,
+    ExactCount,
+    get_count_strategy,
+)
+
+
+class TestCountStrategies(TestCase):
+    """
+    Test Count Strategies
+    """
+
+    fixtures = ["tests/tag.json"]
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_exact_count(self):
+        """
+        Test exact count.
+        """
+
+        self.assertEqual(ExactCount().count(Tag.objects.all()), (2, "exact"))
+
+    def test_cached_count(self):
+        """
+        Test cached count is reused until the model is saved.
+        """
+
+        strategy = CachedCount(ttl=60)
+
+        self.assertEqual(strategy.count(Tag.objects.all()), (2, "exact"))
+
+        # Queryset deletes do not invalidate, the cached count is returned.
+        Tag.objects.filter(name="Django").delete()
+        self.assertEqual(strategy.count(Tag.objects.all()), (2, "cached"))
+        self.assertEqual(
+            strategy.count(Tag.objects.all().order_by("name")), (2, "cached")
+        )
+
+        Tag.objects.create(name="Rust", description="Rust Language")
+        self.assertEqual(strategy.count(Tag.objects.all()), (2, "exact"))
+
+    @override_settings(CACHE_SHARED=False)
+    def test_cached_count_local_cache(self):
+        """
+        Test counts are exact when the cache is per process.
+        """
+
+        strategy = CachedCount(ttl=60)
+
+        self.assertEqual(strategy.count(Tag.objects.all()), (2, "exact"))
+
+        Tag.objects.filter(name="Django").delete()
+        self.assertEqual(strategy.count(Tag.objects.all()), (1, "exact"))
+
+    def test_cached_count_filter_signature(self):
+        """
+        Test cached counts are kept per filter signature.
+        """
+
+        strategy = CachedCount(ttl=60)
+
+        self.assertEqual(strategy.count(Tag.objects.all()), (2, "exact"))
+        self.assertEqual(
+            strategy.count(Tag.objects.filter(name="Python")), (1, "exact")
+        )
+        self.assertEqual(
+            strategy.count(Tag.objects.filter(name="Python")), (1, "cached")
+        )
+
+    def test_estimated_count_fallback(self):
+        """
+        Test estimated count falls back to an exact count off Postgres.
+        """
+
+        self.assertEqual(
+            EstimatedCount(threshold=0).count(Tag.objects.all()), (2, "exact")
+        )
+
+    def test_get_count_strategy(self):
+        """
+        Test count strategy lookup.
+        """
+
+        self.assertIsInstance(get_count_strategy(), ExactCount)
+        self.assertIsInstance(get_count_strategy(mode="cached"), CachedCount)
+
+        with self.assertRaises(ValueError):
+            get_count_strategy(mode="guess")
+
+    def test_paginator_count_mode(self):
+        """
+        Test paginator records the count mode.
+        """
+
+        paginator = CountStrategyPaginator(
+            Tag.objects.all().order_by("name"), 1, strategy=CachedCount()
+        )
+
+        self.assertEqual(paginator.count, 2)
+        self.assertEqual(paginator.num_pages, 2)
+        self.assertEqual(paginator.count_mode, "exact")
+
+    def test_paginator_low_estimate(self):
+        """
+        Test pages past a low estimated count are served, and the count corrected.
+        """
+
+        strategy = EstimatedCount()
+        paginator = CountStrategyPaginator(
+            Tag.objects.all().order_by("name"), 1, strategy=strategy
+        )
+
+        with mock.patch.object(strategy, "count", return_value=(1, "estimated")):
+            page = paginator.page(2)
+
+        self.assertEqual([tag.name for tag in page], ["Python"])
+        self.assertFalse(page.has_next())
+        self.assertEqual(paginator.count, 2)
+        self.assertEqual(paginator.count_mode, "estimated")
+
+        with self.assertRaises(EmptyPage):
+            paginator.page(3)
+
+    def test_paginator_high_estimate(self):
+        """
+        Test the last page corrects a high estimated count.
+        """
+
+        strategy = EstimatedCount()
+        paginator = CountStrategyPaginator(
+            Tag.objects.all().order_by("name"), 1, strategy=strategy
+        )
+
+        with mock.patch.object(strategy, "count", return_value=(10, "estimated")):
+            page = paginator.page(1)
+
+            self.assertTrue(page.has_next())
+            self.assertEqual(paginator.count, 10)
+
+            page = paginator.page(2)
+
+        self.assertFalse(page.has_next())
+        self.assertEqual(paginator.num_pages, 2)
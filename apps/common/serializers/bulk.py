@@ -0,0 +1,224 @@
+"""
+Module for bulk serializer validation.
+This module will validate a batch of items with one serializer. Related primary keys of
+the whole batch are loaded with one query per relation before validating, instead of a
+query per item and relation, and many to many values are written with one insert per
+relation.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+
+
+class PrefetchedQueryset:
+    """
+    Prefetched Queryset, answers the primary key lookups of a related field from rows
+    loaded for the whole batch.
+    """
+
+    def __init__(self, model, rows: dict):
+        self.model = model
+        self.rows = rows
+
+    @classmethod
+    def load(cls, queryset, values):
+        """
+        Load the rows of raw primary keys with one query, invalid keys are skipped.
+        :param queryset: Related queryset
+        :param values: Raw primary keys
+        :return: Prefetched queryset
+        """
+        prefetched = cls(queryset.model, {})
+        pks = set()
+
+        for value in values:
+            if value is None or isinstance(value, bool):
+                continue
+
+            try:
+                pks.add(prefetched.to_python(value))
+            except (TypeError, ValueError):
+                continue
+
+        prefetched.rows = queryset.in_bulk(list(pks))
+
+        return prefetched
+
+    def to_python(self, value):
+        """
+        Convert a raw primary key as the primary key field would.
+        :param value: Raw primary key
+        :return: Primary key
+        """
+        try:
+            return self.model._meta.pk.to_python(value)
+        except (DjangoValidationError, AttributeError) as exc:
+            raise ValueError(value) from exc
+
+    def get(self, pk=None):
+        """
+        Get a prefetched row.
+        :param pk: Raw primary key
+        :return: Instance
+        """
+        try:
+            return self.rows[self.to_python(pk)]
+        except KeyError as exc:
+            raise self.model.DoesNotExist from exc
+
+
+def get_relations(serializer) -> list:
+    """
+    Get the writable primary key relations of a serializer.
+    :param serializer: Serializer
+    :return: List of field name, relation, and many tuples
+    """
+    relations = []
+
+    for field in serializer.fields.values():
+        many = isinstance(field, ManyRelatedField)
+        relation = field.child_relation if many else field
+
+        if (
+            field.read_only
+            or not isinstance(relation, PrimaryKeyRelatedField)
+            or relation.pk_field is not None
+        ):
+            continue
+
+        relations.append((field.field_name, relation, many))
+
+    return relations
+
+
+def prefetch_relations(serializer, items) -> None:
+    """
+    Load the related rows every item refers to, with one query per relation.
+    :param serializer: Serializer validating the items
+    :param items: Raw items
+    :return: None
+    """
+    items = [item for item in items if isinstance(item, dict)]
+
+    for name, relation, many in get_relations(serializer):
+        values = []
+
+        for item in items:
+            value = item.get(name)
+
+            if many and isinstance(value, list):
+                values.extend(value)
+            elif not many:
+                values.append(value)
+
+        relation.queryset = PrefetchedQueryset.load(relation.get_queryset(), values)
+
+
+def load_instances(queryset, ids: list) -> tuple:
+    """
+    Load the instances of a batch of raw primary keys with one query.
+    :param queryset: Queryset of the instances
+    :param ids: Raw primary keys
+    :return: Tuple of instances by position and errors by position
+    """
+    prefetched = PrefetchedQueryset.load(queryset, ids)
+    instances = {}
+    errors = {}
+
+    for index, pk in enumerate(ids):
+        try:
+            instances[index] = prefetched.get(pk)
+        except (ObjectDoesNotExist, TypeError, ValueError):
+            errors[index] = {"id": ["Not found."]}
+
+    return instances, errors
+
+
+def validate_items(serializer, items: dict, instances: dict = None) -> tuple:
+    """
+    Validate a batch of items with one serializer.
+    :param serializer: Serializer, partial for updates
+    :param items: Raw items by position
+    :param instances: Instance each item updates by position, None for creates
+    :return: Tuple of validated data by position and errors by position
+    """
+    validated = {}
+    errors = {}
+
+    prefetch_relations(serializer, items.values())
+
+    for index, item in items.items():
+        if not isinstance(item, dict):
+            errors[index] = {"non_field_errors": ["Expected an object."]}
+            continue
+
+        serializer.instance = instances[index] if instances else None
+
+        try:
+            validated[index] = serializer.run_validation(item)
+        except ValidationError as exc:
+            errors[index] = exc.detail
+
+    serializer.instance = None
+
+    return validated, errors
+
+
+def split_many_to_many(model, data: dict) -> tuple:
+    """
+    Split many to many values from validated data.
+    :param model: Model
+    :param data: Validated data
+    :return: Tuple of field data and many to many data
+    """
+    names = {field.name for field in model._meta.many_to_many}
+    fields = {key: value for key, value in data.items() if key not in names}
+    many = {key: value for key, value in data.items() if key in names}
+
+    return fields, many
+
+
+def set_many_to_many(
+    model, values: list, batch_size: int = 1000, replace: bool = True
+) -> None:
+    """
+    Set many to many values of a batch of instances, with one delete and one insert
+    per relation.
+    :param model: Model
+    :param values: List of instance and many to many data tuples
+    :param batch_size: rows per INSERT
+    :param replace: Delete existing values first, not needed for new instances
+    :return: None
+    """
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        source = f"{field.m2m_field_name()}_id"
+        target = f"{field.m2m_reverse_field_name()}_id"
+        changed = [
+            (obj, list(dict.fromkeys(related.pk for related in many[field.name])))
+            for obj, many in values
+            if field.name in many
+        ]
+
+        if not changed:
+            continue
+
+        if replace:
+            model.before_bulk_m2m(field, [obj for obj, _ in changed])
+            through.objects.filter(
+                **{f"{source}__in": [obj.pk for obj, _ in changed]}
+            ).delete()
+
+        through.objects.bulk_create(
+            [
+                through(**{source: obj.pk, target: pk})
+                for obj, related in changed
+                for pk in related
+            ],
+            batch_size=batch_size,
+        )
+        model.after_bulk_m2m(field, changed)
@@ -0,0 +1,234 @@
+"""
+Module for Projection Serializers.
+This module will contain read only serializers that render rows of a .values() projection
+instead of model instances. The fields of a model serializer are compiled once into the
+columns to select and a converter per field, so a list page skips building a model
+instance and field lookups per row while rendering the same JSON.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from collections import defaultdict
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from rest_framework import fields as drf_fields
+from rest_framework.relations import ManyRelatedField, PKOnlyObject, RelatedField
+from rest_framework.serializers import BaseSerializer
+
+from apps.common.models.fields import EncryptedFieldMixin, EncryptedToken
+from apps.common.utilities.query_planner import get_ordering_columns
+
+# Fields whose representation of a database value is the value itself.
+PASSTHROUGH_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.EmailField,
+    drf_fields.IntegerField,
+    drf_fields.SlugField,
+    drf_fields.URLField,
+)
+
+
+def related_converter(field):
+    """
+    Build the converter of a primary key related field.
+    :param field: Related serializer field
+    :return: Function of a primary key
+    """
+    return lambda value: field.to_representation(PKOnlyObject(pk=value))
+
+
+def decrypting_converter(convert):
+    """
+    Wrap a converter to decrypt encrypted tokens first, as the model attribute would.
+    :param convert: Converter or None
+    :return: Function of a stored value
+    """
+
+    def decrypt(value):
+        if isinstance(value, EncryptedToken):
+            value = value.decrypt()
+
+        return value if convert is None else convert(value)
+
+    return decrypt
+
+
+def compile_field(field, model) -> tuple:
+    """
+    Compile a serializer field into its projected column and converter.
+    :param field: Serializer field
+    :param model: Model the serializer reads from
+    :return: Tuple of output name, column or many to many model field, and converter
+    """
+    name = field.field_name
+
+    if field.source == "*" or "." in field.source:
+        raise ImproperlyConfigured(f"Field '{name}' cannot be projected.")
+
+    try:
+        model_field = model._meta.get_field(field.source)
+    except FieldDoesNotExist as exc:
+        raise ImproperlyConfigured(f"Field '{name}' is not a model field.") from exc
+
+    if isinstance(field, ManyRelatedField):
+        if not field.child_relation.use_pk_only_optimization():
+            raise ImproperlyConfigured(f"Field '{name}' must render primary keys.")
+
+        return name, model_field, related_converter(field.child_relation)
+
+    if isinstance(field, BaseSerializer) or not model_field.concrete:
+        raise ImproperlyConfigured(f"Field '{name}' cannot be projected.")
+
+    if isinstance(field, RelatedField):
+        if not field.use_pk_only_optimization():
+            raise ImproperlyConfigured(f"Field '{name}' must render primary keys.")
+
+        return name, model_field.attname, related_converter(field)
+
+    convert = None if type(field) in PASSTHROUGH_FIELDS else field.to_representation
+
+    if isinstance(model_field, EncryptedFieldMixin):
+        convert = decrypting_converter(convert)
+
+    return name, model_field.attname, convert
+
+
+@lru_cache(maxsize=None)
+def compile_projection(serializer_class, fields: tuple = None) -> tuple:
+    """
+    Compile the readable fields of a model serializer class, once per class and field
+    selection. Fields keep the serializer order, a many to many field has no column and
+    the index of its many to many model field instead.
+    :param serializer_class: ModelSerializer class
+    :param fields: Field names to compile, defaults to every field
+    :return: Tuple of model, columns, fields, and many to many model fields
+    """
+    model = serializer_class.Meta.model
+    columns = [model._meta.pk.attname]
+    compiled = []
+    many_fields = []
+
+    for field in serializer_class()._readable_fields:
+        if fields is not None and field.field_name not in fields:
+            continue
+
+        name, column, convert = compile_field(field, model)
+
+        if isinstance(column, str):
+            compiled.append((name, column, None, convert))
+            columns.append(column)
+        else:
+            compiled.append((name, None, len(many_fields), convert))
+            many_fields.append(column)
+
+    return model, tuple(dict.fromkeys(columns)), tuple(compiled), tuple(many_fields)
+
+
+class ProjectionSerializer:
+    """
+    Read only serializer rendering projected rows as serializer_class renders instances.
+    Serializes a list of rows from project(), the many to many fields of the rows are
+    loaded in one query per field.
+    """
+
+    serializer_class = None
+
+    def __init__(
+        self, rows, many: bool = True, context: dict = None, fields: tuple = None
+    ):
+        self.rows = rows
+        self.many = many
+        self.context = context or {}
+        self.fields = fields
+
+    @classmethod
+    def get_compiled(cls, fields: tuple = None) -> tuple:
+        """
+        Get the compiled projection of the serializer class.
+        :param fields: Field names to render, defaults to every field
+        :return: Tuple of model, columns, fields, and many to many model fields
+        """
+        return compile_projection(cls.serializer_class, fields)
+
+    @classmethod
+    def project(cls, queryset, ordering: str = None, fields: tuple = None):
+        """
+        Project a queryset to the columns of the serializer. Concrete ordering columns
+        are selected too, for cursors.
+        :param queryset: QuerySet of the serializer model
+        :param ordering: Extra ordering key, ie the cursor ordering of a view
+        :param fields: Field names to render, defaults to every field
+        :return: Values QuerySet
+        """
+        _, columns, _, _ = cls.get_compiled(fields)
+        columns += get_ordering_columns(queryset, ordering)
+
+        return queryset.values(*dict.fromkeys(columns))
+
+    def get_many_values(self, rows) -> list:
+        """
+        Load the primary keys of the many to many fields of rows.
+        :param rows: Projected rows
+        :return: List of dicts of row primary key and related primary keys
+        """
+        model, _, _, many_fields = self.get_compiled(self.fields)
+        pk = model._meta.pk.attname
+        pks = [row[pk] for row in rows]
+        values = []
+
+        for model_field in many_fields:
+            related = defaultdict(list)
+
+            if pks:
+                query_name = model_field.related_query_name()
+                pairs = model_field.related_model._default_manager.filter(
+                    **{f"{query_name}__in": pks}
+                ).values_list(query_name, "pk")
+
+                for row_pk, related_pk in pairs:
+                    related[row_pk].append(related_pk)
+
+            values.append(related)
+
+        return values
+
+    def iter_representations(self):
+        """
+        Render rows lazily, ie for a streamed response.
+        :return: Generator of dicts
+        """
+        model, _, fields, many_fields = self.get_compiled(self.fields)
+        pk = model._meta.pk.attname
+        rows = self.rows if isinstance(self.rows, list) else list(self.rows)
+        many_values = self.get_many_values(rows) if many_fields else []
+
+        for row in rows:
+            data = {}
+
+            for name, column, many, convert in fields:
+                if many is not None:
+                    related = many_values[many].get(row[pk], ())
+                    data[name] = [convert(value) for value in related]
+                    continue
+
+                value = row[column]
+                data[name] = (
+                    value if convert is None or value is None else convert(value)
+                )
+
+            yield data
+
+    @property
+    def data(self):
+        """
+        Rendered rows, or the single rendered row when many is False.
+        :return: List of dicts or dict
+        """
+        rows = list(self.iter_representations())
+
+        if self.many:
+            return rows
+
+        return rows[0] if rows else {}
@@ -0,0 +1,167 @@
+"""
+Module for Projection Serializer Tests.
+This module will test projection serializers render the same JSON as the model
+serializers they are compiled from.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.account.models import Account, User
+from apps.account.serializers.user_serializer import UserProjection, UserSerializer
+from apps.blog.models import BlogPost, Category, Tag
+from apps.blog.serializers.blog_serializers import (
+    BlogPostExcerptProjection,
+    BlogPostExcerptSerializer,
+)
+from apps.common.serializers.projection import ProjectionSerializer
+from apps.common.utilities.query_planner import plan_related
+from apps.common.utilities.utilities import json_response
+
+
+class TestProjectionSerializer(TestCase):
+    """
+    Test Projection Serializer
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/blog.json",
+        "tests/category.json",
+        "tests/tag.json",
+    ]
+
+    def setUp(self) -> None:
+        self.account = Account.objects.first()
+        self.user = User.objects.first()
+        category = Category.objects.create(name="Arctic", description="Arctic")
+
+        for number in range(3):
+            blog = BlogPost.objects.create(
+                account=self.account,
+                author=self.user,
+                status="PUBLISHED",
+                published_date=timezone.now(),
+                title=f"Inuvialuit Culture {number}",
+                excerpt="Inuvialuit Culture",
+                content="Inuvialuit Culture",
+                is_featured=bool(number % 2),
+            )
+            blog.categories.set([category])
+            blog.tags.set(Tag.objects.all()[: number + 1])
+
+    def assert_parity(self, projection, serializer, queryset):
+        """
+        Assert a projection renders the bytes of the model serializer.
+        :param projection: ProjectionSerializer class
+        :param serializer: ModelSerializer class
+        :param queryset: QuerySet to render
+        """
+        expected = serializer(plan_related(queryset, serializer), many=True).data
+        rows = list(projection.project(queryset))
+
+        self.assertEqual(
+            json_response(data=projection(rows, many=True).data).content,
+            json_response(data=expected).content,
+        )
+
+    def test_blog_post_parity(self):
+        """
+        Test blog post rows render as BlogPostExcerptSerializer, with nulls and many to
+        many fields.
+        """
+        self.assert_parity(
+            BlogPostExcerptProjection,
+            BlogPostExcerptSerializer,
+            BlogPost.objects.order_by("-created_date"),
+        )
+
+    def test_user_parity(self):
+        """
+        Test user rows render as UserSerializer.
+        """
+        self.assert_parity(
+            UserProjection, UserSerializer, User.objects.order_by("username")
+        )
+
+    def test_single_row(self):
+        """
+        Test a single row renders as a dict.
+        """
+        blog = BlogPost.objects.first()
+        row = BlogPostExcerptProjection.project(BlogPost.objects.filter(pk=blog.pk))
+
+        self.assertEqual(
+            json_response(data=BlogPostExcerptProjection(row, many=False).data).content,
+            json_response(data=BlogPostExcerptSerializer(blog).data).content,
+        )
+
+    def test_empty_rows(self):
+        """
+        Test no rows render without loading many to many fields.
+        """
+        with self.assertNumQueries(0):
+            self.assertEqual(BlogPostExcerptProjection([], many=True).data, [])
+
+    def test_query_count(self):
+        """
+        Test a page runs one query for rows and one per many to many field.
+        """
+        rows = BlogPostExcerptProjection.project(BlogPost.objects.all())
+
+        with self.assertNumQueries(3):
+            BlogPostExcerptProjection(rows, many=True).data
+
+    def test_ordering_columns_selected(self):
+        """
+        Test ordering columns are selected for cursors.
+        """
+        rows = UserProjection.project(
+            User.objects.order_by("-last_login"), ordering="-date_joined"
+        )
+
+        self.assertIn("last_login", rows[0])
+        self.assertIn("date_joined", rows[0])
+
+    def test_unprojectable_field(self):
+        """
+        Test serializers with fields not read from a column are rejected.
+        """
+
+        class TitleSerializer(serializers.ModelSerializer):
+            """
+            Title Serializer
+            """
+
+            upper_title = serializers.SerializerMethodField()
+
+            class Meta:
+                """
+                Meta for Serializer
+                """
+
+                model = BlogPost
+                fields = ["id", "upper_title"]
+
+            def get_upper_title(self, obj) -> str:
+                """
+                Upper case title.
+                :param obj: BlogPost
+                :return: Title
+                """
+                return obj.title.upper()
+
+        class TitleProjection(ProjectionSerializer):
+            """
+            Title Projection
+            """
+
+            serializer_class = TitleSerializer
+
+        with self.assertRaises(ImproperlyConfigured):
+            TitleProjection.project(BlogPost.objects.all())
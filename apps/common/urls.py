@@ -0,0 +1,16 @@
+"""
+Common URL Model.
+This module will contain references for common urls.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.urls import path
+
+from apps.common.views import metrics_api
+
+urlpatterns = [
+    # Metrics Endpoints
+    path("metrics", metrics_api.MetricsApi.as_view(), name="MetricsApiV1"),
+]
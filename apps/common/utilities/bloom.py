@@ -0,0 +1,68 @@
+"""
+Module for a Bloom filter.
+This module will contain a compact set membership filter, with no false negatives and a
+false positive rate set by its capacity, used in front of slower exact lookups.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Bloom Filter, sized for capacity items at the given false positive rate. Items are
+    strings, and can not be removed.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.size = max(
+            8,
+            math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)),
+        )
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[index >> 3] & (1 << (index & 7))
+            for index in self.get_indexes(item)
+        )
+
+    def get_indexes(self, item: str):
+        """
+        Get the bit indexes of an item, by double hashing one digest.
+        :param item: Item
+        :return: Generator of bit indexes
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        """
+        Add an item.
+        :param item: Item
+        :return: None
+        """
+        for index in self.get_indexes(item):
+            self.bits[index >> 3] |= 1 << (index & 7)
+
+        self.count += 1
+
+    @property
+    def full(self) -> bool:
+        """
+        Whether more items than the capacity were added, raising the false positive
+        rate.
+        :return: Boolean
+        """
+        return self.count > self.capacity
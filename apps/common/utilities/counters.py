@@ -0,0 +1,166 @@
+"""
+Module for write behind counters.
+This module buffers counter increments per worker and flushes them as batched
+UPDATE ... SET field = field + n statements, so hot rows cost a handful of writes instead
+of a read-modify-save per hit.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import atexit
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+
+from apps.common.utilities.response_cache import invalidate_detail
+
+
+class WriteBehindCounter:
+    """
+    Buffer of counter deltas for a model, flushed when the interval elapses or too many
+    deltas are pending. A timer flushes deltas left by an idle worker, so reads of the
+    counter fields lag by at most one interval. Deltas of a worker killed before a flush
+    are lost.
+    """
+
+    def __init__(self, model, fields: tuple, interval: float = None, limit: int = None):
+        self.model = model
+        self.fields = tuple(fields)
+        self.interval = interval
+        self.limit = limit
+        self.pending = defaultdict(dict)
+        self.lock = threading.Lock()
+        self.flushed_at = time.monotonic()
+        self.timer = None
+
+        atexit.register(self.flush)
+
+    def get_interval(self) -> float:
+        """
+        Seconds between flushes.
+        :return: Interval
+        """
+        if self.interval is not None:
+            return self.interval
+
+        return getattr(settings, "COUNTER_FLUSH_INTERVAL", 5.0)
+
+    def get_limit(self) -> int:
+        """
+        Number of pending rows that forces a flush.
+        :return: Limit
+        """
+        if self.limit is not None:
+            return self.limit
+
+        return getattr(settings, "COUNTER_FLUSH_LIMIT", 1000)
+
+    def increment(self, pk, field: str, amount: int = 1) -> int:
+        """
+        Add to a counter of a row.
+        :param pk: Primary key of the row
+        :param field: Counter field
+        :param amount: Amount to add
+        :return: Pending delta of the counter
+        """
+        if field not in self.fields:
+            raise ValueError(f"'{field}' is not a counter of {self.model.__name__}.")
+
+        with self.lock:
+            deltas = self.pending[pk]
+            deltas[field] = deltas.get(field, 0) + amount
+            pending = deltas[field]
+
+            due = len(self.pending) >= self.get_limit() or (
+                time.monotonic() - self.flushed_at >= self.get_interval()
+            )
+
+            if not due:
+                self.schedule()
+
+        if due:
+            self.flush()
+
+        return pending
+
+    def schedule(self) -> None:
+        """
+        Start the flush timer unless it is running, with the lock held.
+        :return: None
+        """
+        if self.timer is None:
+            self.timer = threading.Timer(
+                self.get_interval(), self.flush_idle, kwargs={"close": True}
+            )
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush_idle(self, close: bool = False) -> None:
+        """
+        Flush once the timer elapses.
+        :param close: Close the connections of the thread, ie the timer thread
+        :return: None
+        """
+        with self.lock:
+            self.timer = None
+
+        try:
+            self.flush()
+        finally:
+            if close:
+                connections.close_all()
+
+    def get_pending(self, pk) -> dict:
+        """
+        Get deltas of a row that have not been flushed yet.
+        :param pk: Primary key of the row
+        :return: Dict of field and delta
+        """
+        with self.lock:
+            return dict(self.pending.get(pk, {}))
+
+    def flush(self) -> int:
+        """
+        Write pending deltas. Rows with the same deltas share one UPDATE, deltas are put
+        back if the write fails.
+        :return: Number of UPDATE statements run
+        """
+        with self.lock:
+            pending, self.pending = self.pending, defaultdict(dict)
+            self.flushed_at = time.monotonic()
+
+        batches = defaultdict(list)
+
+        for pk, deltas in pending.items():
+            deltas = tuple(sorted((f, n) for f, n in deltas.items() if n))
+
+            if deltas:
+                batches[deltas].append(pk)
+
+        if not batches:
+            return 0
+
+        try:
+            with transaction.atomic():
+                for deltas, pks in batches.items():
+                    self.model.objects.filter(pk__in=pks).update(
+                        **{field: F(field) + amount for field, amount in deltas}
+                    )
+        except Exception:
+            with self.lock:
+                for pk, deltas in pending.items():
+                    for field, amount in deltas.items():
+                        self.pending[pk][field] = (
+                            self.pending[pk].get(field, 0) + amount
+                        )
+
+                self.schedule()
+            raise
+
+        invalidate_detail(self.model, list(pending))
+
+        return len(batches)
@@ -1,10 +1,18 @@
 """
 Module for encryption.
 This module will deal with encrypting and decrypting data and generating secret keys.
+Ciphers are built once per key set, the current key encrypts and older keys still
+decrypt until rows are rotated.
 Authors: Kenneth Carmichael (kencar17)
 Date: January 29th 2023
 Version: 1.0
 """
+from functools import lru_cache
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.core.management.utils import get_random_string
 
 
@@ -21,3 +29,113 @@ def generate_secret_key(length: int = 50) -> str:
         )
 
     return get_random_string(length=length, allowed_chars=chars)
+
+
+def get_encryption_keys() -> tuple:
+    """
+    Get database encryption keys, current key first followed by retired keys.
+    :return: Tuple of keys
+    """
+    keys = (
+        settings.DB_ENCRYPTION_KEY,
+        *getattr(settings, "DB_ENCRYPTION_OLD_KEYS", ()),
+    )
+    keys = tuple(key for key in keys if key)
+
+    if not keys:
+        raise ImproperlyConfigured(
+            "Encryption Key could not be found in environ 'BLOG_DB_ENCRYPTION_KEY'."
+        )
+
+    return keys
+
+
+@lru_cache(maxsize=8)
+def build_fernets(keys: tuple) -> tuple:
+    """
+    Build a Fernet per key of a key set, cached so each key set is parsed once.
+    :param keys: Tuple of keys, current key first
+    :return: Tuple of Fernet
+    """
+    return tuple(Fernet(key.encode()) for key in keys)
+
+
+@lru_cache(maxsize=8)
+def build_cipher(keys: tuple) -> MultiFernet:
+    """
+    Build a cipher for a key set, cached so each key set is parsed once.
+    :param keys: Tuple of keys, current key first
+    :return: MultiFernet
+    """
+    return MultiFernet(build_fernets(keys))
+
+
+def get_cipher() -> MultiFernet:
+    """
+    Get the cipher for the configured keys.
+    :return: MultiFernet
+    """
+    return build_cipher(get_encryption_keys())
+
+
+def encrypt_value(value: str) -> str:
+    """
+    Encrypt a value with the current key.
+    :param value: Value to be encrypted
+    :return: Token
+    """
+    return get_cipher().encrypt(value.encode()).decode("utf-8")
+
+
+def decrypt_value(token: str) -> str:
+    """
+    Decrypt a token with any configured key.
+    :param token: Token to be decrypted
+    :return: Value
+    """
+    return get_cipher().decrypt(token.encode()).decode("utf-8")
+
+
+def decrypt_values(tokens) -> list:
+    """
+    Decrypt a batch of tokens with one cipher, repeated tokens are decrypted once.
+    :param tokens: Iterable of tokens
+    :return: List of values in token order
+    """
+    cipher = get_cipher()
+    values = {}
+    result = []
+
+    for token in tokens:
+        if token not in values:
+            values[token] = cipher.decrypt(token.encode()).decode("utf-8")
+        result.append(values[token])
+
+    return result
+
+
+def rotate_token(token: str) -> Optional[str]:
+    """
+    Re-encrypt a token with the current key, keeping its timestamp. Keys are tried in
+    order like MultiFernet.rotate, so a token is decrypted once, and tokens already on
+    the current key are left alone.
+    :param token: Token encrypted with any configured key
+    :return: Token, or None when it is encrypted with the current key
+    """
+    fernets = build_fernets(get_encryption_keys())
+    data = token.encode()
+
+    for index, fernet in enumerate(fernets):
+        try:
+            value = fernet.decrypt(data)
+        except InvalidToken:
+            continue
+
+        if index == 0:
+            return None
+
+        timestamp = fernet.extract_timestamp(data)
+
+        return fernets[0].encrypt_at_time(value, timestamp).decode("utf-8")
+
+    raise InvalidToken
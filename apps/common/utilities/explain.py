@@ -0,0 +1,84 @@
+"""
+Module for query plan inspection.
+This module runs EXPLAIN for a queryset and flags plan steps that do not scale with table
+size, sequential scans and sorts that are not served by an index or spill to disk.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+
+from django.db import connections
+
+SEQ_SCAN = "sequential scan"
+SORT = "sort"
+DISK_SORT = "on-disk sort"
+
+
+def parse_sqlite_plan(plan: str) -> list:
+    """
+    Find flagged steps in SQLite EXPLAIN QUERY PLAN output. SQLite has no row estimates,
+    so every full table scan is flagged, and temp b-tree sorts may spill to disk.
+    :param plan: EXPLAIN QUERY PLAN text, one step per line
+    :return: List of flag and plan step tuples
+    """
+    findings = []
+
+    for line in plan.splitlines():
+        detail = line.split(" ", 3)[-1].strip()
+
+        if detail.startswith("SCAN ") and " USING " not in detail:
+            findings.append((SEQ_SCAN, detail))
+        elif detail.startswith("USE TEMP B-TREE FOR ORDER BY"):
+            findings.append((SORT, detail))
+
+    return findings
+
+
+def parse_postgres_plan(plan: list, min_rows: int = 0) -> list:
+    """
+    Find flagged steps in a Postgres JSON plan. Sequential scans of tables estimated
+    below min_rows are left out, the planner prefers them for small tables.
+    :param plan: EXPLAIN (FORMAT JSON) output
+    :param min_rows: Minimum estimated rows of a flagged sequential scan
+    :return: List of flag and plan step tuples
+    """
+    findings = []
+    nodes = [plan[0]["Plan"]]
+
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(reversed(node.get("Plans", [])))
+        node_type = node["Node Type"]
+
+        if node_type == "Seq Scan" and node.get("Plan Rows", 0) >= min_rows:
+            findings.append((SEQ_SCAN, f"Seq Scan on {node['Relation Name']}"))
+        elif node_type in ("Sort", "Incremental Sort"):
+            keys = ", ".join(node.get("Sort Key", []))
+
+            if node.get("Sort Space Type") == "Disk":
+                findings.append((DISK_SORT, f"{node_type} on {keys}"))
+            elif "Sort Space Type" not in node:
+                findings.append((SORT, f"{node_type} on {keys}"))
+
+    return findings
+
+
+def explain_queryset(queryset, analyze: bool = False, min_rows: int = 0) -> list:
+    """
+    Explain a queryset and find flagged plan steps.
+    :param queryset: QuerySet, sliced as the endpoint would page it
+    :param analyze: Run the query for actual sort methods, Postgres only
+    :param min_rows: Minimum estimated rows of a flagged sequential scan, Postgres only
+    :return: List of flag and plan step tuples
+    """
+    vendor = connections[queryset.db].vendor
+
+    if vendor == "postgresql":
+        plan = queryset.explain(format="json", analyze=analyze)
+        return parse_postgres_plan(json.loads(plan), min_rows=min_rows)
+
+    if vendor == "sqlite":
+        return parse_sqlite_plan(queryset.explain())
+
+    return []
@@ -0,0 +1,97 @@
+"""
+Module for JSON encoder backends.
+This module selects the encoder used for api responses. The stdlib encoder is the
+default, orjson is used when configured and installed. Datetimes are rendered the same
+way by every backend.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSON_STDLIB = "stdlib"
+JSON_ORJSON = "orjson"
+JSON_AUTO = "auto"
+
+
+class StdlibJSONBackend:
+    """
+    Stdlib JSON Backend, the output of JsonResponse.
+    """
+
+    name = JSON_STDLIB
+    item_separator = b", "
+    key_separator = b": "
+
+    def __init__(self):
+        self.encoder = DjangoJSONEncoder()
+
+    def dumps(self, data) -> bytes:
+        """
+        Encode data.
+        :param data: Data to encode
+        :return: JSON bytes
+        """
+        return self.encoder.encode(data).encode("utf-8")
+
+
+class OrjsonJSONBackend(StdlibJSONBackend):
+    """
+    orjson JSON Backend, compact output. Datetimes are passed to DjangoJSONEncoder so
+    they keep millisecond precision and the "Z" suffix.
+    """
+
+    name = JSON_ORJSON
+    item_separator = b","
+    key_separator = b":"
+
+    def dumps(self, data) -> bytes:
+        """
+        Encode data.
+        :param data: Data to encode
+        :return: JSON bytes
+        """
+        return orjson.dumps(
+            data,
+            default=self.encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+@lru_cache(maxsize=None)
+def build_json_backend(name: str):
+    """
+    Build a JSON backend, once per name.
+    :param name: One of stdlib, orjson, or auto
+    :return: JSON backend instance
+    """
+    if name == JSON_AUTO:
+        name = JSON_ORJSON if orjson is not None else JSON_STDLIB
+
+    if name == JSON_STDLIB:
+        return StdlibJSONBackend()
+
+    if name == JSON_ORJSON:
+        if orjson is None:
+            raise ImproperlyConfigured("JSON encoder 'orjson' is not installed.")
+        return OrjsonJSONBackend()
+
+    raise ImproperlyConfigured(f"Unknown JSON encoder '{name}'.")
+
+
+def get_json_backend(name: str = None):
+    """
+    Get JSON backend, defaults to the project setting.
+    :param name: One of stdlib, orjson, or auto
+    :return: JSON backend instance
+    """
+    return build_json_backend(name or getattr(settings, "JSON_ENCODER", JSON_STDLIB))
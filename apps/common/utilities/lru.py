@@ -0,0 +1,119 @@
+"""
+Module for a bounded in process LRU cache.
+This module will contain a thread safe least recently used cache whose entries expire at
+a given time, and can be grouped by a tag to be invalidated together.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class ExpiringLRUCache:
+    """
+    Expiring LRU Cache, the least recently used entry is evicted once maxsize entries
+    are held.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.tags = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key, now: float = None):
+        """
+        Get the value of a key, expired entries are removed.
+        :param key: Key
+        :param now: Current unix time, defaults to time.time()
+        :return: Value or None
+        """
+        now = time.time() if now is None else now
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires, tag = entry
+
+            if expires <= now:
+                self._remove(key, tag)
+                return None
+
+            self.entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value, expires: float, tag=None) -> None:
+        """
+        Set the value of a key.
+        :param key: Key
+        :param value: Value
+        :param expires: Unix time the entry expires at
+        :param tag: Tag the entry is invalidated with
+        :return: None
+        """
+        with self.lock:
+            if key in self.entries:
+                self._remove(key, self.entries[key][2])
+
+            self.entries[key] = (value, expires, tag)
+
+            if tag is not None:
+                self.tags.setdefault(tag, set()).add(key)
+
+            while len(self.entries) > self.maxsize:
+                oldest, (_, _, oldest_tag) = next(iter(self.entries.items()))
+                self._remove(oldest, oldest_tag)
+
+    def delete(self, key) -> None:
+        """
+        Delete a key.
+        :param key: Key
+        :return: None
+        """
+        with self.lock:
+            if key in self.entries:
+                self._remove(key, self.entries[key][2])
+
+    def delete_tag(self, tag) -> None:
+        """
+        Delete every entry of a tag.
+        :param tag: Tag
+        :return: None
+        """
+        with self.lock:
+            for key in list(self.tags.get(tag, ())):
+                self._remove(key, tag)
+
+    def clear(self) -> None:
+        """
+        Delete every entry.
+        :return: None
+        """
+        with self.lock:
+            self.entries.clear()
+            self.tags.clear()
+
+    def _remove(self, key, tag) -> None:
+        """
+        Remove an entry, the lock must be held.
+        :param key: Key
+        :param tag: Tag of the entry
+        :return: None
+        """
+        del self.entries[key]
+
+        if tag is not None:
+            keys = self.tags.get(tag)
+            keys.discard(key)
+
+            if not keys:
+                del self.tags[tag]
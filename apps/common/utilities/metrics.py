@@ -0,0 +1,235 @@
+"""
+Module for request metrics.
+This module will aggregate per route request metrics, ie latency histograms, database
+query counts and time, serializer time, JSON encode time, and response bytes, and render
+them in the Prometheus text format. Every thread writes to its own shard, so recording
+takes no lock, shards are summed when the metrics are read.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+# Upper bounds in seconds of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+SERIALIZER = "serializer_seconds"
+JSON_ENCODE = "json_seconds"
+
+# Counters of each route, name, help, and position after the histogram buckets.
+COUNTERS = (
+    ("blog_db_queries_total", "Database queries executed."),
+    ("blog_db_query_seconds_total", "Seconds spent executing database queries."),
+    ("blog_serializer_seconds_total", "Seconds spent serializing instances."),
+    ("blog_json_encode_seconds_total", "Seconds spent encoding JSON responses."),
+    ("blog_response_bytes_total", "Bytes of response bodies."),
+)
+
+current_request = ContextVar("current_request_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    Request Metrics, timings of the request being handled.
+    """
+
+    __slots__ = ("queries", "db_seconds", SERIALIZER, JSON_ENCODE)
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.json_seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper counting and timing queries.
+        """
+        start = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += perf_counter() - start
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Add the time spent in the block to a timing of the current request, if any.
+    :param name: Timing name, ie SERIALIZER
+    :return: Context manager
+    """
+    metrics = current_request.get()
+
+    if metrics is None:
+        yield
+        return
+
+    start = perf_counter()
+
+    try:
+        yield
+    finally:
+        setattr(metrics, name, getattr(metrics, name) + perf_counter() - start)
+
+
+def serializer_data(serializer):
+    """
+    Get the data of a serializer, timed as serializer time.
+    :param serializer: Serializer
+    :return: Serialized data
+    """
+    with timed(SERIALIZER):
+        return serializer.data
+
+
+class MetricsRegistry:
+    """
+    Metrics Registry, per thread shards of route aggregates. An aggregate is a list of
+    histogram bucket counts, the request count and latency sum, and the counters.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.local = threading.local()
+        self.shards = []
+        self.lock = threading.Lock()
+
+    def get_shard(self) -> dict:
+        """
+        Get the shard of the current thread, the lock is only taken to register it.
+        :return: Dict of aggregates by route and method
+        """
+        shard = getattr(self.local, "shard", None)
+
+        if shard is None:
+            shard = self.local.shard = {}
+
+            with self.lock:
+                self.shards.append(shard)
+
+        return shard
+
+    def record(
+        self,
+        route: str,
+        method: str,
+        seconds: float,
+        metrics: RequestMetrics,
+        size: int,
+    ) -> None:
+        """
+        Record a handled request.
+        :param route: Route pattern
+        :param method: Http method
+        :param seconds: Latency
+        :param metrics: Timings of the request
+        :param size: Response bytes
+        :return: None
+        """
+        shard = self.get_shard()
+        key = (route, method)
+        aggregate = shard.get(key)
+        buckets = len(self.buckets)
+
+        if aggregate is None:
+            aggregate = shard[key] = [0] * (buckets + 3 + len(COUNTERS))
+
+        aggregate[bisect_left(self.buckets, seconds)] += 1
+        aggregate[buckets + 1] += 1
+        aggregate[buckets + 2] += seconds
+        aggregate[buckets + 3] += metrics.queries
+        aggregate[buckets + 4] += metrics.db_seconds
+        aggregate[buckets + 5] += metrics.serializer_seconds
+        aggregate[buckets + 6] += metrics.json_seconds
+        aggregate[buckets + 7] += size
+
+    def collect(self) -> dict:
+        """
+        Sum the shards of every thread.
+        :return: Dict of aggregates by route and method
+        """
+        with self.lock:
+            shards = list(self.shards)
+
+        totals = {}
+
+        for shard in shards:
+            for key, aggregate in list(shard.items()):
+                total = totals.setdefault(key, [0] * len(aggregate))
+
+                for index, value in enumerate(aggregate):
+                    total[index] += value
+
+        return totals
+
+    def reset(self) -> None:
+        """
+        Drop every aggregate.
+        :return: None
+        """
+        with self.lock:
+            for shard in self.shards:
+                shard.clear()
+
+    def render(self) -> str:
+        """
+        Render the aggregates in the Prometheus text format.
+        :return: Text
+        """
+        totals = sorted(self.collect().items())
+        buckets = len(self.buckets)
+        lines = [
+            "# HELP blog_request_duration_seconds Request latency in seconds.",
+            "# TYPE blog_request_duration_seconds histogram",
+        ]
+
+        for (route, method), aggregate in totals:
+            labels = get_labels(route, method)
+            cumulative = 0
+
+            for bound, count in zip((*self.buckets, "+Inf"), aggregate):
+                cumulative += count
+                lines.append(
+                    f'blog_request_duration_seconds_bucket{{{labels},le="{bound}"}} '
+                    f"{cumulative}"
+                )
+
+            lines.append(
+                f"blog_request_duration_seconds_sum{{{labels}}} {aggregate[buckets + 2]}"
+            )
+            lines.append(
+                f"blog_request_duration_seconds_count{{{labels}}} "
+                f"{aggregate[buckets + 1]}"
+            )
+
+        for position, (name, description) in enumerate(COUNTERS):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+
+            for (route, method), aggregate in totals:
+                value = aggregate[buckets + 3 + position]
+                lines.append(f"{name}{{{get_labels(route, method)}}} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def get_labels(route: str, method: str) -> str:
+    """
+    Format the labels of a route, escaped for the Prometheus text format.
+    :param route: Route pattern
+    :param method: Http method
+    :return: Labels
+    """
+    route = route.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return f'route="{route}",method="{method}"'
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,47 @@
+"""
+Module for request body parsers.
+This module will contain the NDJSON parser, a body of one json object per line parsed
+as a list, so large batches can be sent without building one json array.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    NDJSON Parser, blank lines are skipped.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None) -> list:
+        """
+        Parse a body of one json value per line.
+        :param stream: Request body stream
+        :param media_type: Media type
+        :param parser_context: Parser context
+        :return: List of parsed values
+        """
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        items = []
+
+        for number, line in enumerate(stream, start=1):
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                items.append(json.loads(line.decode(encoding)))
+            except ValueError as exc:
+                raise ParseError(
+                    f"NDJSON parse error on line {number} - {exc}"
+                ) from exc
+
+        return items
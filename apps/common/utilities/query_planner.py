@@ -0,0 +1,172 @@
+"""
+Module for serializer query planning.
+This module will plan select related and prefetch related lookups for a queryset from the
+relations a serializer declares, so serializing a page runs a constant number of queries.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+def prefetch_prefixed(prefix: str, prefetch: list) -> bool:
+    """
+    Whether a nested lookup prefix already belongs to a prefetch lookup, select related
+    cannot follow a prefetched relation.
+    :param prefix: Lookup prefix
+    :param prefetch: Collected prefetch related lookups
+    :return: Boolean
+    """
+    return any(prefix.startswith(f"{lookup}__") for lookup in prefetch)
+
+
+def _plan_fields(
+    serializer, model, prefix: str, select: list, prefetch: list, fields=None
+) -> None:
+    """
+    Walk serializer fields and collect related lookups.
+    :param serializer: Serializer instance
+    :param model: Model the serializer reads from
+    :param prefix: Lookup prefix for nested serializers
+    :param select: Collected select related lookups
+    :param prefetch: Collected prefetch related lookups
+    :param fields: Field names to plan, defaults to every field
+    :return: None
+    """
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*" or "." in field.source:
+            continue
+
+        if fields is not None and field.field_name not in fields:
+            continue
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            continue
+
+        if not model_field.is_relation:
+            continue
+
+        lookup = f"{prefix}{field.source}"
+        single = model_field.many_to_one or model_field.one_to_one
+
+        if isinstance(field, ManyRelatedField):
+            prefetch.append(lookup)
+        elif isinstance(field, ListSerializer):
+            prefetch.append(lookup)
+            _plan_fields(
+                field.child, model_field.related_model, f"{lookup}__", select, prefetch
+            )
+        elif isinstance(field, BaseSerializer):
+            if single and not prefetch_prefixed(prefix, prefetch):
+                select.append(lookup)
+            else:
+                prefetch.append(lookup)
+            _plan_fields(
+                field, model_field.related_model, f"{lookup}__", select, prefetch
+            )
+        elif isinstance(field, RelatedField) and not field.use_pk_only_optimization():
+            if single and not prefetch_prefixed(prefix, prefetch):
+                select.append(lookup)
+            else:
+                prefetch.append(lookup)
+
+
+@lru_cache(maxsize=None)
+def get_related_plan(serializer_class, fields: tuple = None) -> tuple:
+    """
+    Plan related lookups for a model serializer class. Primary key related fields
+    read the foreign key column and need no lookup.
+    :param serializer_class: ModelSerializer class
+    :param fields: Field names to plan, relations of other fields are pruned
+    :return: Tuple of select related and prefetch related lookups
+    """
+    select = []
+    prefetch = []
+    meta = getattr(serializer_class, "Meta", None)
+    model = getattr(meta, "model", None)
+
+    if model is not None:
+        _plan_fields(serializer_class(), model, "", select, prefetch, fields=fields)
+
+    return tuple(select), tuple(prefetch)
+
+
+@lru_cache(maxsize=None)
+def get_only_fields(serializer_class, fields: tuple):
+    """
+    Plan the columns to load for some fields of a model serializer class. Fields that
+    are not read from a model field may read any column, no plan is made for them.
+    :param serializer_class: ModelSerializer class
+    :param fields: Field names to load
+    :return: Tuple of model field names or None
+    """
+    model = serializer_class.Meta.model
+    names = [model._meta.pk.name]
+
+    for field in serializer_class()._readable_fields:
+        if field.field_name not in fields:
+            continue
+
+        if field.source == "*" or "." in field.source:
+            return None
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+
+        if model_field.concrete and not model_field.many_to_many:
+            names.append(model_field.name)
+
+    return tuple(dict.fromkeys(names))
+
+
+def get_ordering_columns(queryset, ordering: str = None) -> tuple:
+    """
+    Get the columns of the concrete ordering fields of a queryset, ie to keep them
+    loaded for cursors.
+    :param queryset: QuerySet
+    :param ordering: Extra ordering key, ie the cursor ordering of a view
+    :return: Tuple of column attnames
+    """
+    order_by = list(queryset.query.order_by) + ([ordering] if ordering else [])
+    columns = []
+
+    for key in order_by:
+        if not isinstance(key, str):
+            continue
+
+        try:
+            field = queryset.model._meta.get_field(key.lstrip("-"))
+        except FieldDoesNotExist:
+            continue
+
+        if field.concrete and not field.many_to_many:
+            columns.append(field.attname)
+
+    return tuple(columns)
+
+
+def plan_related(queryset, serializer_class, fields: tuple = None):
+    """
+    Apply planned related lookups for a serializer to a queryset.
+    :param queryset: QuerySet to be serialized
+    :param serializer_class: ModelSerializer class
+    :param fields: Field names to be serialized, defaults to every field
+    :return: QuerySet
+    """
+    select, prefetch = get_related_plan(serializer_class, fields)
+
+    if select:
+        queryset = queryset.select_related(*select)
+
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+
+    return queryset
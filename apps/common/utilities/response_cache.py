@@ -0,0 +1,146 @@
+"""
+Module for detail response caching.
+This module caches serialized detail responses by primary key and version. A pointer key
+holds the current version of a row, and the body is stored under the version, so moving
+or deleting the pointer makes every cached body of the row unreachable.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+DETAIL_POINTER_KEY = "blog:detail:{label}:{pk}"
+DETAIL_BODY_KEY = "blog:detail:{label}:{pk}:{version}:{view}"
+
+
+def get_detail_timeout() -> int:
+    """
+    Seconds a cached detail response is kept.
+    :return: Timeout
+    """
+    return getattr(settings, "DETAIL_CACHE_TIMEOUT", 300)
+
+
+def get_pointer_key(model, pk) -> str:
+    """
+    Get the version pointer key of a row.
+    :param model: Model class
+    :param pk: Primary key
+    :return: Cache key
+    """
+    return DETAIL_POINTER_KEY.format(label=model._meta.label_lower, pk=pk)
+
+
+def get_detail_version(instance) -> str:
+    """
+    Get the version of a row, its save timestamp when the model keeps one.
+    :param instance: Model instance
+    :return: Version string
+    """
+    name = getattr(instance, "timestamp_field", None)
+
+    if name is None:
+        name = next(
+            (
+                field.name
+                for field in instance._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ),
+            None,
+        )
+
+    value = getattr(instance, name, None) if name else None
+
+    return value.isoformat() if value else uuid.uuid4().hex
+
+
+def get_cached_detail(model, pk, view: str):
+    """
+    Get the cached response body of a row for a view.
+    :param model: Model class
+    :param pk: Primary key
+    :param view: View name, views of a model may serialize it differently
+    :return: Body bytes or None on a miss
+    """
+    version = cache.get(get_pointer_key(model, pk))
+
+    if version is None:
+        return None
+
+    return cache.get(
+        DETAIL_BODY_KEY.format(
+            label=model._meta.label_lower, pk=pk, version=version, view=view
+        )
+    )
+
+
+def set_cached_detail(instance, view: str, body: bytes) -> None:
+    """
+    Cache the response body of a row for a view, under the version of the row that
+    was serialized.
+    :param instance: Model instance that was serialized
+    :param view: View name
+    :param body: Response body
+    :return: None
+    """
+    model = type(instance)
+    timeout = get_detail_timeout()
+    pointer = get_pointer_key(model, instance.pk)
+
+    version = get_detail_version(instance)
+
+    # Another reader cached a different version first, leave its body in place.
+    if (
+        not cache.add(pointer, version, timeout=timeout)
+        and cache.get(pointer) != version
+    ):
+        return
+
+    cache.set(
+        DETAIL_BODY_KEY.format(
+            label=model._meta.label_lower, pk=instance.pk, version=version, view=view
+        ),
+        body,
+        timeout=timeout,
+    )
+
+
+def invalidate_detail(model, pks) -> None:
+    """
+    Invalidate cached responses of rows, again once the transaction commits so a read
+    racing the write cannot cache the old row.
+    :param model: Model class
+    :param pks: Primary keys
+    :return: None
+    """
+    keys = [get_pointer_key(model, pk) for pk in pks if pk is not None]
+
+    if not keys:
+        return
+
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_m2m_detail(sender, instance, action, model, pk_set, **kwargs) -> None:
+    """
+    Invalidate cached responses of both sides of a changed many to many relation.
+    :param sender: Through model
+    :param instance: Instance whose relation changed
+    :param action: m2m_changed action
+    :param model: Model class of the other side
+    :param pk_set: Primary keys of the other side, None when cleared
+    :param kwargs:
+    :return: None
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    invalidate_detail(type(instance), [instance.pk])
+
+    if pk_set:
+        invalidate_detail(model, pk_set)
@@ -0,0 +1,53 @@
+"""
+Module for Bloom Filter Tests.
+This module will test membership and sizing of the Bloom filter.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.test import SimpleTestCase
+
+from apps.common.utilities.bloom import BloomFilter
+
+
+class TestBloomFilter(SimpleTestCase):
+    """
+    Test Bloom Filter
+    """
+
+    def test_no_false_negatives(self):
+        """
+        Test every added item is contained.
+        """
+        bloom = BloomFilter(capacity=1000)
+        items = [f"item-{i}" for i in range(1000)]
+
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertEqual(len(bloom), 1000)
+        self.assertFalse(bloom.full)
+
+    def test_false_positive_rate(self):
+        """
+        Test items never added are rarely contained at capacity.
+        """
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+
+        for i in range(1000):
+            bloom.add(f"item-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        self.assertLess(false_positives, 300)
+
+    def test_full(self):
+        """
+        Test the filter is full past its capacity.
+        """
+        bloom = BloomFilter(capacity=1)
+        bloom.add("a")
+        bloom.add("b")
+
+        self.assertTrue(bloom.full)
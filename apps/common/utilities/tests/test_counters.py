@@ -0,0 +1,143 @@
+"""
+Module for Write Behind Counter Tests.
+This module will test buffering and flushing counter increments.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from unittest import mock
+
+from django.db import DatabaseError
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from apps.blog.models import BlogPost
+from apps.common.utilities.counters import WriteBehindCounter
+
+
+class TestWriteBehindCounter(TestCase):
+    """
+    Test Write Behind Counter
+    """
+
+    fixtures = [
+        "tests/account.json",
+        "tests/user.json",
+        "tests/blog.json",
+    ]
+
+    def setUp(self) -> None:
+        self.blog = BlogPost.objects.first()
+        self.other = BlogPost.objects.create(
+            account=self.blog.account,
+            author=self.blog.author,
+            status="DRAFT",
+            title="Other",
+            excerpt="Other",
+            content="Other",
+        )
+        self.counter = WriteBehindCounter(
+            BlogPost, fields=("views", "likes", "dislikes"), interval=3600, limit=10
+        )
+
+    def tearDown(self) -> None:
+        self.counter.pending.clear()
+
+        if self.counter.timer is not None:
+            self.counter.timer.cancel()
+
+    def test_increment_buffered(self):
+        """
+        Test increments are not written until flushed.
+        """
+
+        with self.assertNumQueries(0):
+            for _ in range(100):
+                self.counter.increment(self.blog.pk, "views")
+
+        self.assertEqual(self.counter.get_pending(self.blog.pk), {"views": 100})
+
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.views, 0)
+
+    def test_flush_batches(self):
+        """
+        Test rows with the same deltas share one update.
+        """
+
+        for pk in (self.blog.pk, self.other.pk):
+            self.counter.increment(pk, "views", 3)
+
+        self.counter.increment(self.other.pk, "likes")
+
+        self.assertEqual(self.counter.flush(), 2)
+        self.assertEqual(self.counter.get_pending(self.blog.pk), {})
+
+        self.blog.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.blog.views, self.blog.likes), (3, 0))
+        self.assertEqual((self.other.views, self.other.likes), (3, 1))
+
+        self.counter.increment(self.blog.pk, "views")
+        self.counter.increment(self.other.pk, "views")
+
+        self.assertEqual(self.counter.flush(), 1)
+
+    def test_flush_limit(self):
+        """
+        Test reaching the pending row limit flushes.
+        """
+
+        self.counter.limit = 2
+        self.counter.increment(self.blog.pk, "dislikes")
+        self.counter.increment(self.other.pk, "dislikes")
+
+        self.assertEqual(self.counter.get_pending(self.blog.pk), {})
+
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.dislikes, 1)
+
+    def test_flush_idle(self):
+        """
+        Test the timer flushes deltas of an idle worker once the interval elapses.
+        """
+
+        self.counter.increment(self.blog.pk, "views", 2)
+        timer = self.counter.timer
+
+        self.assertIsNotNone(timer)
+        self.assertEqual(timer.interval, 3600)
+
+        self.counter.increment(self.blog.pk, "views")
+        self.assertIs(self.counter.timer, timer)
+
+        timer.cancel()
+        self.counter.flush_idle()
+
+        self.assertIsNone(self.counter.timer)
+        self.assertEqual(self.counter.get_pending(self.blog.pk), {})
+
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.views, 3)
+
+    def test_flush_failure(self):
+        """
+        Test deltas are kept when the write fails.
+        """
+
+        self.counter.increment(self.blog.pk, "views", 2)
+
+        with mock.patch.object(QuerySet, "update", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.counter.flush()
+
+        self.counter.increment(self.blog.pk, "views")
+        self.assertEqual(self.counter.get_pending(self.blog.pk), {"views": 3})
+
+    def test_increment_invalid_field(self):
+        """
+        Test only counter fields can be incremented.
+        """
+
+        with self.assertRaises(ValueError):
+            self.counter.increment(self.blog.pk, "title")
@@ -6,9 +6,20 @@ Date: January 29th 2023
 Version: 1.0
 """
 
-from django.test import TestCase
+from cryptography.fernet import Fernet
+from django.test import TestCase, override_settings
 
-from apps.common.utilities.encryption import generate_secret_key
+from apps.common.utilities.encryption import (
+    build_fernets,
+    decrypt_value,
+    encrypt_value,
+    generate_secret_key,
+    get_encryption_keys,
+    rotate_token,
+)
+
+NEW_KEY = Fernet.generate_key().decode()
+OLD_KEY = Fernet.generate_key().decode()
 
 
 class TestEncryption(TestCase):
@@ -51,3 +62,25 @@ class TestEncryption(TestCase):
         """
         with self.assertRaises(ValueError) as context:
             record = generate_secret_key(length=25)
+
+    def test_rotate_token(self):
+        """
+        Test tokens of a retired key are re-encrypted with the current key, keeping
+        their timestamp, and tokens of the current key are left alone.
+        :return:
+        """
+        with override_settings(DB_ENCRYPTION_KEY=OLD_KEY, DB_ENCRYPTION_OLD_KEYS=[]):
+            old = encrypt_value("secret")
+
+        with override_settings(
+            DB_ENCRYPTION_KEY=NEW_KEY, DB_ENCRYPTION_OLD_KEYS=[OLD_KEY]
+        ):
+            token = rotate_token(old)
+            current, retired = build_fernets(get_encryption_keys())
+
+            self.assertEqual(decrypt_value(token), "secret")
+            self.assertEqual(
+                current.extract_timestamp(token.encode()),
+                retired.extract_timestamp(old.encode()),
+            )
+            self.assertIsNone(rotate_token(token))
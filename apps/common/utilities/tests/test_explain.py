@@ -0,0 +1,89 @@
+"""
+Module for Query Plan Inspection Tests.
+This module will test flagging plan steps from EXPLAIN output.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.test import TestCase
+
+from apps.common.utilities.explain import (
+    DISK_SORT,
+    SEQ_SCAN,
+    SORT,
+    parse_postgres_plan,
+    parse_sqlite_plan,
+)
+
+
+class TestExplain(TestCase):
+    """
+    Test Explain
+    """
+
+    def test_parse_sqlite_plan(self):
+        """
+        Test full scans and temp b-tree sorts are flagged.
+        """
+
+        plan = (
+            "2 0 0 SCAN account_user\n"
+            "3 0 0 SCAN blog_blogpost USING INDEX blog_created_id_idx\n"
+            "5 0 0 SEARCH blog_blogpost USING INDEX blog_status_created_idx (status=?)\n"
+            "9 0 0 USE TEMP B-TREE FOR ORDER BY"
+        )
+
+        self.assertEqual(
+            parse_sqlite_plan(plan),
+            [(SEQ_SCAN, "SCAN account_user"), (SORT, "USE TEMP B-TREE FOR ORDER BY")],
+        )
+
+    def test_parse_postgres_plan(self):
+        """
+        Test large sequential scans and sorts that spill to disk are flagged.
+        """
+
+        plan = [
+            {
+                "Plan": {
+                    "Node Type": "Limit",
+                    "Plans": [
+                        {
+                            "Node Type": "Sort",
+                            "Sort Key": ["created_date DESC"],
+                            "Sort Space Type": "Disk",
+                            "Plans": [
+                                {
+                                    "Node Type": "Seq Scan",
+                                    "Relation Name": "blog_blogpost",
+                                    "Plan Rows": 50000,
+                                }
+                            ],
+                        },
+                        {
+                            "Node Type": "Seq Scan",
+                            "Relation Name": "blog_tag",
+                            "Plan Rows": 10,
+                        },
+                    ],
+                }
+            }
+        ]
+
+        self.assertEqual(
+            parse_postgres_plan(plan, min_rows=1000),
+            [
+                (DISK_SORT, "Sort on created_date DESC"),
+                (SEQ_SCAN, "Seq Scan on blog_blogpost"),
+            ],
+        )
+
+        plan[0]["Plan"]["Plans"][0]["Sort Space Type"] = "Memory"
+
+        self.assertEqual(
+            parse_postgres_plan(plan),
+            [
+                (SEQ_SCAN, "Seq Scan on blog_blogpost"),
+                (SEQ_SCAN, "Seq Scan on blog_tag"),
+            ],
+        )
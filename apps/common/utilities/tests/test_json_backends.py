@@ -0,0 +1,99 @@
+"""
+Module for JSON Backend Tests.
+This module will test encoder backends and the streamed response envelope.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import datetime
+import json
+import unittest
+import uuid
+from decimal import Decimal
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import JsonResponse
+from django.test import SimpleTestCase
+
+from apps.common.utilities.json_backends import (
+    build_json_backend,
+    get_json_backend,
+    orjson,
+)
+from apps.common.utilities.utilities import json_response, stream_json_envelope
+
+DATA = {
+    "count": 2,
+    "id": uuid.UUID("335ce286-c177-4f9a-af25-05c3a94975fb"),
+    "created_date": datetime.datetime(
+        2023, 3, 18, 4, 23, 36, 485123, tzinfo=datetime.timezone.utc
+    ),
+    "published": datetime.date(2023, 3, 18),
+    "price": Decimal("1.50"),
+    "title": "Café",
+}
+ROWS = [{"id": 1, "title": "One"}, {"id": 2, "title": "Two", "tags": []}]
+
+
+class TestJsonBackends(SimpleTestCase):
+    """
+    Test JSON Backends
+    """
+
+    def test_stdlib_matches_json_response(self):
+        """
+        Test the stdlib backend keeps the JsonResponse bytes.
+        """
+        response = json_response(data=DATA)
+        expected = JsonResponse({"is_error": False, "error": {}, "content": DATA})
+
+        self.assertEqual(response.content, expected.content)
+
+    def test_default_backend(self):
+        """
+        Test the configured backend is used when none is named.
+        """
+        with self.settings(JSON_ENCODER="stdlib"):
+            self.assertEqual(get_json_backend().name, "stdlib")
+
+    def test_unknown_backend(self):
+        """
+        Test an unknown encoder fails loudly.
+        """
+        with self.assertRaises(ImproperlyConfigured):
+            build_json_backend("simdjson")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_matches_stdlib(self):
+        """
+        Test orjson renders the same values as the stdlib backend.
+        """
+        stdlib = get_json_backend("stdlib").dumps(DATA)
+        fast = get_json_backend("orjson").dumps(DATA)
+
+        self.assertEqual(json.loads(fast), json.loads(stdlib))
+        self.assertIn(b'"2023-03-18T04:23:36.485Z"', fast)
+
+    def test_stream_matches_json_response(self):
+        """
+        Test the streamed envelope matches the buffered response, for every backend.
+        """
+        names = ["stdlib"] + (["orjson"] if orjson is not None else [])
+
+        for name in names:
+            backend = get_json_backend(name)
+
+            for data, rows in ((DATA, ROWS), (DATA, []), ({}, ROWS)):
+                with self.subTest(name=name, data=bool(data), rows=len(rows)):
+                    expected = backend.dumps(
+                        {
+                            "is_error": False,
+                            "error": {},
+                            "content": {**data, "results": rows},
+                        }
+                    )
+                    streamed = b"".join(
+                        stream_json_envelope(data, iter(rows), backend=backend)
+                    )
+
+                    self.assertEqual(streamed, expected)
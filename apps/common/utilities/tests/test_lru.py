@@ -0,0 +1,55 @@
+"""
+Module for Expiring LRU Cache Tests.
+This module will test eviction, expiry, and tag invalidation of the LRU cache.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+from django.test import SimpleTestCase
+
+from apps.common.utilities.lru import ExpiringLRUCache
+
+
+class TestExpiringLRUCache(SimpleTestCase):
+    """
+    Test Expiring LRU Cache
+    """
+
+    def setUp(self) -> None:
+        self.cache = ExpiringLRUCache(maxsize=2)
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test the least recently used entry is evicted at maxsize.
+        """
+        self.cache.set("a", 1, expires=100)
+        self.cache.set("b", 2, expires=100)
+        self.cache.get("a", now=0)
+        self.cache.set("c", 3, expires=100)
+
+        self.assertEqual(self.cache.get("a", now=0), 1)
+        self.assertIsNone(self.cache.get("b", now=0))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_expires(self):
+        """
+        Test entries are not returned at or after their expiry.
+        """
+        self.cache.set("a", 1, expires=10)
+
+        self.assertEqual(self.cache.get("a", now=9), 1)
+        self.assertIsNone(self.cache.get("a", now=10))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_delete_tag(self):
+        """
+        Test every entry of a tag is deleted together.
+        """
+        self.cache.set("a", 1, expires=100, tag="user")
+        self.cache.set("b", 2, expires=100, tag="user")
+        self.cache.delete_tag("user")
+        self.cache.set("c", 3, expires=100, tag="user")
+
+        self.assertIsNone(self.cache.get("a", now=0))
+        self.assertIsNone(self.cache.get("b", now=0))
+        self.assertEqual(self.cache.tags, {"user": {"c"}})
@@ -0,0 +1,163 @@
+"""
+Module for Request Metrics Tests.
+This module will test the request metrics registry, middleware, and endpoint.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import threading
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.account.models import User
+from apps.common.utilities.metrics import MetricsRegistry, RequestMetrics, registry
+
+
+class TestMetricsRegistry(SimpleTestCase):
+    """
+    Test Metrics Registry
+    """
+
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a request of a route.
+        :param seconds: Latency
+        :return: None
+        """
+        metrics = RequestMetrics()
+        metrics.queries = 2
+        self.registry.record("api/tags", "GET", seconds, metrics, 10)
+
+    def test_render(self):
+        """
+        Test the histogram buckets are cumulative and counters are summed.
+        """
+        self.record(0.05)
+        self.record(0.5)
+        self.record(5)
+        text = self.registry.render()
+
+        self.assertIn(
+            'blog_request_duration_seconds_bucket{route="api/tags",method="GET",le="0.1"} 1',
+            text,
+        )
+        self.assertIn(
+            'blog_request_duration_seconds_bucket{route="api/tags",method="GET",le="1.0"} 2',
+            text,
+        )
+        self.assertIn(
+            'blog_request_duration_seconds_bucket{route="api/tags",method="GET",le="+Inf"} 3',
+            text,
+        )
+        self.assertIn(
+            'blog_request_duration_seconds_count{route="api/tags",method="GET"} 3', text
+        )
+        self.assertIn('blog_db_queries_total{route="api/tags",method="GET"} 6', text)
+        self.assertIn(
+            'blog_response_bytes_total{route="api/tags",method="GET"} 30', text
+        )
+
+    def test_threads_summed(self):
+        """
+        Test each thread records to its own shard, summed when collected.
+        """
+        threads = [threading.Thread(target=self.record, args=(0.05,)) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.registry.shards), 4)
+        self.assertEqual(self.registry.collect()[("api/tags", "GET")][3], 4)
+
+
+class TestMetricsEndpoint(TestCase):
+    fixtures = ["tests/account.json", "tests/user.json"]
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.client = APIClient()
+        self.user = User.objects.first()
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {self.refresh.access_token}"
+        )
+
+    def test_requests_recorded(self):
+        """
+        Test requests are recorded by route, with their queries, timings, and bytes,
+        streamed ones once consumed.
+        """
+        response = self.client.get("/api/users")
+
+        with self.settings(JSON_STREAM_MIN_ROWS=1):
+            streamed = self.client.get("/api/accounts")
+            body = b"".join(streamed.streaming_content)
+
+        totals = registry.collect()
+        users = totals[("api/users", "GET")]
+        accounts = totals[("api/accounts", "GET")]
+        buckets = len(registry.buckets)
+
+        self.assertEqual(users[buckets + 1], 1)
+        self.assertGreater(users[buckets + 3], 0)
+        self.assertGreater(users[buckets + 5], 0)
+        self.assertGreater(users[buckets + 6], 0)
+        self.assertEqual(users[buckets + 7], len(response.content))
+        self.assertEqual(accounts[buckets + 7], len(body))
+
+        self.client.credentials()
+
+        with self.settings(METRICS_TOKEN="secret"):
+            text = self.client.get(
+                "/metrics", HTTP_AUTHORIZATION="Bearer secret"
+            ).content.decode("utf-8")
+
+        self.assertIn(
+            'blog_request_duration_seconds_count{route="api/users",method="GET"} 1',
+            text,
+        )
+
+    def test_metrics_token(self):
+        """
+        Test the metrics endpoint requires the token when one is set.
+        """
+        self.client.credentials()
+
+        with self.settings(METRICS_TOKEN="secret"):
+            denied = self.client.get("/metrics")
+            allowed = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+
+        self.assertEqual(denied.status_code, 401)
+        self.assertEqual(allowed.status_code, 200)
+
+    def test_metrics_without_token(self):
+        """
+        Test the metrics endpoint is only served without a token in DEBUG.
+        """
+        self.client.credentials()
+
+        with self.settings(METRICS_TOKEN="", DEBUG=False):
+            self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+        with self.settings(METRICS_TOKEN="", DEBUG=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    def test_unknown_methods_grouped(self):
+        """
+        Test requests with made up methods are recorded under one method.
+        """
+        for method in ("FOO", "BAR"):
+            self.client.generic(method, "/metrics")
+
+        methods = {method for _, method in registry.collect()}
+
+        self.assertEqual(methods, {"OTHER"})
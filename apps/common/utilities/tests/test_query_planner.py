@@ -0,0 +1,91 @@
+"""
+Module for Query Planner Tests.
+This module will test planning related lookups from serializers.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+
+from django.test import TestCase
+
+from apps.account.serializers.user_serializer import UserSerializer
+from apps.blog.models import Category
+from apps.blog.serializers.blog_serializers import (
+    BlogPostExcerptSerializer,
+    BlogPostSerializer,
+)
+from apps.blog.serializers.category_serializer import CategorySerializer
+from apps.comments.serializers.comment_serializers import CommentSerializer
+from apps.common.utilities.query_planner import (
+    get_only_fields,
+    get_related_plan,
+    plan_related,
+)
+
+
+class TestQueryPlanner(TestCase):
+    """
+    Test Query Planner
+    """
+
+    fixtures = ["tests/category.json"]
+
+    def test_plan_many_to_many(self):
+        """
+        Test many to many relations are prefetched.
+        """
+
+        self.assertEqual(
+            get_related_plan(BlogPostSerializer), ((), ("categories", "tags"))
+        )
+        self.assertEqual(
+            get_related_plan(BlogPostExcerptSerializer), ((), ("categories", "tags"))
+        )
+
+    def test_plan_primary_key_relation(self):
+        """
+        Test primary key relations need no lookups.
+        """
+
+        self.assertEqual(get_related_plan(UserSerializer), ((), ()))
+
+    def test_plan_nested_serializer(self):
+        """
+        Test nested foreign key serializers are selected.
+        """
+
+        self.assertEqual(get_related_plan(CategorySerializer), (("parent",), ()))
+
+    def test_plan_pruned_fields(self):
+        """
+        Test relations of fields that are not serialized are pruned.
+        """
+
+        self.assertEqual(
+            get_related_plan(BlogPostSerializer, ("id", "tags")), ((), ("tags",))
+        )
+        self.assertEqual(get_related_plan(CategorySerializer, ("id", "name")), ((), ()))
+
+    def test_plan_only_fields(self):
+        """
+        Test only the columns of serialized fields are loaded, and none are left out
+        for fields that are not read from a column.
+        """
+
+        self.assertEqual(
+            get_only_fields(BlogPostSerializer, ("title", "tags", "account")),
+            ("id", "account", "title"),
+        )
+        self.assertIsNone(get_only_fields(CommentSerializer, ("id", "children")))
+
+    def test_plan_related_queries(self):
+        """
+        Test planned queryset serializes in a single query.
+        """
+
+        queryset = plan_related(Category.objects.all(), CategorySerializer)
+
+        with self.assertNumQueries(1):
+            data = CategorySerializer(queryset, many=True).data
+
+        self.assertEqual(len(data), 3)
@@ -5,18 +5,22 @@ Authors: Kenneth Carmichael (kencar17)
 Date: January 16th 2023
 Version: 1.0
 """
-from typing import Union
+from typing import Iterable, Union
 
-from django.http import JsonResponse
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework import status
 
+from apps.common.utilities.json_backends import get_json_backend
+from apps.common.utilities.metrics import JSON_ENCODE, timed
+
 
 def json_response(
     data: Union[list, dict] = None,
     error: bool = False,
     message: dict = None,
     http_status=status.HTTP_200_OK,
-) -> JsonResponse:
+) -> HttpResponse:
     """
     Format Api response for all api endpoints.
     :param data: Response Data
@@ -30,10 +34,56 @@ def json_response(
     if message is None:
         message = {}
 
-    return JsonResponse(
-        {"is_error": error, "error": message, "content": data},
+    with timed(JSON_ENCODE):
+        body = get_json_backend().dumps(
+            {"is_error": error, "error": message, "content": data}
+        )
+
+    return HttpResponse(
+        body,
+        status=http_status,
+        content_type="application/json",
+    )
+
+
+def stream_json_envelope(data: dict, results: Iterable, backend=None):
+    """
+    Encode the success envelope piece by piece, with each result encoded as it is
+    produced. The output matches json_response(data={**data, "results": results}).
+    :param data: Response data, without results
+    :param results: Iterable of result rows
+    :param backend: JSON backend, defaults to the configured backend
+    :return: Generator of JSON bytes
+    """
+    backend = backend or get_json_backend()
+    sep, colon = backend.item_separator, backend.key_separator
+    head = backend.dumps({"is_error": False, "error": {}, "content": data})
+
+    # Reopen the content object, results is its last key.
+    yield head[:-2]
+    yield (sep if data else b"") + b'"results"' + colon + b"["
+
+    for index, row in enumerate(results):
+        yield (sep if index else b"") + backend.dumps(row)
+
+    yield b"]}}"
+
+
+def stream_json_response(
+    data: dict, results: Iterable, http_status=status.HTTP_200_OK
+) -> StreamingHttpResponse:
+    """
+    Format a list response for api endpoints as a stream, so large result pages are
+    never held in memory as a whole.
+    :param data: Response data, without results
+    :param results: Iterable of result rows
+    :param http_status: status code, default to 200
+    :return: Streaming Json Response of results
+    """
+    return StreamingHttpResponse(
+        stream_json_envelope(data=data, results=results),
         status=http_status,
-        safe=False,
+        content_type="application/json",
     )
 
 
@@ -50,3 +100,12 @@ def default_pagination(data: Union[list, dict]) -> dict:
         "next": None,
         "results": data,
     }
+
+
+def is_cache_shared() -> bool:
+    """
+    Whether the cache is shared between processes. Versions and generations moved in a
+    per process cache, ie LocMemCache, are never seen by other processes.
+    :return: Boolean
+    """
+    return getattr(settings, "CACHE_SHARED", False)
@@ -0,0 +1,43 @@
+"""
+Module for Metrics Api Endpoints.
+This module determines the metrics endpoint, the request metrics of this process in the
+Prometheus text format. Supported methods are Get.
+Authors: Kenneth Carmichael (kencar17)
+Date: October 18th 2026
+Version: 1.0
+"""
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views import View
+
+from apps.common.utilities.metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsApi(View):
+    """
+    Get the request metrics of this process. Scrapers send METRICS_TOKEN as a bearer
+    token, without one the endpoint is only served with DEBUG.
+    """
+
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Get the request metrics.
+        :param request: request
+        :return: Prometheus text of the metrics.
+        """
+        token = getattr(settings, "METRICS_TOKEN", "")
+        header = request.headers.get("Authorization", "")
+
+        if not token and not settings.DEBUG:
+            return HttpResponse(status=404)
+
+        if token and not hmac.compare_digest(header, f"Bearer {token}"):
+            return HttpResponse(status=401)
+
+        return HttpResponse(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
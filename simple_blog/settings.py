@@ -22,6 +22,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.environ.get("BLOG_SECRET_KEY", "")
 JWT_SIGNING_KEY = os.environ.get("BLOG_SIGNING_KEY", "")
 DB_ENCRYPTION_KEY = os.environ.get("BLOG_DB_ENCRYPTION_KEY", "")
+# Retired encryption keys, comma separated, still decrypt until rows are rotated
+DB_ENCRYPTION_OLD_KEYS = [
+    key for key in os.environ.get("BLOG_DB_ENCRYPTION_OLD_KEYS", "").split(",") if key
+]
 
 if not SECRET_KEY:
     raise KeyError(
@@ -50,6 +54,7 @@ INSTALLED_APPS = [
     "rest_framework",
     "rest_framework_simplejwt",
     "debug_toolbar",
+    "apps.common.apps.CommonConfig",
     "apps.account.apps.AccountConfig",
     "apps.authentication.apps.AuthenticationConfig",
     "apps.blog.apps.BlogConfig",
@@ -57,6 +62,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "apps.common.middleware.metrics_middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -68,9 +74,14 @@ MIDDLEWARE = [
     "whitenoise.middleware.WhiteNoiseMiddleware",
 ]
 
+# Per route request metrics, served at /metrics. Scrapers send the token as a bearer
+# token, without one the endpoint is only served with DEBUG
+METRICS_ENABLED = os.environ.get("BLOG_METRICS_ENABLED", "true").lower() == "true"
+METRICS_TOKEN = os.environ.get("BLOG_METRICS_TOKEN", "")
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.authentication.backends.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "EXCEPTION_HANDLER": "apps.common.utilities.exceptions.blog_exception_handler",
@@ -80,10 +91,70 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
+    "BLACKLIST_AFTER_ROTATION": True,
     "ALGORITHM": "HS512",
     "SIGNING_KEY": JWT_SIGNING_KEY,
 }
 
+# Verified tokens cached per process, until the token expires or the TTL in seconds
+AUTH_CACHE_SIZE = int(os.environ.get("BLOG_AUTH_CACHE_SIZE", "10000"))
+AUTH_CACHE_TTL = int(os.environ.get("BLOG_AUTH_CACHE_TTL", "300"))
+
+# Revoked refresh tokens, checked through a per process Bloom filter sized for the
+# capacity at the error rate. Revocations are synced from the skew in seconds before
+# the last sync, at least every interval in seconds. Refreshes always check the tables.
+REVOCATION_BLOOM_CAPACITY = int(os.environ.get("BLOG_REVOCATION_CAPACITY", "100000"))
+REVOCATION_BLOOM_ERROR_RATE = 0.001
+REVOCATION_SYNC_SKEW = 60
+REVOCATION_SYNC_INTERVAL = 30
+REVOCATION_PRUNE_BATCH_SIZE = 1000
+
+# Login password hashing pool, logins beyond the workers and queue get a fast 503
+LOGIN_HASH_WORKERS = int(os.environ.get("BLOG_LOGIN_HASH_WORKERS", "4"))
+LOGIN_HASH_QUEUE = int(os.environ.get("BLOG_LOGIN_HASH_QUEUE", "16"))
+LOGIN_RETRY_AFTER = 1
+
+# Pagination count strategy, one of "exact", "cached", or "estimated". Cached counts
+# need a shared cache, see CACHE_SHARED, counts are exact without one
+PAGINATION_COUNT_MODE = os.environ.get("BLOG_PAGINATION_COUNT_MODE", "exact")
+PAGINATION_COUNT_CACHE_TTL = int(os.environ.get("BLOG_PAGINATION_COUNT_TTL", "60"))
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = 10000
+
+# Api response JSON encoder, one of "stdlib", "orjson" (when installed), or "auto"
+JSON_ENCODER = os.environ.get("BLOG_JSON_ENCODER", "stdlib")
+# List pages with at least this many rows are streamed row by row
+JSON_STREAM_MIN_ROWS = int(os.environ.get("BLOG_JSON_STREAM_MIN_ROWS", "50"))
+
+# Bulk list endpoint writes, items accepted per request and rows per statement
+BULK_MAX_ITEMS = int(os.environ.get("BLOG_BULK_MAX_ITEMS", "5000"))
+BULK_BATCH_SIZE = 1000
+
+# Seconds a cached detail endpoint response is kept
+DETAIL_CACHE_TIMEOUT = int(os.environ.get("BLOG_DETAIL_CACHE_TIMEOUT", "300"))
+# Seconds the category tree is kept, it is replaced as soon as a category changes
+CATEGORY_TREE_TIMEOUT = 86400
+# Scheduled blog posts published per batch, and seconds between publish_scheduled runs
+# as a daemon
+PUBLISH_BATCH_SIZE = 100
+PUBLISH_INTERVAL = 30
+# Comment reply levels loaded below a comment, at most
+COMMENT_MAX_DEPTH = 50
+# Blog post slugs resolved per process, until a slug changes or the TTL in seconds
+SLUG_CACHE_SIZE = int(os.environ.get("BLOG_SLUG_CACHE_SIZE", "10000"))
+SLUG_CACHE_TTL = int(os.environ.get("BLOG_SLUG_CACHE_TTL", "3600"))
+
+# Home feeds, posts of accounts with fewer followers than the limit are written to
+# follower timelines, posts of others are merged in when feeds are read. Followed accounts
+# fill the timeline with their latest backfill size posts.
+FEED_FANOUT_LIMIT = int(os.environ.get("BLOG_FEED_FANOUT_LIMIT", "10000"))
+FEED_BACKFILL_SIZE = 50
+FEED_PULL_CACHE_TIMEOUT = 60
+
+# Write behind counters, flushed after the interval in seconds or once the limit of
+# pending rows is reached
+COUNTER_FLUSH_INTERVAL = float(os.environ.get("BLOG_COUNTER_FLUSH_INTERVAL", "5"))
+COUNTER_FLUSH_LIMIT = int(os.environ.get("BLOG_COUNTER_FLUSH_LIMIT", "1000"))
+
 ROOT_URLCONF = "simple_blog.urls"
 
 TEMPLATES = [
@@ -126,6 +197,30 @@ else:
         }
     }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+if os.environ.get("BLOG_REDIS_URL", ""):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("BLOG_REDIS_URL"),
+        }
+    }
+
+# Whether the cache is shared between processes. Caches checked against versions in
+# it, ie verified tokens, resolved slugs, detail responses, the category tree, and
+# cached pagination counts, are bypassed when it is not, and refreshes look up
+# revocations instead of trusting the revocation filter, unless the site runs as a
+# single development process
+CACHE_SHARED = bool(os.environ.get("BLOG_REDIS_URL", "")) or DEBUG
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -26,6 +26,7 @@ urlpatterns = [
     path("api/", include("apps.account.urls")),
     path("api/", include("apps.blog.urls")),
     path("api/", include("apps.comments.urls")),
+    path("", include("apps.common.urls")),
 ]
 
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)